@@ -16,47 +16,89 @@ Usage:
     This module is used to create a cache instance with a limited size.
 """
 
+from collections import OrderedDict
+from time import monotonic
+
 
 class Cache:
-    """Limited-size dictionary-like class to use for caches."""
+    """Limited-size dictionary-like class to use for caches.
+
+    Least recently used entries get evicted once the cache is full. If
+    `ttl` is given, entries expire in that many seconds after being set.
+
+    The `hits`, `misses` and `evictions` counters can be used to
+    monitor cache efficiency. Only lookups by index or by `get()`
+    count as hits and misses, membership tests do not.
+    """
 
-    def __init__(self, maxSize=256):
+    def __init__(self, maxSize=256, ttl=None):
         """Create cache instance."""
         self.__maxSize = maxSize
-        self.__size = 0
-        self.__chopSize = maxSize // 10
-        self.__chopSize = self.__chopSize and self.__chopSize or 1
-        self.__cache = {}
-        self.__usage = {}
+        self.__ttl = ttl
+        self.__cache = OrderedDict()
+        self.__expireAt = {}
+        self.hits = self.misses = self.evictions = 0
+
+    def __expired(self, k):
+        if self.__expireAt[k] > monotonic():
+            return False
+        del self.__cache[k]
+        del self.__expireAt[k]
+        return True
 
     def __contains__(self, k):
         """Check if key is in cache."""
-        return k in self.__cache
+        return k in self.__cache and (self.__ttl is None or not self.__expired(k))
 
     def __getitem__(self, k):
         """Get cache entry."""
-        self.__usage[k] += 1
-        return self.__cache[k]
+        cache = self.__cache
+        try:
+            v = cache[k]
+
+        except KeyError:
+            self.misses += 1
+            raise
+
+        if self.__ttl is not None and self.__expired(k):
+            self.misses += 1
+            raise KeyError(k)
+
+        cache.move_to_end(k)
+        self.hits += 1
+        return v
+
+    def get(self, k, default=None):
+        """Get cache entry or default if not cached."""
+        try:
+            return self[k]
+
+        except KeyError:
+            return default
 
     def __len__(self):
         """Return number of entries in cache."""
-        return self.__size
+        return len(self.__cache)
 
     def __setitem__(self, k, v):
         """Set cache entry."""
-        if self.__size >= self.__maxSize:
-            usageKeys = sorted(self.__usage, key=lambda x, d=self.__usage: d[x])
-            for _k in usageKeys[: self.__chopSize]:
-                del self.__cache[_k]
-                del self.__usage[_k]
-            self.__size -= self.__chopSize
-        if k not in self.__cache:
-            self.__size += 1
-            self.__usage[k] = 0
-        self.__cache[k] = v
+        cache = self.__cache
+        if k in cache:
+            cache.move_to_end(k)
+        elif cache and len(cache) >= self.__maxSize:
+            _k, _ = cache.popitem(last=False)
+            self.__expireAt.pop(_k, None)
+            self.evictions += 1
+        cache[k] = v
+        if self.__ttl is not None:
+            self.__expireAt[k] = monotonic() + self.__ttl
 
     def __delitem__(self, k):
         """Delete cache entry."""
         del self.__cache[k]
-        del self.__usage[k]
-        self.__size -= 1
+        self.__expireAt.pop(k, None)
+
+    def clear(self):
+        """Drop all cache entries."""
+        self.__cache.clear()
+        self.__expireAt.clear()
@@ -43,7 +43,7 @@ Attributes:
     loop (asyncio.AbstractEventLoop): The event loop instance.
 
 Methods:
-    __init__(sock=None, sockMap=None, loop=None):
+    __init__(sock=None, sockMap=None, loop=None, inline=False):
         Initializes the datagram protocol object for asyncio.
 
     datagram_received(datagram, transportAddress):
@@ -74,6 +74,7 @@ import asyncio
 import sys
 import traceback
 import warnings
+from collections import deque
 from socket import socket
 
 from pysnmp import debug
@@ -91,19 +92,31 @@ class DgramAsyncioProtocol(asyncio.DatagramProtocol, AbstractAsyncioTransport):
     loop: asyncio.AbstractEventLoop
 
     def __init__(
-        self, sock=None, sockMap=None, loop: "asyncio.AbstractEventLoop | None" = None
+        self,
+        sock=None,
+        sockMap=None,
+        loop: "asyncio.AbstractEventLoop | None" = None,
+        inline: bool = False,
     ):
-        """Create a datagram protocol object for asyncio."""
-        self._writeQ = []
+        """Create a datagram protocol object for asyncio.
+
+        With `inline` set, incoming datagrams are handed over to the
+        dispatcher right away rather than through a separate event loop
+        callback.
+        """
+        self._writeQ = deque()
         self._lport = None
         if loop is None:
             loop = asyncio.get_event_loop()
         self.loop = loop
+        self.__inline = inline
 
     def datagram_received(self, datagram, transportAddress: AbstractTransportAddress):
         """Process incoming datagram."""
         if self._callback_function is None:
             raise error.CarrierError("Unable to call cbFun")
+        elif self.__inline:
+            self._callback_function(self, transportAddress, datagram)
         else:
             self.loop.call_soon(
                 self._callback_function, self, transportAddress, datagram
@@ -114,7 +127,7 @@ class DgramAsyncioProtocol(asyncio.DatagramProtocol, AbstractAsyncioTransport):
         self.transport = transport
         debug.logger & debug.FLAG_IO and debug.logger("connection_made: invoked")
         while self._writeQ:
-            outgoingMessage, transportAddress = self._writeQ.pop(0)
+            outgoingMessage, transportAddress = self._writeQ.popleft()
             debug.logger & debug.FLAG_IO and debug.logger(
                 "connection_made: transportAddress %r outgoingMessage %s"
                 % (transportAddress, debug.hexdump(outgoingMessage))
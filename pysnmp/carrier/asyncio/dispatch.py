@@ -37,6 +37,7 @@ import asyncio
 import sys
 import traceback
 import warnings
+from heapq import heappop, heappush
 from time import time
 from typing import Tuple
 
@@ -45,7 +46,14 @@ from pysnmp.error import PySnmpError
 
 
 class AsyncioDispatcher(AbstractTransportDispatcher):
-    """AsyncioDispatcher based on asyncio event loop."""
+    """AsyncioDispatcher based on asyncio event loop.
+
+    With `exactTimers=True`, no periodic timer tick is run. Instead, timer
+    ticks are scheduled on the event loop at the exact times requested
+    through `request_timer_tick()`, and timer ticks count follows the
+    event loop clock. Timer callbacks registered with a call interval
+    other than timer resolution keep being called periodically.
+    """
 
     loop: asyncio.AbstractEventLoop
     __transport_count: int
@@ -63,6 +71,97 @@ class AsyncioDispatcher(AbstractTransportDispatcher):
             self.loop = kwargs.pop("loop")
         else:
             self.loop = asyncio.get_event_loop()
+        self.__exact_timers = kwargs.get("exactTimers", False)
+        self.__timer_epoch = None
+        self.__timer_ticks = 0.0
+        self.__timer_requests = []
+        self.__timer_handle = None
+        self.__timer_handle_ticks = None
+
+    def get_timer_ticks(self):
+        """Return the number of timer ticks."""
+        if not self.__exact_timers:
+            return super().get_timer_ticks()
+
+        if self.__timer_epoch is None:
+            self.__timer_epoch = self.loop.time()
+
+        timerTicks = (
+            self.loop.time() - self.__timer_epoch
+        ) / self.get_timer_resolution()
+
+        # Event loop may run callbacks a bit ahead of schedule
+        if timerTicks > self.__timer_ticks:
+            self.__timer_ticks = timerTicks
+
+        return self.__timer_ticks
+
+    def request_timer_tick(self, timerTicks: float):
+        """Ask for a timer tick once timer ticks count reaches `timerTicks`."""
+        if self.__exact_timers:
+            heappush(self.__timer_requests, timerTicks)
+            self.__schedule_timer_tick()
+
+    def register_timer_callback(self, timerCbFun, tickInterval=None):
+        """Register a timer callback."""
+        super().register_timer_callback(timerCbFun, tickInterval)
+        if self.__exact_timers:
+            self.__schedule_timer_tick()
+
+    def __schedule_timer_tick(self):
+        timerTicks = self.get_timer_ticks()
+
+        nextTicks = self.__timer_requests[0] if self.__timer_requests else None
+
+        nextCall = self.get_next_timer_call()
+        if nextCall is not None:
+            callTicks = timerTicks + max(
+                0, (nextCall - time()) / self.get_timer_resolution()
+            )
+            if nextTicks is None or callTicks < nextTicks:
+                nextTicks = callTicks
+
+        if nextTicks is None or nextTicks == self.__timer_handle_ticks:
+            return
+
+        if self.__timer_handle is not None:
+            if self.__timer_handle_ticks < nextTicks:
+                return  # already armed for an earlier tick
+
+            self.__timer_handle.cancel()
+
+        self.__timer_handle = self.loop.call_at(
+            self.__timer_epoch + nextTicks * self.get_timer_resolution(),
+            self.__handle_requested_timer_tick,
+            nextTicks,
+        )
+        self.__timer_handle_ticks = nextTicks
+
+    def __handle_requested_timer_tick(self, timerTicks):
+        self.__timer_handle = self.__timer_handle_ticks = None
+
+        if timerTicks > self.__timer_ticks:
+            self.__timer_ticks = timerTicks
+
+        # Serve requests falling due within a fraction of a tick at once
+        horizon = self.get_timer_ticks() + 0.05
+
+        while self.__timer_requests and self.__timer_requests[0] <= horizon:
+            timerTicks = heappop(self.__timer_requests)
+            if timerTicks > self.__timer_ticks:
+                self.__timer_ticks = timerTicks
+
+        try:
+            self.handle_requested_timer_tick(time())
+
+        finally:
+            self.__schedule_timer_tick()
+
+    def _cancel_timer_handle(self):
+        if self.__timer_handle is not None:
+            self.__timer_handle.cancel()
+            self.__timer_handle = self.__timer_handle_ticks = None
+        self.__timer_requests = []
 
     async def handle_timeout(self):
         """Handle timeout event with proper error handling."""
@@ -105,6 +204,7 @@ class AsyncioDispatcher(AbstractTransportDispatcher):
         super().close_dispatcher()
         self.__transport_count = 0
         self._cancel_loopingcall()
+        self._cancel_timer_handle()
         if self.__run_dispatcher_started_loop and self.loop.is_running():
             try:
                 if asyncio.current_task(self.loop) is None:
@@ -116,7 +216,11 @@ class AsyncioDispatcher(AbstractTransportDispatcher):
         self, tDomain: Tuple[int, ...], transport: AbstractTransport
     ):
         """Register transport associated with given transport domain."""
-        if self.loopingcall is None and self.get_timer_resolution() > 0:
+        if (
+            self.loopingcall is None
+            and not self.__exact_timers
+            and self.get_timer_resolution() > 0
+        ):
             self.loopingcall = asyncio.ensure_future(
                 self.handle_timeout(), loop=self.loop
             )
@@ -144,6 +248,7 @@ class AsyncioDispatcher(AbstractTransportDispatcher):
 
     def __del__(self):
         self._cancel_loopingcall()
+        self._cancel_timer_handle()
 
     # compatibility with legacy code
     # Old to new attribute mapping
@@ -27,8 +27,12 @@ class TimerCallable:
     def __call__(self, timeNow: float):
         """Call the callback function if the time is right."""
         if self.__next_call <= timeNow:
-            self.__callback(timeNow)
-            self.__next_call = timeNow + self.interval
+            self.fire(timeNow)
+
+    def fire(self, timeNow: float):
+        """Call the callback function regardless of the call interval."""
+        self.__callback(timeNow)
+        self.__next_call = timeNow + self.interval
 
     def __eq__(self, cbFun: Callable):
         """Return True if the callback function is the same."""
@@ -38,6 +42,11 @@ class TimerCallable:
         """Return True if the callback function is not the same."""
         return self.__callback != cbFun
 
+    @property
+    def next_call(self):
+        """Return the time of the next call."""
+        return self.__next_call
+
     @property
     def interval(self):
         """Return the call interval."""
@@ -294,6 +303,39 @@ class AbstractTransportDispatcher:
         for timerCallable in self.__timer_callables:
             timerCallable(timeNow)
 
+    def request_timer_tick(self, timerTicks: float):
+        """Ask for a timer tick once timer ticks count reaches `timerTicks`.
+
+        Periodic timer ticks always satisfy such requests, dispatchers
+        running timers on demand should override this method.
+        """
+
+    def handle_requested_timer_tick(self, timeNow: float):
+        """Handle timer tick asked for with `request_timer_tick`.
+
+        Timer callbacks running at timer resolution are called right away,
+        others still wait for their call interval to pass.
+        """
+        for timerCallable in self.__timer_callables:
+            if timerCallable.interval == self.__timer_resolution:
+                timerCallable.fire(timeNow)
+            else:
+                timerCallable(timeNow)
+
+    def get_next_timer_call(self):
+        """Return the time of the next call to a timer callback.
+
+        Timer callbacks running at timer resolution are only called
+        on request, so they are not taken into account.
+        """
+        nextCalls = [
+            timerCallable.next_call
+            for timerCallable in self.__timer_callables
+            if timerCallable.interval != self.__timer_resolution
+        ]
+        if nextCalls:
+            return min(nextCalls)
+
     def job_started(self, jobId, count: int = 1):
         """Mark a job as started."""
         if jobId in self.__jobs:
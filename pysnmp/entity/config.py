@@ -5,7 +5,7 @@
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
 import warnings
-
+from hashlib import md5, sha1
 
 from pysnmp import debug, error
 from pysnmp.carrier.asyncio.dgram import udp, udp6
@@ -13,6 +13,7 @@ from pysnmp.carrier.base import AbstractTransport
 from pysnmp.entity.engine import SnmpEngine
 from pysnmp.proto import rfc1902, rfc1905
 from pysnmp.proto.secmod.eso.priv import aes192, aes256, des3
+from pysnmp.proto.secmod.rfc3414 import localkey
 from pysnmp.proto.secmod.rfc3414.auth import hmacmd5, hmacsha, noauth
 from pysnmp.proto.secmod.rfc3414.priv import des, nopriv
 from pysnmp.proto.secmod.rfc3414.service import SnmpUSMSecurityModel
@@ -382,6 +383,61 @@ def add_v3_user(
     )
 
 
+def hash_v3_user_keys(users, executor=None):
+    """Convert pass phrases of many SNMPv3 users into master keys at once.
+
+    The `users` is a sequence of `(authProtocol, authKey, privProtocol,
+    privKey)` tuples holding pass phrases, as they would be passed to
+    `add_v3_user`. Returns a list of `(masterAuthKey, masterPrivKey)`
+    tuples to register users with `USM_KEY_TYPE_MASTER` key types.
+
+    Key derivation can be spread over a process pool `executor`, derived
+    keys are also put into the `localkey` key cache.
+    """
+    hashFunctions = {
+        USM_AUTH_HMAC96_MD5: md5,
+        USM_AUTH_HMAC96_SHA: sha1,
+    }
+    hashFunctions.update(hmacsha2.HmacSha2.HASH_ALGORITHM)
+
+    passphrases = {}
+
+    for authProtocol, authKey, privProtocol, privKey in users:
+        if authProtocol not in AUTH_SERVICES:
+            raise error.PySnmpError(f"Unknown auth protocol {authProtocol}")
+
+        if privProtocol not in PRIV_SERVICES:
+            raise error.PySnmpError(f"Unknown privacy protocol {privProtocol}")
+
+        if authProtocol in hashFunctions:
+            hashFunc = hashFunctions[authProtocol]
+            keys = passphrases.setdefault(hashFunc, {})
+            keys[rfc1902.OctetString(authKey or b"").asOctets()] = None
+            if privProtocol != USM_PRIV_NONE:
+                keys[rfc1902.OctetString(privKey or b"").asOctets()] = None
+
+    for hashFunc, keys in passphrases.items():
+        for passphrase, masterKey in zip(
+            list(keys), localkey.hash_passphrases(keys, hashFunc, executor)
+        ):
+            keys[passphrase] = masterKey
+
+    masterKeys = []
+
+    for authProtocol, authKey, privProtocol, privKey in users:
+        masterAuthKey = masterPrivKey = None
+
+        if authProtocol in hashFunctions:
+            keys = passphrases[hashFunctions[authProtocol]]
+            masterAuthKey = keys[rfc1902.OctetString(authKey or b"").asOctets()]
+            if privProtocol != USM_PRIV_NONE:
+                masterPrivKey = keys[rfc1902.OctetString(privKey or b"").asOctets()]
+
+        masterKeys.append((masterAuthKey, masterPrivKey))
+
+    return masterKeys
+
+
 def delete_v3_user(
     snmpEngine: SnmpEngine,
     userName,
@@ -7,11 +7,11 @@
 import sys
 
 from pyasn1.type import univ
-from pysnmp import debug, error, nextid
+from pysnmp import cache, debug, error, nextid
 from pysnmp.entity.engine import SnmpEngine
 from pysnmp.entity.rfc3413 import config
 from pysnmp.proto import errind
-from pysnmp.proto.api import v2c
+from pysnmp.proto.api import msgenc, v2c
 from pysnmp.proto.error import StatusInformation
 from pysnmp.proto.proxy import rfc2576
 
@@ -24,9 +24,18 @@ class CommandGenerator:
     _null = univ.Null("")
 
     def __init__(self, **options):
-        """Create a command generator object."""
+        """Create a command generator object.
+
+        The `varBindsTemplates` option turns on pre-encoding of up to
+        that many var-bind lists of requests. Repeated requests for the
+        same OIDs then reuse them, with only the message envelope getting
+        encoded per send.
+        """
         self.__options = options
         self.__pendingReqs = {}
+        self.__varBindsTemplates = None
+        if options.get("varBindsTemplates"):
+            self.__varBindsTemplates = cache.Cache(options["varBindsTemplates"])
 
     def process_response_pdu(
         self,
@@ -191,6 +200,49 @@ class CommandGenerator:
 
         cbFun(snmpEngine, origSendRequestHandle, None, PDU, cbCtx)
 
+    def _set_varbinds(self, reqPDU, varBinds):
+        """Set var-binds of a request PDU, possibly from a template."""
+        templates = self.__varBindsTemplates
+
+        if templates is not None:
+            varBinds = tuple(varBinds)
+
+            # only value-less var-bind lists are encoded the same every time
+            key = tuple(
+                oid
+                for oid, val in varBinds
+                if val is None
+                or isinstance(val, univ.Null)
+                and val.tagSet == self._null.tagSet
+            )
+
+            if len(key) == len(varBinds):
+                try:
+                    varBindList = templates[key]
+
+                except KeyError:
+                    v2c.apiPDU.set_varbinds(reqPDU, varBinds)
+                    templates[key] = msgenc.freeze(reqPDU.getComponentByPosition(3))
+
+                except TypeError:
+                    debug.logger & debug.FLAG_APP and debug.logger(
+                        "setVarBinds: unhashable OIDs, template not used"
+                    )
+                    v2c.apiPDU.set_varbinds(reqPDU, varBinds)
+
+                else:
+                    reqPDU.setComponentByPosition(
+                        3,
+                        varBindList,
+                        verifyConstraints=False,
+                        matchTags=False,
+                        matchConstraints=False,
+                    )
+
+                return
+
+        v2c.apiPDU.set_varbinds(reqPDU, varBinds)
+
     def send_pdu(
         self,
         snmpEngine: SnmpEngine,
@@ -321,7 +373,7 @@ class GetCommandGenerator(CommandGenerator):
         reqPDU = v2c.GetRequestPDU()
         v2c.apiPDU.set_defaults(reqPDU)
 
-        v2c.apiPDU.set_varbinds(reqPDU, varBinds)
+        self._set_varbinds(reqPDU, varBinds)
 
         return self.send_pdu(
             snmpEngine,
@@ -413,7 +465,7 @@ class NextCommandGeneratorSingleRun(CommandGenerator):
         reqPDU = v2c.GetNextRequestPDU()
         v2c.apiPDU.set_defaults(reqPDU)
 
-        v2c.apiPDU.set_varbinds(reqPDU, varBinds)
+        self._set_varbinds(reqPDU, varBinds)
 
         return self.send_pdu(
             snmpEngine,
@@ -512,7 +564,7 @@ class BulkCommandGeneratorSingleRun(CommandGenerator):
         v2c.apiBulkPDU.set_non_repeaters(reqPDU, nonRepeaters)
         v2c.apiBulkPDU.set_max_repetitions(reqPDU, maxRepetitions)
 
-        v2c.apiBulkPDU.set_varbinds(reqPDU, varBinds)
+        self._set_varbinds(reqPDU, varBinds)
 
         return self.send_pdu(
             snmpEngine,
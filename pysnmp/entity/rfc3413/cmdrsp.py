@@ -10,7 +10,7 @@ from pysnmp import debug
 from pysnmp.entity.engine import SnmpEngine
 from pysnmp.entity.rfc3413.context import SnmpContext
 from pysnmp.proto import errind, error, rfc1902, rfc1905, rfc3411
-from pysnmp.proto.api import v2c  # backend is always SMIv2 compliant
+from pysnmp.proto.api import msgenc, v2c  # backend is always SMIv2 compliant
 from pysnmp.proto.proxy import rfc2576
 from pysnmp.smi import error as smi_error
 
@@ -139,13 +139,17 @@ class CommandResponderBase:
             (snmpSilentDrops,) = snmpEngine.get_mib_builder().import_symbols(  # type: ignore
                 "__SNMPv2-MIB", "snmpSilentDrops"
             )
-            snmpSilentDrops.syntax += 1
+            snmpSilentDrops.count += 1
 
     _get_request_type = rfc1905.GetRequestPDU.tagSet
     _next_request_type = rfc1905.GetNextRequestPDU.tagSet
     _set_request_type = rfc1905.SetRequestPDU.tagSet
     _counter64_type = rfc1902.Counter64.tagSet
 
+    def get_max_response_size(self, stateReference):
+        """Return maximum size of response scoped PDU."""
+        return self.__pendingReqs[stateReference][9]
+
     def release_state_information(self, stateReference):
         """Release state information."""
         if stateReference in self.__pendingReqs:
@@ -255,12 +259,12 @@ class CommandResponderBase:
         self.release_state_information(stateReference)
 
     @classmethod
-    def verify_access(cls, viewType, varBind, **context) -> "bool | None":
-        """Verify access rights for a single OID-value pair."""
-        name, val = varBind
-
-        snmpEngine: SnmpEngine = context["snmpEngine"]
+    def get_access_context(cls, snmpEngine: SnmpEngine, viewType=None, varBinds=()):
+        """Prepare access control context for the PDU being processed.
 
+        Memoizes request security parameters for :py:meth:`verify_access`
+        and authorizes `viewType` access to `varBinds` all at once.
+        """
         execCtx = snmpEngine.observer.get_execution_context(
             "rfc3412.receiveMessage:request"
         )
@@ -272,16 +276,79 @@ class CommandResponderBase:
             execCtx["pdu"].getTagSet(),
         )
 
-        try:
-            snmpEngine.access_control_model[cls.ACM_ID].is_access_allowed(
-                snmpEngine,
+        acCtx = {
+            "execCtx": (
                 securityModel,
                 securityName,
                 securityLevel,
-                viewType,
                 contextName,
-                name,
+                pduType,
             )
+        }
+
+        if varBinds:
+            names = [name for name, val in varBinds]
+
+            try:
+                accessAllowed = snmpEngine.access_control_model[
+                    cls.ACM_ID
+                ].are_access_allowed(
+                    snmpEngine,
+                    securityModel,
+                    securityName,
+                    securityLevel,
+                    viewType,
+                    contextName,
+                    names,
+                )
+
+            # leave it to verify_access() to report per var-bind
+            except error.StatusInformation:
+                pass
+
+            else:
+                acCtx.update(
+                    ((viewType, name), allowed)
+                    for name, allowed in zip(names, accessAllowed)
+                )
+
+        return acCtx
+
+    @classmethod
+    def verify_access(cls, viewType, varBind, **context) -> "bool | None":
+        """Verify access rights for a single OID-value pair."""
+        name, val = varBind
+
+        snmpEngine: SnmpEngine = context["snmpEngine"]
+
+        acCtx = context.get("acCtx")
+        if acCtx is None:
+            acCtx = cls.get_access_context(snmpEngine)
+
+        (securityModel, securityName, securityLevel, contextName, pduType) = acCtx[
+            "execCtx"
+        ]
+
+        try:
+            accessAllowed = acCtx[viewType, name]
+
+        except KeyError:
+            accessAllowed = None
+
+        try:
+            if accessAllowed is None:
+                snmpEngine.access_control_model[cls.ACM_ID].is_access_allowed(
+                    snmpEngine,
+                    securityModel,
+                    securityName,
+                    securityLevel,
+                    viewType,
+                    contextName,
+                    name,
+                )
+
+            elif not accessAllowed:
+                raise error.StatusInformation(errorIndication=errind.notInView)
 
         # Map ACM errors onto SMI ones
         except error.StatusInformation:
@@ -305,7 +372,7 @@ class CommandResponderBase:
                 (snmpUnknownContexts,) = snmpEngine.get_mib_builder().import_symbols(
                     "__SNMP-TARGET-MIB", "snmpUnknownContexts"
                 )
-                snmpUnknownContexts.syntax += 1
+                snmpUnknownContexts.count += 1
                 # Request REPORT generation
                 raise smi_error.GenError(
                     name=name,
@@ -346,7 +413,10 @@ class GetCommandResponder(CommandResponderBase):
         varBinds = v2c.apiPDU.get_varbinds(PDU)
 
         context = dict(
-            snmpEngine=snmpEngine, acFun=self.verify_access, cbCtx=self.cbCtx
+            snmpEngine=snmpEngine,
+            acFun=self.verify_access,
+            acCtx=self.get_access_context(snmpEngine, "read", varBinds),
+            cbCtx=self.cbCtx,
         )
 
         rspVarBinds = mgmtFun(*varBinds, **context)
@@ -371,7 +441,10 @@ class NextCommandResponder(CommandResponderBase):
         varBinds = v2c.apiPDU.get_varbinds(PDU)
 
         context = dict(
-            snmpEngine=snmpEngine, acFun=self.verify_access, cbCtx=self.cbCtx
+            snmpEngine=snmpEngine,
+            acFun=self.verify_access,
+            acCtx=self.get_access_context(snmpEngine),
+            cbCtx=self.cbCtx,
         )
 
         while True:
@@ -393,7 +466,8 @@ class BulkCommandResponder(CommandResponderBase):
     """SNMP GETBULK command responder."""
 
     SUPPORTED_PDU_TYPES = (rfc1905.GetBulkRequestPDU.tagSet,)
-    max_varbinds = 64
+    # optional cap on response var-binds, otherwise size-bound
+    max_varbinds = None
 
     # rfc1905: 4.2.3
     def handle_management_operation(
@@ -414,36 +488,63 @@ class BulkCommandResponder(CommandResponderBase):
         M = int(maxRepetitions)
         R = max(len(reqVarBinds) - N, 0)
 
-        if R:
+        if R and self.max_varbinds is not None:
             M = min(M, self.max_varbinds // R)
 
         debug.logger & debug.FLAG_APP and debug.logger(
             "handleMgmtOperation: N %d, M %d, R %d" % (N, M, R)
         )
 
-        mgmtFun = self.snmpContext.get_mib_instrum(contextName).read_next_variables
+        mgmtFun = self.snmpContext.get_mib_instrum(contextName).read_bulk_variables
 
-        context = dict(
-            snmpEngine=snmpEngine, acFun=self.verify_access, cbCtx=self.cbCtx
-        )
+        maxSize = self.get_max_response_size(stateReference)
 
-        if N:
-            # TODO(etingof): manage all PDU var-binds in a single call
-            rspVarBinds = mgmtFun(*reqVarBinds[:N], **context)
+        # scoped PDU contents less response PDU
+        headerSize = msgenc.get_encoded_size(
+            len(self.snmpContext.contextEngineId)
+        ) + msgenc.get_encoded_size(len(contextName))
 
-        else:
-            rspVarBinds = []
+        varBindsSize = 0
+
+        # rfc1905: 4.2.3 - fill response up to maximum message size
+        def budgetFun(varBind):
+            nonlocal varBindsSize
+
+            size = varBindsSize + len(msgenc.encode_var_bind(*varBind))
+
+            # request-id, error-status and error-index take up to 12 octets
+            pduSize = msgenc.get_encoded_size(12 + msgenc.get_encoded_size(size))
 
-        varBinds = reqVarBinds[-R:]
+            if msgenc.get_encoded_size(headerSize + pduSize) > maxSize:
+                return False
 
-        while M and R:
-            rspVarBinds.extend(mgmtFun(*varBinds, **context))
-            varBinds = rspVarBinds[-R:]
-            M -= 1
+            varBindsSize = size
+            return True
+
+        # Let repetitions resume MIB traversal from where previous ones ended
+        rspVarBinds = mgmtFun(
+            N,
+            M,
+            *reqVarBinds,
+            snmpEngine=snmpEngine,
+            acFun=self.verify_access,
+            acCtx=self.get_access_context(snmpEngine),
+            cbCtx=self.cbCtx,
+            cursor={},
+            budgetFun=budgetFun,
+        )
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            "handleMgmtOperation: %d var-binds of %d octets out of %d"
+            % (len(rspVarBinds), varBindsSize, maxSize)
+        )
 
         if len(rspVarBinds):
             self.send_varbinds(snmpEngine, stateReference, 0, 0, rspVarBinds)
             self.release_state_information(stateReference)
+        elif reqVarBinds and (N or M):
+            # not even a single var-bind fits
+            raise smi_error.TooBigError()
         else:
             raise smi_error.SmiError()
 
@@ -465,7 +566,10 @@ class SetCommandResponder(CommandResponderBase):
         instrumError = None
 
         context = dict(
-            snmpEngine=snmpEngine, acFun=self.verify_access, cbCtx=self.cbCtx
+            snmpEngine=snmpEngine,
+            acFun=self.verify_access,
+            acCtx=self.get_access_context(snmpEngine, "write", varBinds),
+            cbCtx=self.cbCtx,
         )
 
         # rfc1905: 4.2.5.1-13
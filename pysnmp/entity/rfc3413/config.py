@@ -12,6 +12,36 @@ from pysnmp.error import PySnmpError
 from pysnmp.smi.error import NoSuchInstanceError, SmiError
 
 
+def _get_row_cache(snmpEngine: SnmpEngine, cacheId, *mibRows):
+    """Return a cache of table rows dropping entries as the rows change."""
+    cache: "dict[str, Any] | None" = snmpEngine.get_user_context(cacheId)
+    # MIB rows get replaced if MIB modules are reloaded
+    if cache is None or any(x is not y for x, y in zip(cache["mibRows"], mibRows)):
+        instIdToInfoMap: "dict[tuple[int, ...], Any]" = {}
+
+        def invalidate(instId):
+            if instId is None:
+                instIdToInfoMap.clear()
+            else:
+                instIdToInfoMap.pop(instId, None)
+
+        if cache is not None:
+            for mibRow in cache["mibRows"]:
+                mibRow.unregisterRowObserver(cache["invalidate"])
+
+        for mibRow in mibRows:
+            mibRow.registerRowObserver(invalidate)
+
+        cache = {
+            "mibRows": mibRows,
+            "invalidate": invalidate,
+            "instIdToInfoMap": instIdToInfoMap,
+        }
+        snmpEngine.set_user_context(**{cacheId: cache})
+
+    return cache["instIdToInfoMap"]
+
+
 def get_target_address(snmpEngine: SnmpEngine, snmpTargetAddrName):
     """Return transport endpoint information for a given target."""
     mibBuilder = snmpEngine.get_mib_builder()
@@ -19,18 +49,17 @@ def get_target_address(snmpEngine: SnmpEngine, snmpTargetAddrName):
     (snmpTargetAddrEntry,) = mibBuilder.import_symbols(  # type: ignore
         "SNMP-TARGET-MIB", "snmpTargetAddrEntry"
     )
+    (snmpSourceAddrEntry,) = mibBuilder.import_symbols(  # type: ignore
+        "PYSNMP-SOURCE-MIB", "snmpSourceAddrEntry"
+    )
 
-    cache: "dict[str, Any] | None" = snmpEngine.get_user_context("getTargetAddr")
-    if cache is None:
-        cache = {"id": -1}
-        snmpEngine.set_user_context(getTargetAddr=cache)
-
-    if cache["id"] != snmpTargetAddrEntry.branchVersionId:
-        cache["nameToTargetMap"] = {}
+    targetMap = _get_row_cache(
+        snmpEngine, "getTargetAddr", snmpTargetAddrEntry, snmpSourceAddrEntry
+    )
 
-    nameToTargetMap = cache["nameToTargetMap"]
+    tblIdx = snmpTargetAddrEntry.getInstIdFromIndices(snmpTargetAddrName)
 
-    if snmpTargetAddrName not in nameToTargetMap:
+    if tblIdx not in targetMap:
         (
             snmpTargetAddrTDomain,
             snmpTargetAddrTAddress,
@@ -47,8 +76,6 @@ def get_target_address(snmpEngine: SnmpEngine, snmpTargetAddrName):
         )
         (snmpSourceAddrTAddress,) = mibBuilder.import_symbols("PYSNMP-SOURCE-MIB", "snmpSourceAddrTAddress")  # type: ignore
 
-        tblIdx = snmpTargetAddrEntry.getInstIdFromIndices(snmpTargetAddrName)
-
         try:
             snmpTargetAddrTDomain = snmpTargetAddrTDomain.getNode(
                 snmpTargetAddrTDomain.name + tblIdx
@@ -103,7 +130,7 @@ def get_target_address(snmpEngine: SnmpEngine, snmpTargetAddrName):
                     TransportAddressIPv6z(snmpTargetAddrTAddress)
                     ).set_local_address(TransportAddressIPv6z(snmpSourceAddrTAddress))
 
-        nameToTargetMap[snmpTargetAddrName] = (
+        targetMap[tblIdx] = (
             snmpTargetAddrTDomain,
             addr,
             snmpTargetAddrTimeout,
@@ -111,9 +138,7 @@ def get_target_address(snmpEngine: SnmpEngine, snmpTargetAddrName):
             snmpTargetAddrParams,
         )
 
-        cache["id"] = snmpTargetAddrEntry.branchVersionId
-
-    return nameToTargetMap[snmpTargetAddrName]
+    return targetMap[tblIdx]
 
 
 def get_target_parameters(snmpEngine: SnmpEngine, paramsName):
@@ -124,17 +149,11 @@ def get_target_parameters(snmpEngine: SnmpEngine, paramsName):
         "SNMP-TARGET-MIB", "snmpTargetParamsEntry"
     )
 
-    cache: "dict[str, Any] | None" = snmpEngine.get_user_context("getTargetParams")
-    if cache is None:
-        cache = {"id": -1}
-        snmpEngine.set_user_context(getTargetParams=cache)
-
-    if cache["id"] != snmpTargetParamsEntry.branchVersionId:
-        cache["nameToParamsMap"] = {}
+    paramsMap = _get_row_cache(snmpEngine, "getTargetParams", snmpTargetParamsEntry)
 
-    nameToParamsMap = cache["nameToParamsMap"]
+    tblIdx = snmpTargetParamsEntry.getInstIdFromIndices(paramsName)
 
-    if paramsName not in nameToParamsMap:
+    if tblIdx not in paramsMap:
         (
             snmpTargetParamsMPModel,
             snmpTargetParamsSecurityModel,
@@ -148,8 +167,6 @@ def get_target_parameters(snmpEngine: SnmpEngine, paramsName):
             "snmpTargetParamsSecurityLevel",
         )
 
-        tblIdx = snmpTargetParamsEntry.getInstIdFromIndices(paramsName)
-
         try:
             snmpTargetParamsMPModel = snmpTargetParamsMPModel.getNode(
                 snmpTargetParamsMPModel.name + tblIdx
@@ -166,16 +183,14 @@ def get_target_parameters(snmpEngine: SnmpEngine, paramsName):
         except NoSuchInstanceError:
             raise SmiError("Parameters %s not configured at LCD" % paramsName)
 
-        nameToParamsMap[paramsName] = (
+        paramsMap[tblIdx] = (
             snmpTargetParamsMPModel,
             snmpTargetParamsSecurityModel,
             snmpTargetParamsSecurityName,
             snmpTargetParamsSecurityLevel,
         )
 
-        cache["id"] = snmpTargetParamsEntry.branchVersionId
-
-    return nameToParamsMap[paramsName]
+    return paramsMap[tblIdx]
 
 
 def get_target_info(snmpEngine: SnmpEngine, snmpTargetAddrName):
@@ -470,25 +470,30 @@ class NotificationOriginator:
                 )
             )
 
-            for varName, varVal in inputVarBinds:
-                if varName in (sysUpTime, snmpTrapOID):
-                    continue
-                try:
-                    snmpEngine.access_control_model[self.ACM_ID].is_access_allowed(
-                        snmpEngine,
-                        securityModel,
-                        securityName,
-                        securityLevel,
-                        "notify",
-                        contextName,
-                        varName,
-                    )
+            varNames = [
+                varName
+                for varName, varVal in inputVarBinds
+                if varName not in (sysUpTime, snmpTrapOID)
+            ]
 
-                    debug.logger & debug.FLAG_APP and debug.logger(
-                        f"sendVarBinds: ACL succeeded for OID {varName} securityName {securityName}"
-                    )
+            try:
+                accessAllowed = snmpEngine.access_control_model[
+                    self.ACM_ID
+                ].are_access_allowed(
+                    snmpEngine,
+                    securityModel,
+                    securityName,
+                    securityLevel,
+                    "notify",
+                    contextName,
+                    varNames,
+                )
+
+            except error.StatusInformation:
+                accessAllowed = [False] * len(varNames)
 
-                except error.StatusInformation:
+            for varName, allowed in zip(varNames, accessAllowed):
+                if not allowed:
                     debug.logger & debug.FLAG_APP and debug.logger(
                         "sendVarBinds: ACL denied access for OID {} securityName {}, droppping notification".format(
                             varName, securityName
@@ -496,6 +501,10 @@ class NotificationOriginator:
                     )
                     return
 
+            debug.logger & debug.FLAG_APP and debug.logger(
+                f"sendVarBinds: ACL succeeded for OIDs {varNames} securityName {securityName}"
+            )
+
             # 3.3.4
             if notifyType == 1:
                 pdu = v2c.SNMPv2TrapPDU()
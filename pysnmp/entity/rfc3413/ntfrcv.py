@@ -123,7 +123,7 @@ class NotificationReceiver:
                 (snmpSilentDrops,) = snmpEngine.get_mib_builder().import_symbols(
                     "__SNMPv2-MIB", "snmpSilentDrops"
                 )
-                snmpSilentDrops.syntax += 1
+                snmpSilentDrops.count += 1
 
         elif PDU.tagSet in rfc3411.UNCONFIRMED_CLASS_PDUS:
             pass
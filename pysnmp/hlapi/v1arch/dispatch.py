@@ -8,14 +8,13 @@ import warnings
 from time import time
 from typing import Any
 
-from pyasn1.codec.ber import decoder, encoder
 from pysnmp import debug
 from pysnmp.carrier.base import AbstractTransportDispatcher
 from pysnmp.entity.engine import SnmpEngine
 from pysnmp.hlapi.transport import AbstractTransportTarget
 from pysnmp.proto import api
 from pysnmp.proto import errind, error
-from pysnmp.proto.api import verdec
+from pysnmp.proto.api import msgdec, msgenc, verdec
 
 __all__ = []
 
@@ -103,7 +102,7 @@ class AbstractSnmpDispatcher:
         pMod.apiMessage.set_community(reqMsg, authData.communityName)
         pMod.apiMessage.set_pdu(reqMsg, reqPdu)
 
-        outgoingMsg = encoder.encode(reqMsg)
+        outgoingMsg = msgenc.encode(reqMsg)
 
         requestId = pMod.apiPDU.get_request_id(reqPdu)
 
@@ -116,6 +115,8 @@ class AbstractSnmpDispatcher:
             retries=0,
         )
 
+        self._request_timer_tick(transportTarget.timeout)
+
         self.transport_dispatcher.send_message(
             outgoingMsg,
             transportTarget.TRANSPORT_DOMAIN,
@@ -147,7 +148,7 @@ class AbstractSnmpDispatcher:
         pMod = api.PROTOCOL_MODULES[mpModel]
 
         while wholeMsg:
-            rspMsg, wholeMsg = decoder.decode(wholeMsg, asn1Spec=pMod.Message())
+            rspMsg, wholeMsg = msgdec.decode(wholeMsg, asn1Spec=pMod.Message())
             rspPdu = pMod.apiMessage.get_pdu(rspMsg)
 
             requestId = pMod.apiPDU.get_request_id(rspPdu)
@@ -168,9 +169,19 @@ class AbstractSnmpDispatcher:
 
         return wholeMsg
 
+    def _request_timer_tick(self, timeout):
+        self.transport_dispatcher.request_timer_tick(
+            self.transport_dispatcher.get_timer_ticks()
+            + timeout / self.transport_dispatcher.get_timer_resolution()
+        )
+
     def _timer_callback(self, timeNow):
         for requestId, stateInfo in tuple(self._pendingReqs.items()):
             if stateInfo["timestamp"] > timeNow:
+                timeout = stateInfo["timestamp"] - timeNow
+                # Timer tick clock may be slightly ahead of the wall clock
+                if timeout < self.transport_dispatcher.get_timer_resolution():
+                    self._request_timer_tick(timeout)
                 continue
 
             retries = stateInfo["retries"]
@@ -195,6 +206,8 @@ class AbstractSnmpDispatcher:
             stateInfo["retries"] += 1
             stateInfo["timestamp"] = timeNow + transportTarget.timeout
 
+            self._request_timer_tick(transportTarget.timeout)
+
             outgoingMsg = stateInfo["outgoingMsg"]
 
             self.transport_dispatcher.send_message(
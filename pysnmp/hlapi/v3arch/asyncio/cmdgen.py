@@ -47,7 +47,8 @@ from pysnmp.hlapi.v3arch.asyncio.transport import AbstractTransportTarget
 from pysnmp.proto import errind
 from pysnmp.proto.rfc1902 import Integer32, Null
 from pysnmp.proto.rfc1905 import EndOfMibView, endOfMibView
-from pysnmp.smi.rfc1902 import ObjectType
+from pysnmp.smi import error
+from pysnmp.smi.rfc1902 import ObjectIdentity, ObjectType
 
 
 __all__ = [
@@ -64,6 +65,269 @@ VB_PROCESSOR = varbinds.CommandGeneratorVarBinds()
 LCD = CommandGeneratorLcdConfigurator()
 is_end_of_mib = varbinds.is_end_of_mib
 
+PARALLEL_WALK_READ_AHEAD = 1024
+
+
+def _get_subtree_boundaries(snmpEngine: SnmpEngine, initialVar):
+    """Find OIDs to split MIB subtree walk at.
+
+    These are the accessible table columns defined in the loaded MIBs
+    under `initialVar`. Scalars are never split off as their single
+    instance is not worth a request of its own.
+    """
+    mibViewController = VB_PROCESSOR.get_mib_view_controller(snmpEngine.cache)
+    mibBuilder = mibViewController.mibBuilder
+
+    (MibTableColumn,) = mibBuilder.import_symbols("SNMPv2-SMI", "MibTableColumn")
+
+    rootOid = tuple(initialVar)
+
+    try:
+        oid, label, suffix = mibViewController.get_node_name(rootOid)
+
+    except error.SmiError:
+        return []
+
+    if suffix:
+        return []
+
+    boundaries: "list[tuple[int, ...]]" = []
+
+    while True:
+        try:
+            oid, label, suffix = mibViewController.get_next_node_name(oid)
+
+        except error.SmiError:
+            break
+
+        if tuple(oid)[: len(rootOid)] != rootOid:
+            break
+
+        try:
+            modName, symName, suffix = mibViewController.get_node_location(oid)
+            (mibNode,) = mibBuilder.import_symbols(modName, symName)
+
+        except error.SmiError:
+            continue
+
+        if (
+            isinstance(mibNode, MibTableColumn)
+            and mibNode.getMaxAccess() != "not-accessible"
+        ):
+            boundaries.append(tuple(oid))
+
+    return boundaries
+
+
+async def _walk_parallel(walk, boundaries, initialVar, repetitions, **options):
+    """Walk MIB subtree over a few OID ranges concurrently.
+
+    The walk starts over the whole subtree. Once its first response
+    shows that there is more to fetch, the rest of the subtree gets
+    split at `boundaries` into OID ranges and up to `maxParallelRequests`
+    of them are walked at once, each one reading ahead about
+    `PARALLEL_WALK_READ_AHEAD` var-binds at most.
+
+    Var-binds are put back in order and yielded by `repetitions`, with
+    `maxRows` and `maxCalls` applied the same way a sequential walk does.
+    """
+    lexicographicMode = options.get("lexicographicMode", True)
+    maxParallelRequests = options.get("maxParallelRequests", 1)
+    maxRows = options.get("maxRows", 0)
+    maxCalls = options.get("maxCalls", 0)
+
+    chunkSize = repetitions
+
+    if maxRows:
+        chunkSize = min(chunkSize, maxRows)
+
+    # Most var-binds a sequential walk would yield
+    maxVarBinds = 0
+
+    if maxRows or maxCalls:
+        size = chunkSize
+
+        for totalRows in range(min(x for x in (maxRows, maxCalls) if x)):
+            if maxRows:
+                size = min(size, maxRows - totalRows)
+
+            maxVarBinds += size
+
+    queueSize = max(1, PARALLEL_WALK_READ_AHEAD // repetitions)
+
+    ranges: "list[list]" = [[tuple(initialVar), None]]
+    queues = [asyncio.Queue(queueSize)]
+    tasks: "list[asyncio.Future]" = []
+    inFlight: "set[int]" = set()
+    stopped = False
+
+    def schedule(*args):
+        while (
+            not stopped
+            and len(tasks) < len(ranges)
+            and sum(not task.done() for task in tasks) < maxParallelRequests
+        ):
+            task = asyncio.ensure_future(fetch(len(tasks)))
+            task.add_done_callback(schedule)
+            tasks.append(task)
+
+    async def fetch(index):
+        queue = queues[index]
+        walker = walk(ObjectType(ObjectIdentity(ranges[index][0]), Null("")))
+        split = index == 0
+        totalVarBinds = 0
+
+        try:
+            while True:
+                # Only requests pending in the engine make the walk wait on stop
+                inFlight.add(index)
+
+                try:
+                    response = await walker.__anext__()
+
+                except StopAsyncIteration:
+                    break
+
+                finally:
+                    inFlight.discard(index)
+
+                if stopped:
+                    return
+
+                errorIndication, errorStatus, errorIndex, varBinds = response
+
+                if errorIndication or errorStatus:
+                    await queue.put(response)
+                    continue
+
+                if split:
+                    split = False
+
+                    lastOid = tuple(varBinds[-1][0])
+                    startOids = [oid for oid in boundaries if oid > lastOid]
+
+                    # Next request to this range would do
+                    if maxVarBinds and maxVarBinds - len(varBinds) <= repetitions:
+                        startOids = []
+
+                    if startOids:
+                        stopOids: "list[tuple[int, ...] | None]" = startOids[1:]
+                        stopOids.append(ranges[0][1])
+                        ranges[0][1] = startOids[0]
+                        ranges.extend([list(x) for x in zip(startOids, stopOids)])
+                        queues.extend(asyncio.Queue(queueSize) for _ in startOids)
+                        schedule()
+
+                stopOid = ranges[index][1]
+
+                for col, (name, val) in enumerate(varBinds):
+                    if (stopOid is not None and tuple(name) >= stopOid) or (
+                        not lexicographicMode and not initialVar.isPrefixOf(name)
+                    ):
+                        break
+                else:
+                    await queue.put(response)
+
+                    totalVarBinds += len(varBinds)
+
+                    # The walk can not use more of this range
+                    if maxVarBinds and totalVarBinds >= maxVarBinds:
+                        break
+
+                    continue
+
+                if col:
+                    await queue.put((
+                        errorIndication,
+                        errorStatus,
+                        errorIndex,
+                        varBinds[:col],
+                    ))
+                break
+
+        except Exception as exc:
+            if not stopped:
+                await queue.put(exc)
+
+        finally:
+            await walker.aclose()
+
+        if not stopped:
+            await queue.put(None)
+
+    async def read_ranges():
+        # the list of queues grows as the first range gets split
+        for queue in queues:
+            failed = False
+
+            while True:
+                response = await queue.get()
+
+                if response is None:
+                    break
+
+                if isinstance(response, Exception):
+                    raise response
+
+                failed = bool(response[0] or response[1])
+
+                yield response
+
+            # Walk over preceding range got aborted
+            if failed:
+                break
+
+        yield None
+
+    schedule()
+
+    totalRows = totalCalls = 0
+    pendingVarBinds: "list[ObjectType]" = []
+    responses = read_ranges()
+
+    try:
+        async for response in responses:
+            failed = response is not None and bool(response[0] or response[1])
+
+            if response is not None and not failed:
+                errorIndication, errorStatus, errorIndex, varBinds = response
+                pendingVarBinds.extend(varBinds)
+
+            while pendingVarBinds and (
+                response is None or failed or len(pendingVarBinds) >= chunkSize
+            ):
+                varBinds = tuple(pendingVarBinds[:chunkSize])
+                del pendingVarBinds[:chunkSize]
+
+                yield errorIndication, errorStatus, errorIndex, varBinds
+
+                totalRows += 1
+                totalCalls += 1
+
+                if maxRows and totalRows >= maxRows:
+                    return
+
+                if maxCalls and totalCalls >= maxCalls:
+                    return
+
+                if maxRows:
+                    chunkSize = min(chunkSize, maxRows - totalRows)
+
+            if failed:
+                yield response
+
+    finally:
+        stopped = True
+
+        await responses.aclose()
+
+        # Let requests already sent complete, then drop idle walks
+        for index, task in enumerate(tasks):
+            if index not in inFlight:
+                task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 
 async def get_cmd(
     snmpEngine: SnmpEngine,
@@ -673,6 +937,14 @@ async def walk_cmd(
               `maxRows` of SNMP conceptual table. Default is `0` (no limit).
             * `maxCalls` - stop iteration once this generator instance processed
               `maxCalls` responses. Default is 0 (no limit).
+            * `maxParallelRequests` - once the first response shows there
+              is more to walk, split the rest of the subtree at the table
+              columns known to the loaded MIBs and keep up to
+              `maxParallelRequests` requests in flight, one per subtree
+              part. Retrieved MIB variables are yielded in lexicographic
+              order and grouped into responses as a sequential walk
+              against the same agent would have them. Default is 1
+              (sequential walk).
 
     Yields
     ------
@@ -707,7 +979,8 @@ async def walk_cmd(
       response MIB variables leave the scope of `varBinds`
 
     At any moment a new sequence of `varBinds` could be send back into
-    running generator (supported since Python 2.6).
+    running generator (supported since Python 2.6), unless the walk runs
+    in parallel mode.
 
     Examples
     --------
@@ -732,6 +1005,31 @@ async def walk_cmd(
         x[0] for x in VB_PROCESSOR.make_varbinds(snmpEngine.cache, (varBind,))
     ]
 
+    if options.get("maxParallelRequests", 1) > 1:
+        boundaries = _get_subtree_boundaries(snmpEngine, initialVars[0])
+
+        if boundaries:
+            partOptions = dict(options, lexicographicMode=True, maxRows=0, maxCalls=0)
+            partOptions.pop("maxParallelRequests")
+
+            async for response in _walk_parallel(
+                lambda startVarBind: walk_cmd(
+                    snmpEngine,
+                    authData,
+                    transportTarget,
+                    contextData,
+                    startVarBind,
+                    **partOptions,
+                ),
+                boundaries,
+                initialVars[0],
+                1,
+                **options,
+            ):
+                yield response
+
+            return
+
     totalRows = totalCalls = 0
 
     while True:
@@ -875,6 +1173,14 @@ async def bulk_walk_cmd(
               `maxRows` of SNMP conceptual table. Default is `0` (no limit).
             * `maxCalls` - stop iteration once this generator instance processed
               `maxCalls` responses. Default is 0 (no limit).
+            * `maxParallelRequests` - once the first response shows there
+              is more to walk, split the rest of the subtree at the table
+              columns known to the loaded MIBs and keep up to
+              `maxParallelRequests` requests in flight, one per subtree
+              part. Retrieved MIB variables are yielded in lexicographic
+              order and grouped into responses as a sequential walk
+              against the same agent would have them. Default is 1
+              (sequential walk).
 
     Yields
     ------
@@ -909,7 +1215,8 @@ async def bulk_walk_cmd(
       response MIB variables leave the scope of `varBinds`
 
     At any moment a new sequence of `varBinds` could be send back into
-    running generator (supported since Python 2.6).
+    running generator (supported since Python 2.6), unless the walk runs
+    in parallel mode.
 
     Setting `maxRepetitions` value to 15..50 might significantly improve
     system performance, as many MIB variables get packed into a single
@@ -939,6 +1246,36 @@ async def bulk_walk_cmd(
         x[0] for x in VB_PROCESSOR.make_varbinds(snmpEngine.cache, (varBind,))
     ]
 
+    if options.get("maxParallelRequests", 1) > 1:
+        boundaries = _get_subtree_boundaries(snmpEngine, initialVars[0])
+
+        if boundaries:
+            if maxRows:
+                maxRepetitions = min(maxRepetitions, maxRows)
+
+            partOptions = dict(options, lexicographicMode=True, maxRows=0, maxCalls=0)
+            partOptions.pop("maxParallelRequests")
+
+            async for response in _walk_parallel(
+                lambda startVarBind: bulk_walk_cmd(
+                    snmpEngine,
+                    authData,
+                    transportTarget,
+                    contextData,
+                    nonRepeaters,
+                    maxRepetitions,
+                    startVarBind,
+                    **partOptions,
+                ),
+                boundaries,
+                initialVars[0],
+                nonRepeaters and 1 or maxRepetitions,
+                **options,
+            ):
+                yield response
+
+            return
+
     totalRows = totalCalls = 0
 
     varBinds: "tuple[ObjectType, ...]" = (varBind,)
@@ -24,14 +24,17 @@ class Vacm:
 
     def __init__(self):
         """Create a VACM instance."""
-        self._contextBranchId = -1
-        self._groupNameBranchId = -1
-        self._accessBranchId = -1
-        self._viewTreeBranchId = -1
+        self._mibRows = ()
+
+        # instance IDs of changed rows per table, None for any row
+        self._changedRows = ({None}, {None}, {None}, {None})
 
         self._contextMap = {}
         self._groupNameMap = {}
+        self._accessRows = {}
         self._accessMap = {}
+        self._viewNameMap = {}
+        self._viewTreeRows = {}
         self._viewTreeMap = {}
 
     def _add_access_entry(
@@ -142,6 +145,53 @@ class Vacm:
         rating, viewName = candidates[0]
         return viewName
 
+    @staticmethod
+    def _compile_view_tree(entries):
+        # OID prefix trie, masked sub-OIDs match any value
+        root = [{}, None]
+
+        for order, (subtree, ignoredSubOids, included) in enumerate(entries):
+            node = root
+
+            for idx, subOid in enumerate(subtree):
+                if idx in ignoredSubOids:
+                    subOid = None
+
+                children = node[0]
+
+                try:
+                    node = children[subOid]
+
+                except KeyError:
+                    node = children[subOid] = [{}, None]
+
+            # 3.2.5b: longest, then lexicographically greatest subtree wins
+            rating = len(subtree), subtree, order
+
+            if node[1] is None or node[1][0] < rating:
+                node[1] = rating, included
+
+        return root
+
+    @staticmethod
+    def _is_in_view(viewTree, variableName):
+        decision = None
+
+        nodes = [(viewTree, 0)]
+
+        while nodes:
+            (children, entry), idx = nodes.pop()
+
+            if entry is not None and (decision is None or decision[0] < entry[0]):
+                decision = entry
+
+            if idx < len(variableName):
+                for subOid in (variableName[idx], None):
+                    if subOid in children:
+                        nodes.append((children[subOid], idx + 1))
+
+        return decision is not None and decision[1]
+
     def is_access_allowed(
         self,
         snmpEngine: "SnmpEngine",
@@ -183,187 +233,359 @@ class Vacm:
             )
         )
 
-        # Rebuild contextName map if changed
-
-        (vacmContextName,) = snmpEngine.get_mib_builder().import_symbols(  # type: ignore
-            "SNMP-VIEW-BASED-ACM-MIB", "vacmContextName"
+        viewTree = self._get_view_tree(
+            snmpEngine,
+            securityModel,
+            securityName,
+            securityLevel,
+            viewType,
+            contextName,
         )
 
-        if self._contextBranchId != vacmContextName.branchVersionId:
-            self._contextMap.clear()
+        # 3.2.5a
+        if viewTree is None:
+            raise error.StatusInformation(errorIndication=errind.notInView)
 
-            nextMibNode = vacmContextName
+        # 3.2.5c
+        if not self._is_in_view(viewTree, variableName):
+            raise error.StatusInformation(errorIndication=errind.notInView)
 
-            while True:
-                try:
-                    nextMibNode = vacmContextName.getNextNode(nextMibNode.name)
+    def are_access_allowed(
+        self,
+        snmpEngine: "SnmpEngine",
+        securityModel,
+        securityName,
+        securityLevel,
+        viewType,
+        contextName,
+        variableNames,
+    ):
+        """Check if access is allowed to each of requested MIB variables.
 
-                except NoSuchInstanceError:
-                    break
+        Same as :py:meth:`is_access_allowed`, but for all variables of
+        a PDU at once.
 
-                self._contextMap[nextMibNode.syntax] = True
+        Args:
+            snmpEngine (SnmpEngine): SNMP engine.
+            securityModel (int): SNMP security model ID.
+            securityName (str): SNMP security name.
+            securityLevel (int): SNMP security level.
 
-            self._contextBranchId = vacmContextName.branchVersionId
+            viewType (str): SNMP view type ('read', 'write', 'notify').
+            contextName (str): SNMP context name.
+            variableNames (list): SNMP variable names.
 
-        # 3.2.1
-        if contextName not in self._contextMap:
-            raise error.StatusInformation(errorIndication=errind.noSuchContext)
+        Returns:
+            list: `True` for each variable in view, `False` otherwise.
 
-        # Rebuild groupName map if changed
+        Raises:
+            StatusInformation: If access is denied regardless of variables.
+        """
+        debug.logger & debug.FLAG_ACL and debug.logger(
+            "areAccessAllowed: securityModel %s, securityName %s, "
+            "securityLevel %s, viewType %s, contextName %s for "
+            "%d variables"
+            % (
+                securityModel,
+                securityName,
+                securityLevel,
+                viewType,
+                contextName,
+                len(variableNames),
+            )
+        )
 
-        (vacmGroupName,) = snmpEngine.get_mib_builder().import_symbols(  # type: ignore
-            "SNMP-VIEW-BASED-ACM-MIB", "vacmGroupName"
+        viewTree = self._get_view_tree(
+            snmpEngine,
+            securityModel,
+            securityName,
+            securityLevel,
+            viewType,
+            contextName,
         )
 
-        if self._groupNameBranchId != vacmGroupName.branchVersionId:
-            (vacmSecurityToGroupEntry,) = snmpEngine.get_mib_builder().import_symbols(  # type: ignore
-                "SNMP-VIEW-BASED-ACM-MIB", "vacmSecurityToGroupEntry"
-            )
+        # 3.2.5a
+        if viewTree is None:
+            return [False] * len(variableNames)
 
-            self._groupNameMap.clear()
+        # 3.2.5c
+        return [
+            self._is_in_view(viewTree, variableName) for variableName in variableNames
+        ]
 
-            nextMibNode = vacmGroupName
+    def _get_view_tree(
+        self,
+        snmpEngine: "SnmpEngine",
+        securityModel,
+        securityName,
+        securityLevel,
+        viewType,
+        contextName,
+    ):
+        self._sync_tables(snmpEngine)
 
-            while True:
-                try:
-                    nextMibNode = vacmGroupName.getNextNode(nextMibNode.name)
+        # 3.2.1
+        if contextName not in self._contextMap:
+            raise error.StatusInformation(errorIndication=errind.noSuchContext)
 
-                except NoSuchInstanceError:
-                    break
+        # 3.2.2
+        indices = securityModel, securityName
 
-                instId = nextMibNode.name[len(vacmGroupName.name) :]
+        try:
+            groupName = self._groupNameMap[indices]
 
-                indices = vacmSecurityToGroupEntry.getIndicesFromInstId(instId)
+        except KeyError:
+            raise error.StatusInformation(errorIndication=errind.noGroupName)
 
-                self._groupNameMap[indices] = nextMibNode.syntax
+        try:
+            viewNames = self._viewNameMap[groupName]
 
-            self._groupNameBranchId = vacmGroupName.branchVersionId
+        except KeyError:
+            viewNames = self._viewNameMap[groupName] = {}
 
-        # 3.2.2
-        indices = securityModel, securityName
+        indices = contextName, securityModel, securityLevel, viewType
 
         try:
-            groupName = self._groupNameMap[indices]
+            viewName = viewNames[indices]
 
         except KeyError:
-            raise error.StatusInformation(errorIndication=errind.noGroupName)
+            viewName = viewNames[indices] = self._get_family_view_name(
+                groupName, contextName, securityModel, securityLevel, viewType
+            )
+
+        return self._viewTreeMap.get(viewName)
 
-        # Rebuild access map if changed
+    def _sync_tables(self, snmpEngine: "SnmpEngine"):
+        mibBuilder = snmpEngine.get_mib_builder()
 
-        (vacmAccessStatus,) = snmpEngine.get_mib_builder().import_symbols(  # type: ignore
-            "SNMP-VIEW-BASED-ACM-MIB", "vacmAccessStatus"
+        mibRows = mibBuilder.import_symbols(  # type: ignore
+            "SNMP-VIEW-BASED-ACM-MIB",
+            "vacmContextEntry",
+            "vacmSecurityToGroupEntry",
+            "vacmAccessEntry",
+            "vacmViewTreeFamilyEntry",
         )
 
-        if self._accessBranchId != vacmAccessStatus.branchVersionId:
-            (
-                vacmAccessEntry,
-                vacmAccessContextPrefix,
-                vacmAccessSecurityModel,
-                vacmAccessSecurityLevel,
-                vacmAccessContextMatch,
-                vacmAccessReadViewName,
-                vacmAccessWriteViewName,
-                vacmAccessNotifyViewName,
-            ) = snmpEngine.get_mib_builder().import_symbols(  # type: ignore
-                "SNMP-VIEW-BASED-ACM-MIB",
-                "vacmAccessEntry",
-                "vacmAccessContextPrefix",
-                "vacmAccessSecurityModel",
-                "vacmAccessSecurityLevel",
-                "vacmAccessContextMatch",
-                "vacmAccessReadViewName",
-                "vacmAccessWriteViewName",
-                "vacmAccessNotifyViewName",
-            )
+        # MIB rows get replaced if MIB modules are reloaded
+        if not self._mibRows or any(x is not y for x, y in zip(self._mibRows, mibRows)):
+            for oldMibRow, mibRow, changedRows in zip(
+                self._mibRows or (None,) * len(mibRows), mibRows, self._changedRows
+            ):
+                if oldMibRow is mibRow:
+                    continue
 
-            self._accessMap.clear()
+                if oldMibRow is not None:
+                    oldMibRow.unregisterRowObserver(changedRows.add)
 
-            nextMibNode = vacmAccessStatus
+                mibRow.registerRowObserver(changedRows.add)
+                changedRows.add(None)
 
-            while True:
-                try:
-                    nextMibNode = vacmAccessStatus.getNextNode(nextMibNode.name)
+            self._mibRows = mibRows
 
-                except NoSuchInstanceError:
-                    break
+        for changedRows, syncFun in zip(
+            self._changedRows,
+            (
+                self._sync_context_map,
+                self._sync_group_name_map,
+                self._sync_access_map,
+                self._sync_view_tree_map,
+            ),
+        ):
+            if changedRows:
+                if None in changedRows:
+                    instIds = None
 
-                if nextMibNode.syntax != 1:  # active row
-                    continue
+                else:
+                    instIds = [tuple(instId) for instId in changedRows]
 
-                instId = nextMibNode.name[len(vacmAccessStatus.name) :]
-
-                indices = vacmAccessEntry.getIndicesFromInstId(instId)
-
-                vacmGroupName = indices[0]
-
-                self._add_access_entry(
-                    vacmGroupName,
-                    vacmAccessContextPrefix.getNode(
-                        vacmAccessContextPrefix.name + instId
-                    ).syntax,
-                    vacmAccessSecurityModel.getNode(
-                        vacmAccessSecurityModel.name + instId
-                    ).syntax,
-                    vacmAccessSecurityLevel.getNode(
-                        vacmAccessSecurityLevel.name + instId
-                    ).syntax,
-                    vacmAccessContextMatch.getNode(
-                        vacmAccessContextMatch.name + instId
-                    ).syntax,
-                    vacmAccessReadViewName.getNode(
-                        vacmAccessReadViewName.name + instId
-                    ).syntax,
-                    vacmAccessWriteViewName.getNode(
-                        vacmAccessWriteViewName.name + instId
-                    ).syntax,
-                    vacmAccessNotifyViewName.getNode(
-                        vacmAccessNotifyViewName.name + instId
-                    ).syntax,
+                changedRows.clear()
+
+                debug.logger & debug.FLAG_ACL and debug.logger(
+                    "syncTables: %s rows %s"
+                    % (syncFun.__name__, "all" if instIds is None else instIds)
                 )
 
-            self._accessBranchId = vacmAccessStatus.branchVersionId
+                syncFun(mibBuilder, instIds)
+
+    @staticmethod
+    def _get_inst_ids(mibColumn):
+        instIds = []
+
+        nextMibNode = mibColumn
+
+        while True:
+            try:
+                nextMibNode = mibColumn.getNextNode(nextMibNode.name)
+
+            except NoSuchInstanceError:
+                break
+
+            instIds.append(tuple(nextMibNode.name[len(mibColumn.name) :]))
+
+        return instIds
 
-        viewName = self._get_family_view_name(
-            groupName, contextName, securityModel, securityLevel, viewType
+    def _sync_context_map(self, mibBuilder, instIds):
+        (vacmContextEntry, vacmContextName) = mibBuilder.import_symbols(  # type: ignore
+            "SNMP-VIEW-BASED-ACM-MIB", "vacmContextEntry", "vacmContextName"
         )
 
-        # Rebuild family subtree map if changed
+        if instIds is None:
+            self._contextMap.clear()
+
+            instIds = self._get_inst_ids(vacmContextName)
 
-        (vacmViewTreeFamilyViewName,) = snmpEngine.get_mib_builder().import_symbols(  # type: ignore
-            "SNMP-VIEW-BASED-ACM-MIB", "vacmViewTreeFamilyViewName"
+        for instId in instIds:
+            (contextName,) = vacmContextEntry.getIndicesFromInstId(instId)
+
+            try:
+                vacmContextName.getNode(vacmContextName.name + instId)
+
+            except NoSuchInstanceError:
+                self._contextMap.pop(contextName, None)
+
+            else:
+                self._contextMap[contextName] = True
+
+    def _sync_group_name_map(self, mibBuilder, instIds):
+        (vacmSecurityToGroupEntry, vacmGroupName) = mibBuilder.import_symbols(  # type: ignore
+            "SNMP-VIEW-BASED-ACM-MIB", "vacmSecurityToGroupEntry", "vacmGroupName"
         )
 
-        if self._viewTreeBranchId != vacmViewTreeFamilyViewName.branchVersionId:
-            (
-                vacmViewTreeFamilySubtree,
-                vacmViewTreeFamilyMask,
-                vacmViewTreeFamilyType,
-            ) = snmpEngine.get_mib_builder().import_symbols(  # type: ignore
-                "SNMP-VIEW-BASED-ACM-MIB",
-                "vacmViewTreeFamilySubtree",
-                "vacmViewTreeFamilyMask",
-                "vacmViewTreeFamilyType",
-            )
+        if instIds is None:
+            self._groupNameMap.clear()
 
-            self._viewTreeMap.clear()
+            instIds = self._get_inst_ids(vacmGroupName)
 
-            powerOfTwo = [2**exp for exp in range(7, -1, -1)]
+        for instId in instIds:
+            indices = vacmSecurityToGroupEntry.getIndicesFromInstId(instId)
 
-            nextMibNode = vacmViewTreeFamilyViewName
+            try:
+                self._groupNameMap[indices] = vacmGroupName.getNode(
+                    vacmGroupName.name + instId
+                ).syntax
 
-            while True:
-                try:
-                    nextMibNode = vacmViewTreeFamilyViewName.getNextNode(
-                        nextMibNode.name
+            except NoSuchInstanceError:
+                self._groupNameMap.pop(indices, None)
+
+    def _sync_access_map(self, mibBuilder, instIds):
+        (
+            vacmAccessEntry,
+            vacmAccessContextPrefix,
+            vacmAccessSecurityModel,
+            vacmAccessSecurityLevel,
+            vacmAccessContextMatch,
+            vacmAccessReadViewName,
+            vacmAccessWriteViewName,
+            vacmAccessNotifyViewName,
+            vacmAccessStatus,
+        ) = mibBuilder.import_symbols(  # type: ignore
+            "SNMP-VIEW-BASED-ACM-MIB",
+            "vacmAccessEntry",
+            "vacmAccessContextPrefix",
+            "vacmAccessSecurityModel",
+            "vacmAccessSecurityLevel",
+            "vacmAccessContextMatch",
+            "vacmAccessReadViewName",
+            "vacmAccessWriteViewName",
+            "vacmAccessNotifyViewName",
+            "vacmAccessStatus",
+        )
+
+        if instIds is None:
+            self._accessRows.clear()
+            self._accessMap.clear()
+            self._viewNameMap.clear()
+
+            instIds = self._get_inst_ids(vacmAccessStatus)
+
+        groupNames = set()
+
+        for instId in instIds:
+            groupName = vacmAccessEntry.getIndicesFromInstId(instId)[0]
+
+            try:
+                rows = self._accessRows[groupName]
+
+            except KeyError:
+                rows = self._accessRows[groupName] = {}
+
+            try:
+                status = vacmAccessStatus.getNode(vacmAccessStatus.name + instId).syntax
+
+                row = tuple(
+                    mibColumn.getNode(mibColumn.name + instId).syntax
+                    for mibColumn in (
+                        vacmAccessContextPrefix,
+                        vacmAccessSecurityModel,
+                        vacmAccessSecurityLevel,
+                        vacmAccessContextMatch,
+                        vacmAccessReadViewName,
+                        vacmAccessWriteViewName,
+                        vacmAccessNotifyViewName,
                     )
+                )
+
+            except NoSuchInstanceError:
+                status = None
+
+            if status == 1:  # active row
+                rows[instId] = row
+
+            else:
+                rows.pop(instId, None)
+
+            groupNames.add(groupName)
+
+        # Recompile access entries of the affected groups only
+        for groupName in groupNames:
+            self._accessMap.pop(groupName, None)
+            self._viewNameMap.pop(groupName, None)
+
+            rows = self._accessRows[groupName]
+
+            if not rows:
+                del self._accessRows[groupName]
+
+            for instId in sorted(rows):
+                self._add_access_entry(groupName, *rows[instId])
+
+    def _sync_view_tree_map(self, mibBuilder, instIds):
+        (
+            vacmViewTreeFamilyEntry,
+            vacmViewTreeFamilyViewName,
+            vacmViewTreeFamilySubtree,
+            vacmViewTreeFamilyMask,
+            vacmViewTreeFamilyType,
+        ) = mibBuilder.import_symbols(  # type: ignore
+            "SNMP-VIEW-BASED-ACM-MIB",
+            "vacmViewTreeFamilyEntry",
+            "vacmViewTreeFamilyViewName",
+            "vacmViewTreeFamilySubtree",
+            "vacmViewTreeFamilyMask",
+            "vacmViewTreeFamilyType",
+        )
+
+        if instIds is None:
+            self._viewTreeRows.clear()
+            self._viewTreeMap.clear()
+
+            instIds = self._get_inst_ids(vacmViewTreeFamilyViewName)
+
+        viewNames = set()
 
-                except NoSuchInstanceError:
-                    break
+        for instId in instIds:
+            viewName = vacmViewTreeFamilyEntry.getIndicesFromInstId(instId)[0]
 
-                if nextMibNode.syntax not in self._viewTreeMap:
-                    self._viewTreeMap[nextMibNode.syntax] = []
+            try:
+                rows = self._viewTreeRows[viewName]
+
+            except KeyError:
+                rows = self._viewTreeRows[viewName] = {}
 
-                instId = nextMibNode.name[len(vacmViewTreeFamilyViewName.name) :]
+            try:
+                vacmViewTreeFamilyViewName.getNode(
+                    vacmViewTreeFamilyViewName.name + instId
+                )
 
                 subtree = vacmViewTreeFamilySubtree.getNode(
                     vacmViewTreeFamilySubtree.name + instId
@@ -377,61 +599,38 @@ class Vacm:
                     vacmViewTreeFamilyType.name + instId
                 ).syntax
 
+            except NoSuchInstanceError:
+                rows.pop(instId, None)
+
+            else:
                 mask = mask.asNumbers()
                 maskLength = min(len(mask) * 8, len(subtree))
 
-                ignoredSubOids = [
+                ignoredSubOids = {
                     i * 8 + j
                     for i, octet in enumerate(mask)
-                    for j, bit in enumerate(powerOfTwo)
+                    for j, bit in enumerate(self._power_of_two_sequences)
                     if not (bit & octet) and i * 8 + j < maskLength
-                ]
-
-                if ignoredSubOids:
-                    pattern = list(subtree)
-
-                    for ignoredSubOid in ignoredSubOids:
-                        pattern[ignoredSubOid] = 0
-
-                    subtree = subtree.clone(pattern)
-
-                entry = subtree, ignoredSubOids, mode == 1
-
-                self._viewTreeMap[nextMibNode.syntax].append(entry)
-
-            for entries in self._viewTreeMap.values():
-                entries.sort(key=lambda x: (len(x[0]), x[0]))
-
-            self._viewTreeBranchId = vacmViewTreeFamilyViewName.branchVersionId
-
-        # 3.2.5a
-        indices = viewName
-
-        try:
-            entries = self._viewTreeMap[indices]
-
-        except KeyError:
-            return error.StatusInformation(errorIndication=errind.notInView)
+                }
 
-        accessAllowed = False
+                subtree = tuple(
+                    0 if idx in ignoredSubOids else subOid
+                    for idx, subOid in enumerate(subtree)
+                )
 
-        for entry in entries:
-            subtree, ignoredSubOids, included = entry
+                rows[instId] = subtree, ignoredSubOids, mode == 1
 
-            if ignoredSubOids:
-                subOids = list(variableName)
+            viewNames.add(viewName)
 
-                for ignoredSubOid in ignoredSubOids:
-                    subOids[ignoredSubOid] = 0
+        # Recompile the affected views only
+        for viewName in viewNames:
+            rows = self._viewTreeRows[viewName]
 
-                normalizedVariableName = subtree.clone(subOids)
+            if rows:
+                self._viewTreeMap[viewName] = self._compile_view_tree([
+                    rows[instId] for instId in sorted(rows)
+                ])
 
             else:
-                normalizedVariableName = variableName
-
-            if subtree.isPrefixOf(normalizedVariableName):
-                accessAllowed = included
-
-        # 3.2.5c
-        if not accessAllowed:
-            raise error.StatusInformation(errorIndication=errind.notInView)
+                del self._viewTreeRows[viewName]
+                self._viewTreeMap.pop(viewName, None)
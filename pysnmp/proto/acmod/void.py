@@ -38,3 +38,22 @@ class Vacm:
 
         # rfc3415 3.2.5c
         return error.StatusInformation(errorIndication=errind.accessAllowed)
+
+    def are_access_allowed(
+        self,
+        snmpEngine: "SnmpEngine",
+        securityModel,
+        securityName,
+        securityLevel,
+        viewType,
+        contextName,
+        variableNames,
+    ):
+        """Return whether access is allowed to each of MIB objects."""
+        debug.logger & debug.FLAG_ACL and debug.logger(
+            f"areAccessAllowed: viewType {viewType} for {len(variableNames)} "
+            f"variables - OK"
+        )
+
+        # rfc3415 3.2.5c
+        return [True] * len(variableNames)
@@ -0,0 +1,261 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Fast BER decoder for SNMP messages.
+
+SNMP messages are built of a few ASN.1 types encoded in the definite
+length form. This module decodes them in a single pass over the
+substrate, filling in the same pyasn1 objects as the generic pyasn1
+BER decoder would produce. Anything it does not handle (indefinite
+length, constructed strings, high tag numbers, OPTIONAL components,
+malformed encodings) gets decoded by pyasn1.
+"""
+
+from pyasn1.codec.ber import decoder
+from pyasn1.error import PyAsn1Error
+from pyasn1.type import univ
+
+
+class _Unsupported(Exception):
+    """Substrate or spec is beyond fast path."""
+
+
+__tagBytes = {}
+__valueDecoders = {}
+__sequencePlans = {}
+__choicePlans = {}
+
+
+def __to_tag_byte(tagSet):
+    if len(tagSet) == 1 and tagSet[0].tagId < 31:
+        tag = tagSet[0]
+        return tag.tagClass | tag.tagFormat | tag.tagId
+    return None
+
+
+def __get_tag_byte(spec):
+    tagSet = spec.tagSet
+
+    # tag sets can not be cache keys as they compare regardless of tag format
+    try:
+        cachedTagSet, tagByte = __tagBytes[spec.__class__]
+        if cachedTagSet is tagSet:
+            return tagByte
+
+    except KeyError:
+        pass
+
+    tagByte = __to_tag_byte(tagSet)
+
+    __tagBytes[spec.__class__] = tagSet, tagByte
+    return tagByte
+
+
+def __read_header(substrate, pos, end):
+    length = substrate[pos + 1]
+    pos += 2
+    if length & 0x80:
+        size = length & 0x7F
+        if not 0 < size < 5:
+            raise _Unsupported("indefinite or oversized length")
+        length = int.from_bytes(substrate[pos : pos + size], "big")
+        pos += size
+    if pos + length > end:
+        raise _Unsupported("value overruns its container")
+    return pos, pos + length
+
+
+def __decode_integer(spec, substrate, start, stop):
+    if start == stop:
+        raise _Unsupported("empty integer")
+    return spec.clone(int.from_bytes(substrate[start:stop], "big", signed=True))
+
+
+def __decode_octet_string(spec, substrate, start, stop):
+    return spec.clone(substrate[start:stop])
+
+
+def __decode_null(spec, substrate, start, stop):
+    if start != stop:
+        raise _Unsupported("non-empty null")
+    return spec.clone("")
+
+
+def __decode_object_identifier(spec, substrate, start, stop):
+    arcs = []
+    arc = 0
+    for pos in range(start, stop):
+        octet = substrate[pos]
+        if not arc and octet == 0x80:
+            raise _Unsupported("non-minimal sub-identifier")
+        arc = arc << 7 | octet & 0x7F
+        if not octet & 0x80:
+            arcs.append(arc)
+            arc = 0
+
+    if arc or not arcs:
+        raise _Unsupported("truncated object identifier")
+
+    first = arcs[0]
+    if first < 40:
+        arcs[0:1] = (0, first)
+    elif first < 80:
+        arcs[0:1] = (1, first - 40)
+    else:
+        arcs[0:1] = (2, first - 80)
+
+    return spec.clone(tuple(arcs))
+
+
+def __get_value_decoder(spec):
+    specType = spec.__class__
+    try:
+        return __valueDecoders[specType]
+
+    except KeyError:
+        pass
+
+    if isinstance(spec, univ.Integer) and not isinstance(spec, univ.Boolean):
+        valueDecoder = __decode_integer
+    elif isinstance(spec, univ.OctetString):
+        valueDecoder = __decode_octet_string
+    elif isinstance(spec, univ.Null):
+        valueDecoder = __decode_null
+    elif isinstance(spec, univ.ObjectIdentifier):
+        valueDecoder = __decode_object_identifier
+    else:
+        valueDecoder = None
+
+    __valueDecoders[specType] = valueDecoder
+    return valueDecoder
+
+
+def __get_choice_plan(spec):
+    componentType = spec.componentType
+    try:
+        return __choicePlans[id(componentType)][1]
+
+    except KeyError:
+        pass
+
+    plan = {}
+    for tagSet, component in spec.tagMap.presentTypes.items():
+        tagByte = __to_tag_byte(tagSet)
+        if tagByte is not None:
+            plan[tagByte] = componentType.getPositionByType(tagSet), component
+
+    # componentType is kept referenced to keep its id unique
+    __choicePlans[id(componentType)] = componentType, plan
+    return plan
+
+
+def __get_sequence_plan(spec):
+    componentType = spec.componentType
+    try:
+        return __sequencePlans[id(componentType)][1]
+
+    except KeyError:
+        pass
+
+    if componentType.hasOptionalOrDefault:
+        plan = None
+    else:
+        plan = [namedType.asn1Object for namedType in componentType.namedTypes]
+
+    __sequencePlans[id(componentType)] = componentType, plan
+    return plan
+
+
+def __decode(spec, substrate, pos, end):
+    if spec.typeId == univ.Choice.typeId:
+        try:
+            idx, component = __get_choice_plan(spec)[substrate[pos]]
+
+        except KeyError:
+            raise _Unsupported("unexpected tag %#x" % substrate[pos])
+
+        value, pos = __decode(component, substrate, pos, end)
+
+        choice = spec.clone()
+        choice.setComponentByPosition(
+            idx,
+            value,
+            verifyConstraints=False,
+            matchTags=False,
+            matchConstraints=False,
+        )
+        return choice, pos
+
+    if substrate[pos] != __get_tag_byte(spec):
+        raise _Unsupported("unexpected tag %#x" % substrate[pos])
+
+    start, stop = __read_header(substrate, pos, end)
+
+    if spec.typeId == univ.Sequence.typeId:
+        plan = __get_sequence_plan(spec)
+        if plan is None:
+            raise _Unsupported("OPTIONAL or DEFAULT components")
+
+        value = spec.clone()
+        for idx, component in enumerate(plan):
+            if start >= stop:
+                raise _Unsupported("missing component")
+            component, start = __decode(component, substrate, start, stop)
+            value.setComponentByPosition(
+                idx,
+                component,
+                verifyConstraints=False,
+                matchTags=False,
+                matchConstraints=False,
+            )
+
+    elif spec.typeId == univ.SequenceOf.typeId:
+        componentSpec = spec.componentType
+
+        value = spec.clone()
+        value.clear()
+        idx = 0
+        while start < stop:
+            component, start = __decode(componentSpec, substrate, start, stop)
+            value.setComponentByPosition(
+                idx,
+                component,
+                verifyConstraints=False,
+                matchTags=False,
+                matchConstraints=False,
+            )
+            idx += 1
+
+    else:
+        valueDecoder = __get_value_decoder(spec)
+        if valueDecoder is None:
+            raise _Unsupported("unsupported type %s" % spec.__class__.__name__)
+        return valueDecoder(spec, substrate, start, stop), stop
+
+    if start != stop:
+        raise _Unsupported("trailing data in constructed value")
+
+    return value, stop
+
+
+def decode(substrate, asn1Spec):
+    """Decode BER-encoded SNMP message or its part against `asn1Spec`.
+
+    Returns a tuple of decoded pyasn1 object and the remainder of the
+    substrate, just like the pyasn1 BER decoder.
+    """
+    if isinstance(substrate, univ.OctetString):
+        substrate = substrate.asOctets()
+
+    if isinstance(substrate, bytes):
+        try:
+            value, pos = __decode(asn1Spec, substrate, 0, len(substrate))
+            return value, substrate[pos:]
+
+        except (_Unsupported, IndexError, ValueError, PyAsn1Error):
+            pass
+
+    return decoder.decode(substrate, asn1Spec=asn1Spec)
@@ -0,0 +1,176 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Fast BER encoder for SNMP messages.
+
+Serializes SNMP messages into the definite length BER form in a single
+pass, leaving anything it does not handle to the pyasn1 BER encoder.
+
+Parts of a message which are sent over and over again, such as
+the var-bind list of a periodic poll, can be pre-encoded with
+:py:func:`freeze`. Their substrate is then copied into each message
+verbatim, so only the message envelope (request-id, community or SNMPv3
+header) gets encoded per send.
+"""
+
+from pyasn1.codec.ber import encoder
+from pyasn1.error import PyAsn1Error
+from pyasn1.type import univ
+
+
+class _Unsupported(Exception):
+    """Value is beyond fast path."""
+
+
+__tagBytes = {}
+
+
+def __get_tag_byte(value):
+    tagSet = value.tagSet
+
+    # tag sets can not be cache keys as they compare regardless of tag format
+    try:
+        cachedTagSet, tagByte = __tagBytes[value.__class__]
+        if cachedTagSet is tagSet:
+            return tagByte
+
+    except KeyError:
+        pass
+
+    if len(tagSet) == 1 and tagSet[0].tagId < 31:
+        tag = tagSet[0]
+        tagByte = tag.tagClass | tag.tagFormat | tag.tagId
+    else:
+        tagByte = None
+
+    __tagBytes[value.__class__] = tagSet, tagByte
+    return tagByte
+
+
+def __encode_length(length):
+    if length < 0x80:
+        return bytes((length,))
+    length = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes((0x80 | len(length),)) + length
+
+
+def __encode_integer(value):
+    value = int(value)
+    if value < 0:
+        size = (-value - 1).bit_length() // 8 + 1
+    else:
+        size = value.bit_length() // 8 + 1
+    return value.to_bytes(size, "big", signed=True)
+
+
+def __encode_object_identifier(arcs):
+    if len(arcs) < 2 or arcs[0] > 2 or arcs[0] < 2 and arcs[1] > 39:
+        raise _Unsupported("irregular object identifier")
+
+    octets = bytearray()
+    for arc in (arcs[0] * 40 + arcs[1],) + arcs[2:]:
+        if arc < 0x80:
+            octets.append(arc)
+            continue
+        chunk = []
+        while arc:
+            chunk.append(arc & 0x7F | 0x80)
+            arc >>= 7
+        chunk[0] &= 0x7F
+        chunk.reverse()
+        octets.extend(chunk)
+
+    return bytes(octets)
+
+
+def __encode(value):
+    substrate = getattr(value, "_substrate", None)
+    if substrate is not None:
+        return substrate
+
+    typeId = value.typeId
+
+    if typeId == univ.Choice.typeId:
+        return __encode(value.getComponent())
+
+    tagByte = __get_tag_byte(value)
+    if tagByte is None:
+        raise _Unsupported("irregular tag %s" % value.tagSet)
+
+    if typeId == univ.Sequence.typeId:
+        if value.componentType.hasOptionalOrDefault:
+            raise _Unsupported("OPTIONAL or DEFAULT components")
+        contents = b"".join([
+            __encode(value.getComponentByPosition(idx, instantiate=False))
+            for idx in range(len(value.componentType))
+        ])
+
+    elif typeId == univ.SequenceOf.typeId:
+        if not len(value) and not value.isValue:
+            raise _Unsupported("no value")
+        contents = b"".join([__encode(component) for component in value])
+
+    elif not value.isValue:
+        raise _Unsupported("no value")
+
+    elif isinstance(value, univ.Integer) and not isinstance(value, univ.Boolean):
+        contents = __encode_integer(value)
+
+    elif isinstance(value, univ.OctetString):
+        contents = value.asOctets()
+
+    elif isinstance(value, univ.Null):
+        contents = b""
+
+    elif isinstance(value, univ.ObjectIdentifier):
+        contents = __encode_object_identifier(value.asTuple())
+
+    else:
+        raise _Unsupported("unsupported type %s" % value.__class__.__name__)
+
+    return bytes((tagByte,)) + __encode_length(len(contents)) + contents
+
+
+def encode(value):
+    """Encode SNMP message or its part into BER."""
+    try:
+        return __encode(value)
+
+    except (_Unsupported, PyAsn1Error):
+        return encoder.encode(value)
+
+
+def encode_var_bind(name, value):
+    """Encode OID-value pair into BER as a VarBind."""
+    try:
+        contents = __encode_object_identifier(tuple(name))
+
+    except _Unsupported:
+        contents = encoder.encode(univ.ObjectIdentifier(name))
+
+    else:
+        contents = b"\x06" + __encode_length(len(contents)) + contents
+
+    contents += encode(value)
+
+    return b"\x30" + __encode_length(len(contents)) + contents
+
+
+def get_encoded_size(length):
+    """Return size of BER-encoded value having contents of `length` octets."""
+    if length < 0x80:
+        return length + 2
+    return length + 2 + (length.bit_length() + 7) // 8
+
+
+def freeze(value):
+    """Pre-encode `value` for :py:func:`encode` to copy in as is.
+
+    The value must not be modified afterwards, otherwise stale
+    substrate would be sent.
+    """
+    value._substrate = encode(value)
+    return value
@@ -12,6 +12,26 @@ from pysnmp.proto.error import ProtocolError
 
 def decode_message_version(wholeMsg):
     """Decode SNMP version from the message."""
+    # Fast path: read the version right off the BER header without
+    # decoding (and slicing) the substrate
+    try:
+        if wholeMsg[0] == 0x30:
+            offset = 2
+            if wholeMsg[1] & 0x80:
+                offset += wholeMsg[1] & 0x7F
+            length = wholeMsg[offset + 1]
+            if wholeMsg[offset] == 0x02 and 0 < length < 5:
+                offset += 2
+                if offset + length <= len(wholeMsg):
+                    return univ.Integer(
+                        int.from_bytes(
+                            wholeMsg[offset : offset + length], "big", signed=True
+                        )
+                    )
+
+    except (IndexError, TypeError):
+        pass
+
     try:
         seq, wholeMsg = decoder.decode(
             wholeMsg,
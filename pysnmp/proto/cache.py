@@ -4,19 +4,30 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
+from heapq import heapify, heappop, heappush
+
 from pysnmp.proto import error
 
 
 class Cache:
-    """Cache class."""
+    """Cache class.
+
+    Entries carrying a `timeout` parameter are additionally kept in a
+    deadline-ordered heap so that expiration only visits entries whose
+    deadline has been reached.
+    """
 
     def __init__(self):
         """Create a cache object."""
         self.__cacheRepository = {}
+        self.__expirationQueue = []
+        self.__expirationSeq = 0
 
     def add(self, index, **kwargs):
         """Add cache entry."""
         self.__cacheRepository[index] = kwargs
+        if "timeout" in kwargs:
+            self.__schedule(index, kwargs)
         return index
 
     def pop(self, index):
@@ -32,12 +43,62 @@ class Cache:
         """Update cache entry."""
         if index not in self.__cacheRepository:
             raise error.ProtocolError("Cache miss on update for %s" % kwargs)
-        self.__cacheRepository[index].update(kwargs)
-
-    def expire(self, cbFun, cbCtx):
-        """Expire cache entries."""
-        for index, cachedParams in list(self.__cacheRepository.items()):
-            if cbFun:
-                if cbFun(index, cachedParams, cbCtx):
-                    if index in self.__cacheRepository:
-                        del self.__cacheRepository[index]
+        cachedParams = self.__cacheRepository[index]
+        if "timeout" in kwargs and kwargs["timeout"] != cachedParams.get("timeout"):
+            cachedParams.update(kwargs)
+            self.__schedule(index, cachedParams)
+        else:
+            cachedParams.update(kwargs)
+
+    def __schedule(self, index, cachedParams):
+        self.__expirationSeq += 1
+        heappush(
+            self.__expirationQueue,
+            (cachedParams["timeout"], self.__expirationSeq, index, cachedParams),
+        )
+
+    def expire(self, cbFun, cbCtx, timeNow=None):
+        """Expire cache entries.
+
+        If `timeNow` is given, only entries which `timeout` is not
+        in the future are offered to `cbFun`.
+        """
+        if timeNow is None:
+            # Legacy mode: let `cbFun` check every entry
+            for index, cachedParams in list(self.__cacheRepository.items()):
+                if cbFun:
+                    if cbFun(index, cachedParams, cbCtx):
+                        if index in self.__cacheRepository:
+                            del self.__cacheRepository[index]
+            return
+
+        cacheRepository = self.__cacheRepository
+        expirationQueue = self.__expirationQueue
+
+        # Drop queue items left behind by popped entries
+        if len(expirationQueue) > 2 * len(cacheRepository) + 64:
+            self.__expirationQueue = expirationQueue = [
+                x for x in expirationQueue if cacheRepository.get(x[2]) is x[3]
+            ]
+            heapify(expirationQueue)
+
+        postponed = []
+
+        while expirationQueue and expirationQueue[0][0] <= timeNow:
+            item = heappop(expirationQueue)
+            timeout, _, index, cachedParams = item
+
+            if cacheRepository.get(index) is not cachedParams:
+                continue
+
+            if cachedParams["timeout"] != timeout:
+                continue  # rescheduled by update()
+
+            if cbFun and cbFun(index, cachedParams, cbCtx):
+                if cacheRepository.get(index) is cachedParams:
+                    del cacheRepository[index]
+            else:
+                postponed.append(item)
+
+        for item in postponed:
+            heappush(expirationQueue, item)
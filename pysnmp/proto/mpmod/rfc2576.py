@@ -8,11 +8,11 @@ import sys
 from typing import TYPE_CHECKING
 
 
-from pyasn1.codec.ber import decoder, eoo
+from pyasn1.codec.ber import eoo
 from pyasn1.type import univ
 from pysnmp import debug
 from pysnmp.proto import errind, error, rfc3411
-from pysnmp.proto.api import v1, v2c
+from pysnmp.proto.api import msgdec, v1, v2c
 from pysnmp.proto.mpmod.base import AbstractMessageProcessingModel
 from pysnmp.proto.secmod.base import AbstractSecurityModel
 
@@ -320,7 +320,7 @@ class SnmpV1MessageProcessingModel(AbstractMessageProcessingModel):
         mibBuilder = snmpEngine.get_mib_builder()
 
         # rfc3412: 7.2.2
-        msg, restOfWholeMsg = decoder.decode(wholeMsg, asn1Spec=self._snmpMsgSpec)
+        msg, restOfWholeMsg = msgdec.decode(wholeMsg, asn1Spec=self._snmpMsgSpec)
 
         debug.logger & debug.FLAG_MP and debug.logger(
             f"prepareDataElements: {msg.prettyPrint()}"
@@ -9,10 +9,11 @@ from __future__ import annotations
 import sys
 from typing import TYPE_CHECKING
 
-from pyasn1.codec.ber import decoder, eoo
+from pyasn1.codec.ber import eoo
 from pyasn1.type import constraint, namedtype, univ
 from pysnmp import debug
 from pysnmp.proto import api, errind, error, rfc1905, rfc3411
+from pysnmp.proto.api import msgdec
 from pysnmp.proto.mpmod.base import AbstractMessageProcessingModel
 from pysnmp.proto.secmod.base import AbstractSecurityModel
 
@@ -622,7 +623,7 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
     ):
         """Prepare SNMP message data elements."""
         # 7.2.2
-        msg, restOfwholeMsg = decoder.decode(wholeMsg, asn1Spec=self._snmpMsgSpec)
+        msg, restOfwholeMsg = msgdec.decode(wholeMsg, asn1Spec=self._snmpMsgSpec)
 
         debug.logger & debug.FLAG_MP and debug.logger(
             f"prepareDataElements: {msg.prettyPrint()}"
@@ -651,7 +652,7 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
             (snmpUnknownSecurityModels,) = snmpEngine.get_mib_builder().import_symbols(
                 "__SNMP-MPD-MIB", "snmpUnknownSecurityModels"
             )
-            snmpUnknownSecurityModels.syntax += 1
+            snmpUnknownSecurityModels.count += 1
             raise error.StatusInformation(
                 errorIndication=errind.unsupportedSecurityModel
             )
@@ -667,7 +668,7 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
             (snmpInvalidMsgs,) = snmpEngine.get_mib_builder().import_symbols(
                 "__SNMP-MPD-MIB", "snmpInvalidMsgs"
             )
-            snmpInvalidMsgs.syntax += 1
+            snmpInvalidMsgs.count += 1
             raise error.StatusInformation(errorIndication=errind.invalidMsg)
 
         if msgFlags & 0x04:
@@ -806,9 +807,13 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
                     }
 
                     expireAt = int(
-                        self.__expirationTimer
+                        max(
+                            self.__expirationTimer,
+                            snmpEngine.transport_dispatcher.get_timer_ticks(),
+                        )
                         + 300 / snmpEngine.transport_dispatcher.get_timer_resolution()
                     )
+                    snmpEngine.transport_dispatcher.request_timer_tick(expireAt)
                     if expireAt not in self.__engineIdCacheExpQueue:
                         self.__engineIdCacheExpQueue[expireAt] = []
                     self.__engineIdCacheExpQueue[expireAt].append(k)
@@ -1074,17 +1079,23 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
         smHandler.release_state_information(securityStateReference)
         raise error.StatusInformation(errorIndication=errind.unsupportedPDUtype)
 
-    def __expire_engines_info(self):
-        if self.__expirationTimer in self.__engineIdCacheExpQueue:
-            for engineKey in self.__engineIdCacheExpQueue[self.__expirationTimer]:
-                del self.__engineIdCache[engineKey]
-                debug.logger & debug.FLAG_MP and debug.logger(
-                    f"__expireEnginesInfo: expiring {engineKey!r}"
-                )
-            del self.__engineIdCacheExpQueue[self.__expirationTimer]
-        self.__expirationTimer += 1
+    def __expire_engines_info(self, timerTicks):
+        # Timer ticks may leap when timer ticks are scheduled on demand
+        while self.__expirationTimer <= timerTicks:
+            if self.__expirationTimer in self.__engineIdCacheExpQueue:
+                for engineKey in self.__engineIdCacheExpQueue[self.__expirationTimer]:
+                    del self.__engineIdCache[engineKey]
+                    debug.logger & debug.FLAG_MP and debug.logger(
+                        f"__expireEnginesInfo: expiring {engineKey!r}"
+                    )
+                del self.__engineIdCacheExpQueue[self.__expirationTimer]
+
+            if not self.__engineIdCacheExpQueue:
+                self.__expirationTimer = int(timerTicks)
+
+            self.__expirationTimer += 1
 
     def receive_timer_tick(self, snmpEngine: SnmpEngine, timeNow):
         """Process periodic timer tick."""
-        self.__expire_engines_info()
+        self.__expire_engines_info(snmpEngine.transport_dispatcher.get_timer_ticks())
         AbstractMessageProcessingModel.receive_timer_tick(self, snmpEngine, timeNow)
@@ -158,14 +158,16 @@ class MsgAndPduDispatcher:
         # 4.1.1.3
         sendPduHandle = self.__sendPduHandle()
         if expectResponse:
+            timeoutAt = timeout + snmpEngine.transport_dispatcher.get_timer_ticks()
             self.__cache.add(
                 sendPduHandle,
                 messageProcessingModel=messageProcessingModel,
                 sendPduHandle=sendPduHandle,
-                timeout=timeout + snmpEngine.transport_dispatcher.get_timer_ticks(),
+                timeout=timeoutAt,
                 cbFun=cbFun,
                 cbCtx=cbCtx,
             )
+            snmpEngine.transport_dispatcher.request_timer_tick(timeoutAt)
 
             debug.logger & debug.FLAG_DSP and debug.logger(
                 "sendPdu: current time %d ticks, one tick is %s seconds"
@@ -335,7 +337,7 @@ class MsgAndPduDispatcher:
             and len(outgoingMessage) > snmpEngineMaxMessageSize.syntax
         ):
             (snmpSilentDrops,) = self.mib_instrum_controller.get_mib_builder().import_symbols("__SNMPv2-MIB", "snmpSilentDrops")  # type: ignore
-            snmpSilentDrops.syntax += 1
+            snmpSilentDrops.count += 1
             raise error.StatusInformation(errorIndication=errind.tooBig)
 
         snmpEngine.observer.store_execution_context(
@@ -373,7 +375,7 @@ class MsgAndPduDispatcher:
         (snmpInPkts,) = self.mib_instrum_controller.get_mib_builder().import_symbols(  # type: ignore
             "__SNMPv2-MIB", "snmpInPkts"
         )
-        snmpInPkts.syntax += 1
+        snmpInPkts.count += 1
 
         # 4.2.1.2
         try:
@@ -386,7 +388,7 @@ class MsgAndPduDispatcher:
             ) = self.mib_instrum_controller.get_mib_builder().import_symbols(  # type: ignore
                 "__SNMPv2-MIB", "snmpInASNParseErrs"  # type: ignore
             )
-            snmpInASNParseErrs.syntax += 1
+            snmpInASNParseErrs.count += 1
             return b""  # n.b the whole buffer gets dropped
 
         debug.logger & debug.FLAG_DSP and debug.logger(
@@ -401,7 +403,7 @@ class MsgAndPduDispatcher:
 
         except KeyError:
             (snmpInBadVersions,) = self.mib_instrum_controller.get_mib_builder().import_symbols("__SNMPv2-MIB", "snmpInBadVersions")  # type: ignore
-            snmpInBadVersions.syntax += 1
+            snmpInBadVersions.count += 1
             return restOfWholeMsg
 
         # 4.2.1.3 -- no-op
@@ -454,7 +456,7 @@ class MsgAndPduDispatcher:
             (snmpInASNParseErrs,) = snmpEngine.get_mib_builder().import_symbols(  # type: ignore
                 "__SNMPv2-MIB", "snmpInASNParseErrs"
             )
-            snmpInASNParseErrs.syntax += 1
+            snmpInASNParseErrs.count += 1
 
             return restOfWholeMsg
 
@@ -480,7 +482,7 @@ class MsgAndPduDispatcher:
                 ) = self.mib_instrum_controller.get_mib_builder().import_symbols(
                     "__SNMP-MPD-MIB", "snmpUnknownPDUHandlers"  # type: ignore
                 )
-                snmpUnknownPDUHandlers.syntax += 1
+                snmpUnknownPDUHandlers.count += 1
 
                 # 4.2.2.1.2.b
                 statusInformation = {
@@ -597,7 +599,7 @@ class MsgAndPduDispatcher:
                 ) = self.mib_instrum_controller.get_mib_builder().import_symbols(
                     "__SNMP-MPD-MIB", "snmpUnknownPDUHandlers"  # type: ignore
                 )
-                snmpUnknownPDUHandlers.syntax += 1
+                snmpUnknownPDUHandlers.count += 1
                 return restOfWholeMsg
 
             debug.logger & debug.FLAG_DSP and debug.logger(
@@ -712,7 +714,11 @@ class MsgAndPduDispatcher:
     # noinspection PyUnusedLocal
     def receive_timer_tick(self, snmpEngine: "SnmpEngine", timeNow):
         """Process cache timeouts."""
-        self.__cache.expire(self.__expire_request, snmpEngine)
+        self.__cache.expire(
+            self.__expire_request,
+            snmpEngine,
+            snmpEngine.transport_dispatcher.get_timer_ticks(),
+        )
 
     # Old to new attribute mapping
     deprecated_attributes = {
@@ -7,12 +7,11 @@
 import sys
 from typing import TYPE_CHECKING
 
-
-from pyasn1.codec.ber import encoder
 from pyasn1.error import PyAsn1Error
 from pysnmp import debug
 from pysnmp.carrier.asyncio.dgram import udp, udp6
 from pysnmp.proto import errind, error
+from pysnmp.proto.api import msgenc
 from pysnmp.proto.secmod import base
 from pysnmp.smi.error import NoSuchInstanceError
 
@@ -489,7 +488,7 @@ class SnmpV1SecurityModel(base.AbstractSecurityModel):
         )
 
         try:
-            return securityParameters, encoder.encode(msg)
+            return securityParameters, msgenc.encode(msg)
 
         except PyAsn1Error:
             debug.logger & debug.FLAG_MP and debug.logger(
@@ -539,7 +538,7 @@ class SnmpV1SecurityModel(base.AbstractSecurityModel):
         )
 
         try:
-            return communityName, encoder.encode(msg)
+            return communityName, msgenc.encode(msg)
 
         except PyAsn1Error:
             debug.logger & debug.FLAG_MP and debug.logger(
@@ -584,7 +583,7 @@ class SnmpV1SecurityModel(base.AbstractSecurityModel):
             (snmpInBadCommunityNames,) = snmpEngine.get_mib_builder().import_symbols(
                 "__SNMPv2-MIB", "snmpInBadCommunityNames"
             )
-            snmpInBadCommunityNames.syntax += 1
+            snmpInBadCommunityNames.count += 1
             raise error.StatusInformation(
                 errorIndication=errind.unknownCommunityName, communityName=communityName
             )
@@ -26,11 +26,13 @@ class AbstractAuthenticationService:
         raise error.ProtocolError(errind.noAuthentication)
 
     # 7.2.4.1
-    def authenticate_outgoing_message(self, authKey, wholeMsg):
+    def authenticate_outgoing_message(self, authKey, wholeMsg, digestOffset=None):
         """Authenticate outgoing message."""
         raise error.ProtocolError(errind.noAuthentication)
 
     # 7.2.4.2
-    def authenticate_incoming_message(self, authKey, authParameters, wholeMsg):
+    def authenticate_incoming_message(
+        self, authKey, authParameters, wholeMsg, digestOffset=None
+    ):
         """Authenticate incoming message."""
         raise error.ProtocolError(errind.noAuthentication)
@@ -4,6 +4,7 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
+import weakref
 from hashlib import sha1
 
 from pyasn1.type import univ
@@ -28,6 +29,38 @@ class HmacSha(base.AbstractAuthenticationService):
     IPAD = [0x36] * 64
     OPAD = [0x5C] * 64
 
+    def __init__(self):
+        """Create a HMAC-SHA-1-96 authentication service."""
+        self.__keyedHashes = weakref.WeakKeyDictionary()
+
+    def __get_keyed_hashes(self, authKey):
+        # Inner and outer hash objects pre-fed with k1 and k2 get
+        # copied for each message rather than rebuilt from the key.
+        # They live as long as the localized key object does, which
+        # is kept in the USM user table.
+        try:
+            return self.__keyedHashes[authKey]
+
+        except KeyError:
+            pass
+
+        # 7.3.1.2a
+        extendedAuthKey = authKey.asOctets() + bytes(FORTY_FOUR_ZEROS)
+
+        # 7.3.1.2b -- no-op
+
+        # 7.3.1.2c
+        k1 = bytes(map(lambda x, y: x ^ y, extendedAuthKey, self.IPAD))
+
+        # 7.3.1.2d -- no-op
+
+        # 7.3.1.2e
+        k2 = bytes(map(lambda x, y: x ^ y, extendedAuthKey, self.OPAD))
+
+        keyedHashes = self.__keyedHashes[authKey] = sha1(k1), sha1(k2)
+
+        return keyedHashes
+
     def hash_passphrase(self, authKey) -> univ.OctetString:
         """Hash a passphrase."""
         return localkey.hash_passphrase_sha(authKey)
@@ -42,78 +75,77 @@ class HmacSha(base.AbstractAuthenticationService):
         return 12
 
     # 7.3.1
-    def authenticate_outgoing_message(self, authKey, wholeMsg):
-        """Authenticate outgoing message."""
+    def authenticate_outgoing_message(self, authKey, wholeMsg, digestOffset=None):
+        """Authenticate outgoing message.
+
+        The `digestOffset` is the position of the digest placeholder
+        in `wholeMsg`, the placeholder gets searched for if not given.
+        """
         # 7.3.1.1
         # Here we expect calling secmod to indicate where the digest
         # should be in the substrate. Also, it pre-sets digest placeholder
         # so we hash wholeMsg out of the box.
         # Yes, that's ugly but that's rfc...
-        value = wholeMsg.find(TWELVE_ZEROS)
-        if value == -1:
-            raise error.ProtocolError("Cant locate digest placeholder")
+        value = digestOffset
+        if value is None or wholeMsg[value : value + 12] != TWELVE_ZEROS:
+            value = wholeMsg.find(TWELVE_ZEROS)
+            if value == -1:
+                raise error.ProtocolError("Cant locate digest placeholder")
         wholeHead = wholeMsg[:value]
         wholeTail = wholeMsg[value + 12 :]
 
-        # 7.3.1.2a
-        extendedAuthKey = authKey.asNumbers() + FORTY_FOUR_ZEROS
-
-        # 7.3.1.2b -- no-op
-
-        # 7.3.1.2c
-        k1 = univ.OctetString(map(lambda x, y: x ^ y, extendedAuthKey, self.IPAD))
-
-        # 7.3.1.2d -- no-op
-
-        # 7.3.1.2e
-        k2 = univ.OctetString(map(lambda x, y: x ^ y, extendedAuthKey, self.OPAD))
+        # 7.3.1.2
+        innerHash, outerHash = self.__get_keyed_hashes(authKey)
 
         # 7.3.1.3
-        d1 = sha1(k1.asOctets() + wholeMsg).digest()
+        d1 = innerHash.copy()
+        d1.update(wholeMsg)
 
         # 7.3.1.4
-        d2 = sha1(k2.asOctets() + d1).digest()
-        mac = d2[:12]
+        d2 = outerHash.copy()
+        d2.update(d1.digest())
+        mac = d2.digest()[:12]
 
         # 7.3.1.5 & 6
         return wholeHead + mac + wholeTail
 
     # 7.3.2
-    def authenticate_incoming_message(self, authKey, authParameters, wholeMsg):
-        """Authenticate incoming message."""
+    def authenticate_incoming_message(
+        self, authKey, authParameters, wholeMsg, digestOffset=None
+    ):
+        """Authenticate incoming message.
+
+        The `digestOffset` is the position of `authParameters` in
+        `wholeMsg`, the digest gets searched for if not given.
+        """
         # 7.3.2.1 & 2
         if len(authParameters) != 12:
             raise error.StatusInformation(errorIndication=errind.authenticationError)
 
         # 7.3.2.3
-        value = wholeMsg.find(authParameters.asOctets())
-        if value == -1:
-            raise error.ProtocolError("Cant locate digest in wholeMsg")
+        authParameters = authParameters.asOctets()
+        value = digestOffset
+        if value is None or wholeMsg[value : value + 12] != authParameters:
+            value = wholeMsg.find(authParameters)
+            if value == -1:
+                raise error.ProtocolError("Cant locate digest in wholeMsg")
         wholeHead = wholeMsg[:value]
         wholeTail = wholeMsg[value + 12 :]
         authenticatedWholeMsg = wholeHead + TWELVE_ZEROS + wholeTail
 
-        # 7.3.2.4a
-        extendedAuthKey = authKey.asNumbers() + FORTY_FOUR_ZEROS
-
-        # 7.3.2.4b --> no-op
-
-        # 7.3.2.4c
-        k1 = univ.OctetString(map(lambda x, y: x ^ y, extendedAuthKey, self.IPAD))
-
-        # 7.3.2.4d --> no-op
-
-        # 7.3.2.4e
-        k2 = univ.OctetString(map(lambda x, y: x ^ y, extendedAuthKey, self.OPAD))
+        # 7.3.2.4
+        innerHash, outerHash = self.__get_keyed_hashes(authKey)
 
         # 7.3.2.5a
-        d1 = sha1(k1.asOctets() + authenticatedWholeMsg).digest()
+        d1 = innerHash.copy()
+        d1.update(authenticatedWholeMsg)
 
         # 7.3.2.5b
-        d2 = sha1(k2.asOctets() + d1).digest()
+        d2 = outerHash.copy()
+        d2.update(d1.digest())
 
         # 7.3.2.5c
-        mac = d2[:12]
+        mac = d2.digest()[:12]
 
         # 7.3.2.6
         if mac != authParameters:
@@ -26,10 +26,12 @@ class NoAuth(base.AbstractAuthenticationService):
         return
 
     # 7.2.4.2
-    def authenticate_outgoing_message(self, authKey, wholeMsg):
+    def authenticate_outgoing_message(self, authKey, wholeMsg, digestOffset=None):
         """Authenticate outgoing message."""
         raise error.StatusInformation(errorIndication=errind.noAuthentication)
 
-    def authenticate_incoming_message(self, authKey, authParameters, wholeMsg):
+    def authenticate_incoming_message(
+        self, authKey, authParameters, wholeMsg, digestOffset=None
+    ):
         """Authenticate incoming message."""
         raise error.StatusInformation(errorIndication=errind.noAuthentication)
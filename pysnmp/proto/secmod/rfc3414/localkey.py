@@ -4,36 +4,165 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
+import dbm
+import hashlib
+import hmac
+import os
 from hashlib import md5, sha1
 
 from pyasn1.type import univ
 
+from pysnmp import cache
+
+# RFC3414: A.2.1 - passphrase gets stretched into 1 megabyte of input
+PASSPHRASE_EXPANSION_LENGTH = 1048576
+
+
+class KeyCache:
+    """Cache of keys derived from passphrases.
+
+    Keeps up to `maxSize` most recently used keys in memory. If `path` is
+    given, keys are also stored in a dbm database at that path so that
+    they survive restarts. Stored keys are as good as the passphrases
+    they are derived from, so the database should be protected as such.
+
+    Entries are indexed by HMAC-SHA256 of the hash function name and the
+    passphrase, keyed with a random secret generated for each store and
+    kept along with the stored keys. Passphrases themselves are never
+    stored, and an index can not be matched against a precomputed
+    table of passphrase digests.
+    """
+
+    # Reserved dbm entry holding the index secret, never a valid index
+    SECRET_INDEX = b"secret"
+
+    def __init__(self, maxSize=4096, path=None):
+        """Create a key cache instance."""
+        self.__keys = cache.Cache(maxSize)
+        self.__db = path and dbm.open(path, "c", 0o600)
+
+        if self.__db is None:
+            self.__secret = os.urandom(32)
+
+        elif self.SECRET_INDEX in self.__db:
+            self.__secret = self.__db[self.SECRET_INDEX]
+
+        else:
+            self.__secret = self.__db[self.SECRET_INDEX] = os.urandom(32)
+
+    def get_index(self, passphrase, hashName):
+        """Return cache index for a passphrase hashed by hashName."""
+        return hmac.new(
+            self.__secret, hashName.encode() + b":" + passphrase, hashlib.sha256
+        ).digest()
+
+    def get(self, index):
+        """Return cached key or None if not found."""
+        key = self.__keys.get(index)
+        if key is not None:
+            return key
+
+        if self.__db is not None and index in self.__db:
+            key = self.__keys[index] = self.__db[index]
+            return key
+
+    def set(self, index, key):
+        """Store a key."""
+        self.__keys[index] = key
+
+        if self.__db is not None:
+            self.__db[index] = key
+
+    def clear(self):
+        """Drop all cached keys from memory."""
+        self.__keys.clear()
+
+    def close(self):
+        """Close on-disk key store, if any."""
+        if self.__db is not None:
+            self.__db.close()
+            self.__db = None
+
+
+_keyCache = KeyCache()
+
+
+def get_key_cache():
+    """Return the key cache used by passphrase hashing."""
+    return _keyCache
+
+
+def set_key_cache(keyCache):
+    """Use keyCache for passphrase hashing, None disables caching."""
+    global _keyCache
+    _keyCache = keyCache
+
+
+def expand_passphrase(passphrase, hashName) -> bytes:
+    """Return hash of passphrase without consulting the key cache."""
+    repeats = PASSPHRASE_EXPANSION_LENGTH // len(passphrase) + 1
+    hasher = hashlib.new(hashName)
+    hasher.update((passphrase * repeats)[:PASSPHRASE_EXPANSION_LENGTH])
+    return hasher.digest()
+
 
 def hash_passphrase(passphrase, hashFunc) -> univ.OctetString:
     """Return hash of passphrase using hashFunc hash function."""
     passphrase = univ.OctetString(passphrase).asOctets()
-    # noinspection PyDeprecation,PyCallingNonCallable
-    hasher = hashFunc()
-    ringBuffer = passphrase * (64 // len(passphrase) + 1)
-    # noinspection PyTypeChecker
-    ringBufferLen = len(ringBuffer)
-    count = 0
-    mark = 0
-    while count < 16384:
-        e = mark + 64
-        if e < ringBufferLen:
-            hasher.update(ringBuffer[mark:e])
-            mark = e
-        else:
-            hasher.update(
-                ringBuffer[mark:ringBufferLen] + ringBuffer[0 : e - ringBufferLen]
-            )
-            mark = e - ringBufferLen
-        count += 1
-    digest = hasher.digest()
+    hashName = hashFunc().name
+
+    keyCache = _keyCache
+    if keyCache is None:
+        return univ.OctetString(expand_passphrase(passphrase, hashName))
+
+    index = keyCache.get_index(passphrase, hashName)
+    digest = keyCache.get(index)
+    if digest is None:
+        digest = expand_passphrase(passphrase, hashName)
+        keyCache.set(index, digest)
+
     return univ.OctetString(digest)
 
 
+def hash_passphrases(passphrases, hashFunc, executor=None) -> list:
+    """Return hashes of many passphrases using hashFunc hash function.
+
+    Passphrases not found in the key cache get hashed in one go, spread
+    over `executor` (e.g. :py:class:`concurrent.futures.ProcessPoolExecutor`)
+    if given.
+    """
+    passphrases = [univ.OctetString(x).asOctets() for x in passphrases]
+    hashName = hashFunc().name
+
+    keyCache = _keyCache
+    digests = {}
+
+    if keyCache is not None:
+        for passphrase in passphrases:
+            digest = keyCache.get(keyCache.get_index(passphrase, hashName))
+            if digest is not None:
+                digests[passphrase] = digest
+
+    missing = [x for x in dict.fromkeys(passphrases) if x not in digests]
+
+    if executor is None:
+        computed = map(expand_passphrase, missing, [hashName] * len(missing))
+    else:
+        computed = executor.map(
+            expand_passphrase,
+            missing,
+            [hashName] * len(missing),
+            chunksize=max(1, len(missing) // 64),
+        )
+
+    for passphrase, digest in zip(missing, computed):
+        digests[passphrase] = digest
+        if keyCache is not None:
+            keyCache.set(keyCache.get_index(passphrase, hashName), digest)
+
+    return [univ.OctetString(digests[x]) for x in passphrases]
+
+
 def password_to_key(passphrase, snmpEngineId, hashFunc) -> univ.OctetString:
     """Return key from password."""
     return localize_key(hash_passphrase(passphrase, hashFunc), snmpEngineId, hashFunc)
@@ -12,11 +12,12 @@ import time
 from typing import TYPE_CHECKING
 
 
-from pyasn1.codec.ber import decoder, encoder, eoo
+from pyasn1.codec.ber import eoo
 from pyasn1.error import PyAsn1Error
 from pyasn1.type import constraint, namedtype, univ
 from pysnmp import debug
 from pysnmp.proto import api, errind, error, rfc1155, rfc3411
+from pysnmp.proto.api import msgdec, msgenc
 from pysnmp.proto.secmod.base import AbstractSecurityModel
 from pysnmp.proto.secmod.eso.priv import aes192, aes256, des3
 from pysnmp.proto.secmod.rfc3414.auth import hmacmd5, hmacsha, noauth
@@ -340,6 +341,44 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
             pysnmpUsmKeyPrivLocalized.syntax,
         )
 
+    @staticmethod
+    def __get_digest_offset(wholeMsg):
+        # The BER encoder does not report where it put the components,
+        # so walk the TLV headers down to msgAuthenticationParameters
+        def skip_header(offset):
+            length = wholeMsg[offset + 1]
+            offset += 2
+            if length & 0x80:
+                size = length & 0x7F
+                if not size:
+                    raise IndexError("indefinite length form")
+                length = int.from_bytes(wholeMsg[offset : offset + size], "big")
+                offset += size
+            return offset, length
+
+        try:
+            # SNMPv3Message
+            offset = skip_header(0)[0]
+
+            # msgVersion, msgGlobalData
+            for _ in range(2):
+                offset = sum(skip_header(offset))
+
+            # msgSecurityParameters, UsmSecurityParameters
+            for _ in range(2):
+                offset = skip_header(offset)[0]
+
+            # msgAuthoritativeEngineID, msgAuthoritativeEngineBoots,
+            # msgAuthoritativeEngineTime, msgUserName
+            for _ in range(4):
+                offset = sum(skip_header(offset))
+
+            # msgAuthenticationParameters
+            return skip_header(offset)[0]
+
+        except IndexError:
+            return
+
     def __generate_request_or_response_message(
         self,
         snmpEngine: "SnmpEngine",
@@ -533,7 +572,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                 (snmpInGenErrs,) = mibBuilder.import_symbols(  # type: ignore
                     "__SNMPv2-MIB", "snmpInGenErrs"
                 )
-                snmpInGenErrs.syntax += 1
+                snmpInGenErrs.count += 1
                 raise error.StatusInformation(errorIndication=errind.invalidMsg)
 
         else:
@@ -710,7 +749,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
             )
 
             try:
-                dataToEncrypt = encoder.encode(scopedPDU)
+                dataToEncrypt = msgenc.encode(scopedPDU)
 
             except PyAsn1Error:
                 debug.logger & debug.FLAG_SM and debug.logger(
@@ -811,7 +850,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
 
             try:
                 msg.setComponentByPosition(
-                    2, encoder.encode(securityParameters), verifyConstraints=False
+                    2, msgenc.encode(securityParameters), verifyConstraints=False
                 )
 
             except PyAsn1Error:
@@ -827,7 +866,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
             )
 
             try:
-                wholeMsg = encoder.encode(msg)
+                wholeMsg = msgenc.encode(msg)
 
             except PyAsn1Error:
                 debug.logger & debug.FLAG_SM and debug.logger(
@@ -838,7 +877,9 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
 
             # noinspection PyUnboundLocalVariable
             authenticatedWholeMsg = authHandler.authenticate_outgoing_message(
-                usmUserAuthKeyLocalized, wholeMsg
+                usmUserAuthKeyLocalized,
+                wholeMsg,
+                digestOffset=self.__get_digest_offset(wholeMsg),
             )
 
         # 3.1.8b
@@ -854,7 +895,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
             try:
                 msg.setComponentByPosition(
                     2,
-                    encoder.encode(securityParameters),
+                    msgenc.encode(securityParameters),
                     verifyConstraints=False,
                     matchTags=False,
                     matchConstraints=False,
@@ -872,7 +913,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                     "__generateRequestOrResponseMsg: plain outgoing msg: %s"
                     % msg.prettyPrint()
                 )
-                authenticatedWholeMsg = encoder.encode(msg)
+                authenticatedWholeMsg = msgenc.encode(msg)
 
             except PyAsn1Error:
                 debug.logger & debug.FLAG_SM and debug.logger(
@@ -973,7 +1014,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
         )
 
         # 3.2.1
-        securityParameters, rest = decoder.decode(
+        securityParameters, rest = msgdec.decode(
             securityParameters, asn1Spec=self.__securityParametersSpec
         )
 
@@ -1030,7 +1071,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                 (usmStatsUnknownEngineIDs,) = mibBuilder.import_symbols(  # type: ignore
                     "__SNMP-USER-BASED-SM-MIB", "usmStatsUnknownEngineIDs"
                 )
-                usmStatsUnknownEngineIDs.syntax += 1
+                usmStatsUnknownEngineIDs.count += 1
                 debug.logger & debug.FLAG_SM and debug.logger(
                     "processIncomingMsg: null or malformed msgAuthoritativeEngineId"
                 )
@@ -1132,7 +1173,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                     (usmStatsUnknownUserNames,) = mibBuilder.import_symbols(  # type: ignore
                         "__SNMP-USER-BASED-SM-MIB", "usmStatsUnknownUserNames"
                     )
-                    usmStatsUnknownUserNames.syntax += 1
+                    usmStatsUnknownUserNames.count += 1
 
                     raise error.StatusInformation(
                         errorIndication=errind.unknownSecurityName,
@@ -1153,7 +1194,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                 (snmpInGenErrs,) = mibBuilder.import_symbols(  # type: ignore
                     "__SNMPv2-MIB", "snmpInGenErrs"
                 )
-                snmpInGenErrs.syntax += 1
+                snmpInGenErrs.count += 1
                 raise error.StatusInformation(errorIndication=errind.invalidMsg)
         else:
             # empty username used for engineID discovery
@@ -1231,7 +1272,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                 (usmStatsUnsupportedSecLevels,) = mibBuilder.import_symbols(  # type: ignore
                     "__SNMP-USER-BASED-SM-MIB", "usmStatsUnsupportedSecLevels"
                 )
-                usmStatsUnsupportedSecLevels.syntax += 1
+                usmStatsUnsupportedSecLevels.count += 1
                 debug.logger & debug.FLAG_SM and debug.logger(
                     "processIncomingMsg: reporting inappropriate security level for user {}: {}".format(
                         msgUserName, badSecIndication
@@ -1262,7 +1303,10 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                 hash = securityParameters.getComponentByPosition(4)
                 try:
                     authHandler.authenticate_incoming_message(
-                        usmUserAuthKeyLocalized, hash, wholeMsg
+                        usmUserAuthKeyLocalized,
+                        hash,
+                        wholeMsg,
+                        digestOffset=self.__get_digest_offset(wholeMsg),
                     )
 
                 except error.StatusInformation:
@@ -1272,7 +1316,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                         (usmStatsWrongDigests,) = mibBuilder.import_symbols(  # type: ignore
                             "__SNMP-USER-BASED-SM-MIB", "usmStatsWrongDigests"
                         )
-                        usmStatsWrongDigests.syntax += 1
+                        usmStatsWrongDigests.count += 1
                         raise error.StatusInformation(
                             errorIndication=errind.authenticationFailure,
                             oid=usmStatsWrongDigests.name,
@@ -1297,15 +1341,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                 int(time.time()),
             )
 
-            timerResolution = (
-                snmpEngine.transport_dispatcher is None
-                and 1.0
-                or snmpEngine.transport_dispatcher.get_timer_resolution()  # type: ignore
-            )
-            expireAt = int(self.__expirationTimer + 300 / timerResolution)
-            if expireAt not in self.__timelineExpQueue:
-                self.__timelineExpQueue[expireAt] = []
-            self.__timelineExpQueue[expireAt].append(msgAuthoritativeEngineId)
+            self.__schedule_timeline_expiration(snmpEngine, msgAuthoritativeEngineId)
 
             debug.logger & debug.FLAG_SM and debug.logger(
                 f"processIncomingMsg: store timeline for securityEngineID {msgAuthoritativeEngineId!r}"
@@ -1361,7 +1397,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                     (usmStatsNotInTimeWindows,) = mibBuilder.import_symbols(  # type: ignore
                         "__SNMP-USER-BASED-SM-MIB", "usmStatsNotInTimeWindows"
                     )
-                    usmStatsNotInTimeWindows.syntax += 1
+                    usmStatsNotInTimeWindows.count += 1
                     raise error.StatusInformation(
                         errorIndication=errind.notInTimeWindow,
                         oid=usmStatsNotInTimeWindows.name,
@@ -1389,15 +1425,9 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                         int(time.time()),
                     )
 
-                    timerResolution = (
-                        snmpEngine.transport_dispatcher is None
-                        and 1.0
-                        or snmpEngine.transport_dispatcher.get_timer_resolution()  # type: ignore
+                    self.__schedule_timeline_expiration(
+                        snmpEngine, msgAuthoritativeEngineId
                     )
-                    expireAt = int(self.__expirationTimer + 300 / timerResolution)
-                    if expireAt not in self.__timelineExpQueue:
-                        self.__timelineExpQueue[expireAt] = []
-                    self.__timelineExpQueue[expireAt].append(msgAuthoritativeEngineId)
 
                     debug.logger & debug.FLAG_SM and debug.logger(
                         "processIncomingMsg: stored timeline msgAuthoritativeEngineBoots {} msgAuthoritativeEngineTime {} for msgAuthoritativeEngineId {!r}".format(
@@ -1454,7 +1484,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                 (usmStatsDecryptionErrors,) = mibBuilder.import_symbols(  # type: ignore
                     "__SNMP-USER-BASED-SM-MIB", "usmStatsDecryptionErrors"
                 )
-                usmStatsDecryptionErrors.syntax += 1
+                usmStatsDecryptionErrors.count += 1
                 raise error.StatusInformation(
                     errorIndication=errind.decryptionError,
                     oid=usmStatsDecryptionErrors.name,
@@ -1470,7 +1500,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                 0
             ).getComponentByPosition(0)
             try:
-                scopedPDU, rest = decoder.decode(decryptedData, asn1Spec=scopedPduSpec)
+                scopedPDU, rest = msgdec.decode(decryptedData, asn1Spec=scopedPduSpec)
 
             except PyAsn1Error:
                 debug.logger & debug.FLAG_SM and debug.logger(
@@ -1480,7 +1510,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                 (usmStatsDecryptionErrors,) = mibBuilder.import_symbols(  # type: ignore
                     "__SNMP-USER-BASED-SM-MIB", "usmStatsDecryptionErrors"
                 )
-                usmStatsDecryptionErrors.syntax += 1
+                usmStatsDecryptionErrors.count += 1
                 raise error.StatusInformation(
                     errorIndication=errind.decryptionError,
                     oid=usmStatsDecryptionErrors.name,
@@ -1523,7 +1553,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
             (usmStatsUnknownUserNames,) = mibBuilder.import_symbols(  # type: ignore
                 "__SNMP-USER-BASED-SM-MIB", "usmStatsUnknownUserNames"
             )
-            usmStatsUnknownUserNames.syntax += 1
+            usmStatsUnknownUserNames.count += 1
             raise error.StatusInformation(
                 errorIndication=errind.unknownSecurityName,
                 oid=usmStatsUnknownUserNames.name,
@@ -1547,17 +1577,40 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
             securityStateReference,
         )
 
-    def __expire_timeline_info(self):
-        if self.__expirationTimer in self.__timelineExpQueue:
-            for engineIdKey in self.__timelineExpQueue[self.__expirationTimer]:
-                if engineIdKey in self.__timeline:
-                    del self.__timeline[engineIdKey]
-                    debug.logger & debug.FLAG_SM and debug.logger(
-                        f"__expireTimelineInfo: expiring {engineIdKey!r}"
-                    )
-            del self.__timelineExpQueue[self.__expirationTimer]
-        self.__expirationTimer += 1
+    def __schedule_timeline_expiration(self, snmpEngine: "SnmpEngine", engineIdKey):
+        if snmpEngine.transport_dispatcher is None:
+            expireAt = int(self.__expirationTimer + 300)
+        else:
+            expireAt = int(
+                max(
+                    self.__expirationTimer,
+                    snmpEngine.transport_dispatcher.get_timer_ticks(),
+                )
+                + 300 / snmpEngine.transport_dispatcher.get_timer_resolution()
+            )
+            snmpEngine.transport_dispatcher.request_timer_tick(expireAt)
+
+        if expireAt not in self.__timelineExpQueue:
+            self.__timelineExpQueue[expireAt] = []
+        self.__timelineExpQueue[expireAt].append(engineIdKey)
+
+    def __expire_timeline_info(self, timerTicks):
+        # Timer ticks may leap when timer ticks are scheduled on demand
+        while self.__expirationTimer <= timerTicks:
+            if self.__expirationTimer in self.__timelineExpQueue:
+                for engineIdKey in self.__timelineExpQueue[self.__expirationTimer]:
+                    if engineIdKey in self.__timeline:
+                        del self.__timeline[engineIdKey]
+                        debug.logger & debug.FLAG_SM and debug.logger(
+                            f"__expireTimelineInfo: expiring {engineIdKey!r}"
+                        )
+                del self.__timelineExpQueue[self.__expirationTimer]
+
+            if not self.__timelineExpQueue:
+                self.__expirationTimer = int(timerTicks)
+
+            self.__expirationTimer += 1
 
     def receive_timer_tick(self, snmpEngine: "SnmpEngine", timeNow):
         """Receive timer ticks from the transport layer."""
-        self.__expire_timeline_info()
+        self.__expire_timeline_info(snmpEngine.transport_dispatcher.get_timer_ticks())
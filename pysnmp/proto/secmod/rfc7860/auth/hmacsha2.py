@@ -6,6 +6,7 @@
 #
 import hmac
 import sys
+import weakref
 from hashlib import sha224, sha256, sha384, sha512
 
 from pyasn1.type import univ
@@ -58,6 +59,23 @@ class HmacSha2(base.AbstractAuthenticationService):
         self.__hashAlgo = self.HASH_ALGORITHM[oid]
         self.__digestLength = self.DIGEST_LENGTH[oid]
         self.__placeHolder = univ.OctetString((0,) * self.__digestLength).asOctets()
+        self.__keyedHashes = weakref.WeakKeyDictionary()
+
+    def __get_keyed_hash(self, authKey):
+        # Keyed HMAC object gets copied for each message rather than
+        # rebuilt from the key. It lives as long as the localized key
+        # object does, which is kept in the USM user table.
+        try:
+            return self.__keyedHashes[authKey]
+
+        except KeyError:
+            pass
+
+        keyedHash = self.__keyedHashes[authKey] = hmac.new(
+            authKey.asOctets(), digestmod=self.__hashAlgo
+        )
+
+        return keyedHash
 
     def hash_passphrase(self, authKey):
         """Hash a passphrase."""
@@ -73,18 +91,28 @@ class HmacSha2(base.AbstractAuthenticationService):
         return self.__digestLength
 
     # 7.3.1
-    def authenticate_outgoing_message(self, authKey, wholeMsg):
-        """Authenticate outgoing message."""
+    def authenticate_outgoing_message(self, authKey, wholeMsg, digestOffset=None):
+        """Authenticate outgoing message.
+
+        The `digestOffset` is the position of the digest placeholder
+        in `wholeMsg`, the placeholder gets searched for if not given.
+        """
         # 7.3.1.1
-        location = wholeMsg.find(self.__placeHolder)
-        if location == -1:
-            raise error.ProtocolError("Can't locate digest placeholder")
+        location = digestOffset
+        if (
+            location is None
+            or wholeMsg[location : location + self.__digestLength] != self.__placeHolder
+        ):
+            location = wholeMsg.find(self.__placeHolder)
+            if location == -1:
+                raise error.ProtocolError("Can't locate digest placeholder")
         wholeHead = wholeMsg[:location]
         wholeTail = wholeMsg[location + self.__digestLength :]
 
         # 7.3.1.2, 7.3.1.3
         try:
-            mac = hmac.new(authKey.asOctets(), wholeMsg, self.__hashAlgo)
+            mac = self.__get_keyed_hash(authKey).copy()
+            mac.update(wholeMsg)
 
         except errind.ErrorIndication:
             raise error.StatusInformation(errorIndication=sys.exc_info()[1])
@@ -96,23 +124,36 @@ class HmacSha2(base.AbstractAuthenticationService):
         return wholeHead + mac + wholeTail
 
     # 7.3.2
-    def authenticate_incoming_message(self, authKey, authParameters, wholeMsg):
-        """Authenticate incoming message."""
+    def authenticate_incoming_message(
+        self, authKey, authParameters, wholeMsg, digestOffset=None
+    ):
+        """Authenticate incoming message.
+
+        The `digestOffset` is the position of `authParameters` in
+        `wholeMsg`, the digest gets searched for if not given.
+        """
         # 7.3.2.1 & 2
         if len(authParameters) != self.__digestLength:
             raise error.StatusInformation(errorIndication=errind.authenticationError)
 
         # 7.3.2.3
-        location = wholeMsg.find(authParameters.asOctets())
-        if location == -1:
-            raise error.ProtocolError("Can't locate digest in wholeMsg")
+        authParameters = authParameters.asOctets()
+        location = digestOffset
+        if (
+            location is None
+            or wholeMsg[location : location + self.__digestLength] != authParameters
+        ):
+            location = wholeMsg.find(authParameters)
+            if location == -1:
+                raise error.ProtocolError("Can't locate digest in wholeMsg")
         wholeHead = wholeMsg[:location]
         wholeTail = wholeMsg[location + self.__digestLength :]
         authenticatedWholeMsg = wholeHead + self.__placeHolder + wholeTail
 
         # 7.3.2.4
         try:
-            mac = hmac.new(authKey.asOctets(), authenticatedWholeMsg, self.__hashAlgo)
+            mac = self.__get_keyed_hash(authKey).copy()
+            mac.update(authenticatedWholeMsg)
 
         except errind.ErrorIndication:
             raise error.StatusInformation(errorIndication=sys.exc_info()[1])
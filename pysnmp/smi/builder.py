@@ -14,14 +14,11 @@ from typing import Any
 import warnings
 from errno import ENOENT
 from importlib.machinery import BYTECODE_SUFFIXES, SOURCE_SUFFIXES
-from importlib.util import MAGIC_NUMBER as PY_MAGIC_NUMBER
+from importlib.util import MAGIC_NUMBER as PY_MAGIC_NUMBER, cache_from_source
 
-from pysnmp import debug, version as pysnmp_version
+from pysnmp import cache, debug, version as pysnmp_version
 from pysnmp.smi import error
 
-if __debug__:
-    import runpy
-
 
 PY_SUFFIXES = SOURCE_SUFFIXES + BYTECODE_SUFFIXES
 
@@ -67,39 +64,65 @@ class __AbstractMibSource:
     def listdir(self):
         return self._listdir()
 
+    def get_definitions(self, f):
+        """Return MIB module definitions without loading the module.
+
+        Returns `(revision, typeNames, varNames)` as recorded at
+        compile time or `None` if not known.
+        """
+        return None
+
+    @staticmethod
+    def _bytecode_names(f, pycSfx):
+        yield f + pycSfx
+
+        # PEP 3147 location, that is where installers put compiled files
+        try:
+            yield cache_from_source(f + SOURCE_SUFFIXES[0])
+
+        except NotImplementedError:
+            pass
+
     def read(self, f):
         pycTime = pyTime = -1
 
         for pycSfx in BYTECODE_SUFFIXES:
-            try:
-                pycData, pycPath = self._get_data(f + pycSfx, "rb")
+            for pycName in self._bytecode_names(f, pycSfx):
+                try:
+                    pycData, pycPath = self._get_data(pycName, "rb")
+
+                except OSError:
+                    why = sys.exc_info()[1]
+                    if ENOENT == -1 or why.errno == ENOENT:
+                        debug.logger & debug.FLAG_BLD and debug.logger(
+                            f"file {pycName} access error: {why}"
+                        )
 
-            except OSError:
-                why = sys.exc_info()[1]
-                if ENOENT == -1 or why.errno == ENOENT:
-                    debug.logger & debug.FLAG_BLD and debug.logger(
-                        f"file {f + pycSfx} access error: {why}"
-                    )
+                    else:
+                        raise error.MibLoadError(
+                            f"MIB file {pycName} access error: {why}"
+                        )
 
                 else:
-                    raise error.MibLoadError(
-                        f"MIB file {f + pycSfx} access error: {why}"
-                    )
+                    if PY_MAGIC_NUMBER == pycData[:4]:
+                        # PEP 552 header: magic, flags, mtime, size
+                        flags, pycTime = struct.unpack("<LL", pycData[4:12])
+                        if flags:
+                            # hash-based .pyc is only trusted without source
+                            pycTime = 0
+                        pycData = pycData[16:]
+                        debug.logger & debug.FLAG_BLD and debug.logger(
+                            "file %s mtime %d" % (pycPath, pycTime)
+                        )
+                        break
 
-            else:
-                if PY_MAGIC_NUMBER == pycData[:4]:
-                    pycData = pycData[4:]
-                    pycTime = struct.unpack("<L", pycData[:4])[0]
-                    pycData = pycData[4:]
-                    debug.logger & debug.FLAG_BLD and debug.logger(
-                        "file %s mtime %d" % (pycPath, pycTime)
-                    )
-                    break
+                    else:
+                        debug.logger & debug.FLAG_BLD and debug.logger(
+                            "bad magic in %s" % pycPath
+                        )
 
-                else:
-                    debug.logger & debug.FLAG_BLD and debug.logger(
-                        "bad magic in %s" % pycPath
-                    )
+            if pycTime != -1:
+                break
 
         for pySfx in SOURCE_SUFFIXES:
             try:
@@ -128,7 +151,8 @@ class __AbstractMibSource:
 
         if pyTime != -1:
             modData, pyPath = self._get_data(f + pySfx, "r")
-            return compile(modData, pyPath, "exec"), pyPath
+            # Real file name lets debuggers stop at breakpoints in MIBs
+            return compile(modData, self.full_path(f, pySfx), "exec"), pyPath
 
         raise OSError(ENOENT, "No suitable module found", f)
 
@@ -238,7 +262,9 @@ class DirMibSource(__AbstractMibSource):
     def _get_data(self, f, mode):
         p = os.path.join(self._srcName, "*")
         try:
-            if f in os.listdir(self._srcName):  # make FS case-sensitive
+            d, n = os.path.split(f)
+            # make FS case-sensitive
+            if n in os.listdir(os.path.join(self._srcName, d)):
                 p = os.path.join(self._srcName, f)
                 fp = open(p, mode)
                 data = fp.read()
@@ -256,6 +282,65 @@ class DirMibSource(__AbstractMibSource):
         raise OSError(ENOENT, msg)
 
 
+class SnapshotMibSource(__AbstractMibSource):
+    """MIB snapshot source.
+
+    Serves compiled MIB modules out of a single snapshot file written
+    by :py:meth:`MibBuilder.save_snapshot`. Modules are unmarshalled
+    one by one as they get loaded.
+    """
+
+    def _init(self):
+        try:
+            with open(self._srcName, "rb") as fp:
+                snapshot = marshal.load(fp)
+
+        except (OSError, EOFError, ValueError, TypeError):
+            why = sys.exc_info()[1]
+            raise error.MibLoadError(
+                f"MIB snapshot {self._srcName} access error: {why}"
+            )
+
+        if snapshot.get("magic") == PY_MAGIC_NUMBER:
+            self.__modules = snapshot.get("modules", {})
+            self.__definitions = snapshot.get("definitions", {})
+
+        else:
+            # Compiled code is Python version specific
+            debug.logger & debug.FLAG_BLD and debug.logger(
+                "bad magic in %s" % self._srcName
+            )
+            self.__modules = {}
+            self.__definitions = {}
+
+        self.__index = snapshot.get("index")
+
+        return self
+
+    def get_index(self):
+        """Return opaque MIB index data stored in the snapshot."""
+        return self.__index
+
+    def get_definitions(self, f):
+        """Return MIB module definitions recorded in the snapshot."""
+        return self.__definitions.get(f)
+
+    def _listdir(self):
+        return tuple(self.__modules)
+
+    def read(self, f):
+        if f not in self.__modules:
+            raise OSError(ENOENT, "No such module in MIB snapshot", f)
+
+        return marshal.loads(self.__modules[f]), BYTECODE_SUFFIXES[0]
+
+    def _get_timestamp(self, f):
+        raise OSError(ENOENT, "No files in MIB snapshot", f)
+
+    def _get_data(self, f, mode):
+        raise OSError(ENOENT, "No files in MIB snapshot", f)
+
+
 class MibBuilder:
     """MIB builder."""
 
@@ -269,9 +354,16 @@ class MibBuilder:
 
     loadTexts = False  # noqa: N815
 
+    # Defer MIB modules execution till their symbols are imported, for
+    # MIB sources that know MIB modules definitions (MIB snapshots)
+    lazyLoad = False  # noqa: N815
+
     # MIB modules can use this to select the features they can use
     version = pysnmp_version
 
+    # Upper bound on the number of cached import_symbols() results
+    MAX_IMPORTED_SYMBOLS = 1024
+
     __mib_sources: list["ZipMibSource | DirMibSource"]
 
     def __init__(self):
@@ -288,6 +380,16 @@ class MibBuilder:
         for m in self.DEFAULT_CORE_MIBS.split(os.pathsep):
             sources.insert(0, ZipMibSource(m))
         self.mibSymbols = {}
+        # Module name -> lastBuildId of last change to module definitions,
+        # managed objects instances do not count
+        self.moduleBuildIds = {}
+        # Module name -> (revision, typeNames, varNames) of MIB modules
+        # loaded, but not executed yet
+        self.lazyModules = {}
+        self.__lazyModSources = {}
+        # (module name, symbol names) -> symbols, valid till next MIB change
+        self.__importedSymbols = cache.Cache(self.MAX_IMPORTED_SYMBOLS)
+        self.__importedBuildId = 0
         self.__mib_sources = []
         self.__modSeen = {}
         self.__modPathsSeen = set()
@@ -352,6 +454,22 @@ class MibBuilder:
             else:
                 self.__modPathsSeen.add(modPath)
 
+            definitions = self.lazyLoad and mibSource.get_definitions(modName)
+
+            if definitions:
+                self.lazyModules[modName] = definitions
+                self.__lazyModSources[modName] = mibSource, userCtx
+                self.__modSeen[modName] = modPath
+
+                self.lastBuildId += 1
+                self.moduleBuildIds[modName] = self.lastBuildId
+
+                debug.logger & debug.FLAG_BLD and debug.logger(
+                    "loadModule: deferred %s" % modPath
+                )
+
+                break
+
             debug.logger & debug.FLAG_BLD and debug.logger(
                 "loadModule: evaluating %s" % modPath
             )
@@ -359,12 +477,7 @@ class MibBuilder:
             g = {"mibBuilder": self, "userCtx": userCtx}
 
             try:
-                if __debug__:
-                    runpy.run_path(
-                        modPath, g
-                    )  # IMPORTANT: enable break points in loaded MIBs
-                else:
-                    exec(codeObj, g)
+                exec(codeObj, g)
 
             except Exception:
                 self.__modPathsSeen.remove(modPath)
@@ -390,6 +503,42 @@ class MibBuilder:
 
         return self
 
+    def __load_lazy_module(self, modName):
+        mibSource, userCtx = self.__lazyModSources.pop(modName)
+        del self.lazyModules[modName]
+
+        modPath = self.__modSeen[modName]
+
+        debug.logger & debug.FLAG_BLD and debug.logger(
+            "loadModule: evaluating deferred %s" % modPath
+        )
+
+        g = {"mibBuilder": self, "userCtx": userCtx}
+
+        try:
+            codeObj, sfx = mibSource.read(modName)
+            exec(codeObj, g)
+
+        except Exception:
+            self.__modPathsSeen.remove(modPath)
+            del self.__modSeen[modName]
+            raise error.MibLoadError(
+                f"MIB module '{modPath}' load error: {traceback.format_exception(*sys.exc_info())}"
+            )
+
+        finally:
+            self.lastBuildId += 1
+            self.moduleBuildIds[modName] = self.lastBuildId
+
+    def load_deferred_modules(self, *modNames):
+        """Execute MIB modules deferred by lazyLoad, all of them by default."""
+        for modName in modNames or list(self.lazyModules):
+            # Could have been executed as a dependency of another one
+            if modName in self.lazyModules:
+                self.__load_lazy_module(modName)
+
+        return self
+
     def load_modules(self, *modNames, **userCtx):
         """Load (optionally, compiling) pysnmp MIB modules."""
         # Build a list of available modules
@@ -436,14 +585,72 @@ class MibBuilder:
 
         return self
 
+    def save_snapshot(self, path, index=None):
+        """Save compiled code of loaded MIB modules into a snapshot file.
+
+        The snapshot can then be used as a MIB source by other
+        processes, see :py:class:`SnapshotMibSource`. Optional `index`
+        is an opaque, marshallable piece of data to store alongside.
+        """
+        modules = {}
+
+        for modName in self.__modSeen:
+            for mibSource in self.__mib_sources:
+                try:
+                    codeObj, sfx = mibSource.read(modName)
+
+                except OSError:
+                    continue
+
+                modules[modName] = marshal.dumps(codeObj)
+                break
+
+        definitions = {}
+
+        for modName in modules:
+            if modName in self.mibSymbols or modName in self.lazyModules:
+                revision, typeNames, varNames = self.get_module_definitions(modName)
+                definitions[modName] = revision, tuple(sorted(typeNames)), varNames
+
+        snapshot = {
+            "magic": PY_MAGIC_NUMBER,
+            "modules": modules,
+            "definitions": definitions,
+            "index": index,
+        }
+
+        tmpPath = f"{path}.{os.getpid()}"
+
+        try:
+            with open(tmpPath, "wb") as fp:
+                marshal.dump(snapshot, fp)
+
+            os.replace(tmpPath, path)
+
+        except OSError:
+            why = sys.exc_info()[1]
+            if os.path.exists(tmpPath):
+                os.remove(tmpPath)
+            raise error.MibLoadError(f"MIB snapshot {path} write error: {why}")
+
+        debug.logger & debug.FLAG_BLD and debug.logger(
+            f"saveSnapshot: saved {len(modules)} modules into {path}"
+        )
+
     def unload_modules(self, *modNames):
         """Unload MIB modules."""
         if not modNames:
-            modNames = list(self.mibSymbols.keys())
+            modNames = list(self.mibSymbols.keys()) + list(self.lazyModules)
         for modName in modNames:
-            if modName not in self.mibSymbols:
+            if modName in self.lazyModules:
+                del self.lazyModules[modName]
+                del self.__lazyModSources[modName]
+                self.lastBuildId += 1
+                self.moduleBuildIds[modName] = self.lastBuildId
+            elif modName in self.mibSymbols:
+                self.unexport_symbols(modName)
+            else:
                 raise error.MibNotFoundError(f"No module {modName} at {self}")
-            self.unexport_symbols(modName)
             self.__modPathsSeen.remove(self.__modSeen[modName])
             del self.__modSeen[modName]
 
@@ -455,26 +662,86 @@ class MibBuilder:
 
     def import_symbols(self, modName, *symNames, **userCtx) -> "tuple[Any, ...]":
         """Import MIB symbols."""
+        if self.__importedBuildId == self.lastBuildId:
+            try:
+                return self.__importedSymbols[(modName, symNames)]
+
+            except KeyError:
+                pass
+
+        else:
+            self.__importedSymbols.clear()
+            self.__importedBuildId = self.lastBuildId
+
         if not modName:
             raise error.SmiError("importSymbols: empty MIB module name")
         r = ()
         for symName in symNames:
             if modName not in self.mibSymbols:
                 self.load_modules(modName, **userCtx)
+                if modName in self.lazyModules:
+                    self.__load_lazy_module(modName)
             if modName not in self.mibSymbols:
                 raise error.MibNotFoundError(f"No module {modName} loaded at {self}")
             if symName not in self.mibSymbols[modName]:
                 raise error.SmiError(f"No symbol {modName}::{symName} at {self}")
             r = r + (self.mibSymbols[modName][symName],)
+
+        # MIB modules might have just been loaded
+        if self.__importedBuildId == self.lastBuildId:
+            self.__importedSymbols[(modName, symNames)] = r
+
         return r
 
+    def get_module_definitions(self, modName):
+        """Return MIB module revision, types and MIB variables.
+
+        Returns `(revision, typeNames, varNames)` tuple, where `varNames`
+        maps MIB variables names into their OIDs. Managed objects
+        instances are left out. Deferred MIB modules do not get
+        executed by this call.
+        """
+        if modName in self.lazyModules:
+            revision, typeNames, varNames = self.lazyModules[modName]
+            return revision, set(typeNames), dict(varNames)
+
+        if modName not in self.mibSymbols:
+            raise error.MibNotFoundError(f"No module {modName} at {self}")
+
+        revision = "1970-01-01 00:00"
+        typeNames = set()
+        varNames = {}
+
+        for symName, symObj in self.mibSymbols[modName].items():
+            if symName == self.module_id:
+                revisions = symObj.getRevisions()
+                if revisions:
+                    revision = revisions[0][0]
+            elif isinstance(symObj, classTypes):
+                typeNames.add(symName)
+            elif self.__is_definition(symObj):
+                varNames[symName] = symObj.name
+
+        return revision, typeNames, varNames
+
+    def __is_definition(self, symObj):
+        # Scalar instances are only relevant to MIB instrumentation
+        MibScalarInstance = self.mibSymbols.get("SNMPv2-SMI", {}).get(
+            "MibScalarInstance"
+        )
+        return MibScalarInstance is None or not isinstance(symObj, MibScalarInstance)
+
     def export_symbols(self, modName, *anonymousSyms, **namedSyms):
         """Export MIB symbols."""
         if modName not in self.mibSymbols:
             self.mibSymbols[modName] = {}
+            isDefinition = True
+        else:
+            isDefinition = False
         mibSymbols = self.mibSymbols[modName]
 
         for symObj in anonymousSyms:
+            isDefinition = isDefinition or self.__is_definition(symObj)
             debug.logger & debug.FLAG_BLD and debug.logger(
                 "export_symbols: anonymous symbol %s::__pysnmp_%ld"
                 % (modName, self._autoName)
@@ -494,12 +761,17 @@ class MibBuilder:
 
             mibSymbols[symName] = symObj
 
+            isDefinition = isDefinition or self.__is_definition(symObj)
+
             debug.logger & debug.FLAG_BLD and debug.logger(
                 f"export_symbols: symbol {modName}::{symName}"
             )
 
         self.lastBuildId += 1
 
+        if isDefinition:
+            self.moduleBuildIds[modName] = self.lastBuildId
+
     def unexport_symbols(self, modName, *symNames):
         """Unexport MIB symbols."""
         if modName not in self.mibSymbols:
@@ -507,9 +779,11 @@ class MibBuilder:
         mibSymbols = self.mibSymbols[modName]
         if not symNames:
             symNames = list(mibSymbols.keys())
+        isDefinition = False
         for symName in symNames:
             if symName not in mibSymbols:
                 raise error.SmiError(f"No symbol {modName}::{symName} at {self}")
+            isDefinition = isDefinition or self.__is_definition(mibSymbols[symName])
             del mibSymbols[symName]
 
             debug.logger & debug.FLAG_BLD and debug.logger(
@@ -518,9 +792,13 @@ class MibBuilder:
 
         if not self.mibSymbols[modName]:
             del self.mibSymbols[modName]
+            isDefinition = True
 
         self.lastBuildId += 1
 
+        if isDefinition:
+            self.moduleBuildIds[modName] = self.lastBuildId
+
     # Compatibility API
     deprecated_attributes = {
         "importSymbols": "import_symbols",
@@ -5,16 +5,25 @@
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
 import warnings
-from bisect import bisect
+from bisect import bisect, bisect_left, insort
 
 
 class OrderedDict(dict):
-    """Ordered dictionary used for indices."""
+    """Ordered dictionary used for indices.
+
+    Keys are kept in a sorted list that is maintained incrementally on
+    insertion and removal, so that successor lookups never trigger a full
+    re-sort. Bulk updates append keys and sort them once on next access.
+    """
+
+    __slots__ = ("__keys", "__keysLens", "__keysLensOrder", "__dirty")
 
     def __init__(self, *args, **kwargs):
         """Create an ordered dictionary."""
         self.__keys = []
-        self.__dirty = True
+        self.__keysLens = {}
+        self.__keysLensOrder = []
+        self.__dirty = False
         super().__init__()
         if args:
             self.update(*args)
@@ -24,22 +33,22 @@ class OrderedDict(dict):
     def __setitem__(self, key, value):
         """Set an item in the dictionary."""
         if key not in self:
-            self.__keys.append(key)
-            self.__dirty = True
+            self.__add_key(key)
         super().__setitem__(key, value)
 
     def __delitem__(self, key):
         """Delete an item from the dictionary."""
         if key in self:
-            self.__keys.remove(key)
-            self.__dirty = True
+            self.__remove_key(key)
         super().__delitem__(key)
 
     def clear(self):
         """Clear the dictionary."""
         super().clear()
         self.__keys = []
-        self.__dirty = True
+        self.__keysLens = {}
+        self.__keysLensOrder = []
+        self.__dirty = False
 
     def keys(self):
         """Return the keys in the dictionary."""
@@ -61,6 +70,9 @@ class OrderedDict(dict):
 
     def update(self, *args, **kwargs):
         """Update the dictionary."""
+        # Defer ordering of bulk-added keys to a single sort on next access
+        self.__dirty = True
+
         if args:
             iterable = args[0]
             if hasattr(iterable, "keys"):
@@ -74,13 +86,50 @@ class OrderedDict(dict):
             for k in kwargs:
                 self[k] = kwargs[k]
 
+    def __reduce__(self):
+        """Pickle by ordered items."""
+        return self.__class__, (self.items(),)
+
+    def sorting_key(self, key):
+        """Return the value the key is ordered by."""
+        return key
+
     def sorting_function(self, keys):
         """Sort the keys in the dictionary."""
-        keys.sort()
+        keys.sort(key=self.sorting_key)
+
+    def __add_key(self, key):
+        if self.__dirty:
+            self.__keys.append(key)
+        else:
+            insort(self.__keys, key, key=self.sorting_key)
+
+        keyLen = len(key)
+        if keyLen in self.__keysLens:
+            self.__keysLens[keyLen] += 1
+        else:
+            self.__keysLens[keyLen] = 1
+            self.__keysLensOrder = sorted(self.__keysLens, reverse=True)
+
+    def __remove_key(self, key):
+        if self.__dirty:
+            self.__order()
+
+        keys = self.__keys
+        idx = bisect_left(keys, self.sorting_key(key), key=self.sorting_key)
+        if idx < len(keys) and keys[idx] == key:
+            del keys[idx]
+        else:
+            keys.remove(key)
+
+        keyLen = len(key)
+        self.__keysLens[keyLen] -= 1
+        if not self.__keysLens[keyLen]:
+            del self.__keysLens[keyLen]
+            self.__keysLensOrder = sorted(self.__keysLens, reverse=True)
 
     def __order(self):
         self.sorting_function(self.__keys)
-        self.__keysLens = sorted({len(k) for k in self.__keys}, reverse=True)
         self.__dirty = False
 
     def next_key(self, key):
@@ -100,9 +149,7 @@ class OrderedDict(dict):
 
     def get_keys_lengths(self):
         """Return the keys lengths in the dictionary."""
-        if self.__dirty:
-            self.__order()
-        return self.__keysLens
+        return self.__keysLensOrder
 
     # Compatibility API
     # compatibility with legacy code
@@ -129,6 +176,8 @@ class OrderedDict(dict):
 class OidOrderedDict(OrderedDict):
     """OID-ordered dictionary used for indices."""
 
+    __slots__ = ("__keysCache",)
+
     def __init__(self, *args, **kwargs):
         """Create an OID-ordered dictionary."""
         self.__keysCache = {}
@@ -136,12 +185,10 @@ class OidOrderedDict(OrderedDict):
 
     def __setitem__(self, key, value):
         """Set an item in the dictionary."""
+        # OID tuples are their own sorting keys
+        if not isinstance(key, tuple) and key not in self.__keysCache:
+            self.__keysCache[key] = [int(x) for x in key.split(".") if x]
         OrderedDict.__setitem__(self, key, value)
-        if key not in self.__keysCache:
-            if isinstance(key, tuple):
-                self.__keysCache[key] = key
-            else:
-                self.__keysCache[key] = [int(x) for x in key.split(".") if x]
 
     def __delitem__(self, key):
         """Delete an item from the dictionary."""
@@ -149,6 +196,13 @@ class OidOrderedDict(OrderedDict):
         if key in self.__keysCache:
             del self.__keysCache[key]
 
-    def sorting_function(self, keys):
-        """Sort the keys in the dictionary."""
-        keys.sort(key=lambda k, d=self.__keysCache: d[k])
+    def clear(self):
+        """Clear the dictionary."""
+        OrderedDict.clear(self)
+        self.__keysCache.clear()
+
+    def sorting_key(self, key):
+        """Return the value the key is ordered by."""
+        if isinstance(key, tuple):
+            return key
+        return self.__keysCache[key]
@@ -9,7 +9,7 @@ import traceback
 import warnings
 
 from pysnmp import debug
-from pysnmp.smi import error
+from pysnmp.smi import error, exval
 from pysnmp.smi.builder import MibBuilder
 
 __all__ = ["AbstractMibInstrumController", "MibInstrumController"]
@@ -26,6 +26,60 @@ class AbstractMibInstrumController:
         """Read next MIB variables."""
         raise error.EndOfMibViewError(idx=0)
 
+    def read_bulk_variables(self, nonRepeaters, maxRepetitions, *varBinds, **context):
+        """Read next MIB variables the GETBULK way.
+
+        Variables following the first `nonRepeaters` of `varBinds` get
+        read once, then the rest get traversed for up to `maxRepetitions`
+        rounds, each round resuming from where the previous one ended.
+        Repetitions stop early once all the variables of a round are
+        past the end of MIB.
+
+        A callable passed as `budgetFun` context item gets invoked on each
+        variable read. Once it returns False, the variable is dropped and
+        the reading stops.
+        """
+        budgetFun = context.pop("budgetFun", None)
+
+        outputVarBinds = []
+
+        nonRepeaters = min(nonRepeaters, len(varBinds))
+
+        if not self._read_bulk_round(
+            0, varBinds[:nonRepeaters], outputVarBinds, budgetFun, **context
+        ):
+            return outputVarBinds
+
+        roundVarBinds = varBinds[nonRepeaters:]
+
+        for _ in range(roundVarBinds and maxRepetitions or 0):
+            if not self._read_bulk_round(
+                nonRepeaters, roundVarBinds, outputVarBinds, budgetFun, **context
+            ):
+                break
+
+            roundVarBinds = outputVarBinds[-len(roundVarBinds) :]
+
+            # rfc1905: 4.2.3 - nothing left to repeat
+            if all(val.isSameTypeWith(exval.endOfMibView) for _, val in roundVarBinds):
+                break
+
+        return outputVarBinds
+
+    def _read_bulk_round(self, offset, varBinds, outputVarBinds, budgetFun, **context):
+        """Read next MIB variables of a GETBULK round into `outputVarBinds`.
+
+        Return False once out of budget.
+        """
+        if varBinds:
+            for varBind in self.read_next_variables(*varBinds, **context):
+                if budgetFun is not None and not budgetFun(varBind):
+                    return False
+
+                outputVarBinds.append(varBind)
+
+        return True
+
     def write_variables(self, *varBinds, **context):
         """Write MIB variables."""
         raise error.NoSuchObjectError(idx=0)
@@ -82,6 +136,11 @@ class MibInstrumController(AbstractMibInstrumController):
     # MIB indexing
 
     def __index_mib(self):
+        # Managed objects of MIB modules deferred by lazyLoad get indexed
+        # along with the rest, so deferred modules have to be executed
+        while self.__mib_builder.lazyModules:
+            self.__mib_builder.load_deferred_modules()
+
         # Build a tree from MIB objects found at currently loaded modules
         if self.lastBuildId == self.__mib_builder.lastBuildId:
             return
@@ -280,9 +339,52 @@ class MibInstrumController(AbstractMibInstrumController):
         return self.flip_flop_fsm(self.fsm_read_variable, *varBinds, **context)
 
     def read_next_variables(self, *varBinds, **context):
-        """Read next MIB variables."""
+        """Read next MIB variables.
+
+        A dict passed as `cursor` context item gets populated with MIB
+        tree positions of the returned variables. Passing the same dict
+        to a subsequent call resumes the traversal from those positions.
+        """
         return self.flip_flop_fsm(self.fsm_read_next_variable, *varBinds, **context)
 
+    def read_bulk_variables(self, nonRepeaters, maxRepetitions, *varBinds, **context):
+        """Read next MIB variables the GETBULK way.
+
+        Same as :py:meth:`AbstractMibInstrumController.read_bulk_variables`,
+        with each round resuming from the MIB tree positions the previous
+        one ended at.
+        """
+        self.__index_mib()
+
+        context.pop("idx", None)
+        context.setdefault("cursor", {})
+
+        return AbstractMibInstrumController.read_bulk_variables(
+            self, nonRepeaters, maxRepetitions, *varBinds, **context
+        )
+
+    def _read_bulk_round(self, offset, varBinds, outputVarBinds, budgetFun, **context):
+        # Same as flip_flop_fsm() run by the read next FSM table
+        (mibTree,) = self.__mib_builder.import_symbols("SNMPv2-SMI", "iso")  # type: ignore
+
+        varBinds = [(tuple(name), val) for name, val in varBinds]
+
+        for idx, varBind in enumerate(varBinds):
+            mibTree.readTestNext(varBind, idx=offset + idx, **context)
+
+        for idx, varBind in enumerate(varBinds):
+            varBind = mibTree.readGetNext(varBind, idx=offset + idx, **context)
+
+            if budgetFun is not None and not budgetFun(varBind):
+                debug.logger & debug.FLAG_INS and debug.logger(
+                    f"readBulkVars: out of budget at {varBind[0]}"
+                )
+                return False
+
+            outputVarBinds.append(varBind)
+
+        return True
+
     def write_variables(self, *varBinds, **context):
         """Write MIB variables."""
         return self.flip_flop_fsm(self.fsm_write_variable, *varBinds, **context)
@@ -12,6 +12,7 @@
 # IMPORTANT: this contains customizations
 import sys
 import traceback
+from bisect import bisect_left, bisect_right
 
 from pyasn1.error import PyAsn1Error
 from pyasn1.type import namedtype, univ
@@ -408,9 +409,16 @@ class MibTree(ObjectType):
     branchVersionId = 0  # cnanges on tree structure change
     maxAccess = "not-accessible"
 
-    def __init__(self, name, syntax=None):
-        ObjectType.__init__(self, name, syntax)
-        self._vars = OidOrderedDict()
+    def __getattr__(self, attr):
+        # Most MIB tree nodes never get children (e.g. MIB objects
+        # definitions, managed objects instances), create children
+        # map on first use
+        if attr == "_vars":
+            self._vars = OidOrderedDict()
+            return self._vars
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{attr}'"
+        )
 
     # Subtrees registration
 
@@ -450,18 +458,10 @@ class MibTree(ObjectType):
         raise error.NoSuchObjectError(name=name, idx=context.get("idx"))
 
     def getNextBranch(self, name, **context):
-        # Start from the beginning
-        if self._vars:
-            first = list(self._vars.keys())[0]
-        else:
-            first = ()
-        if self._vars and name < first:
-            return self._vars[first]
-        else:
-            try:
-                return self._vars[self._vars.next_key(name)]
-            except KeyError:
-                raise error.NoSuchObjectError(name=name, idx=context.get("idx"))
+        try:
+            return self._vars[self._vars.next_key(name)]
+        except KeyError:
+            raise error.NoSuchObjectError(name=name, idx=context.get("idx"))
 
     def getNode(self, name, **context):
         """Return tree node found by name"""
@@ -524,6 +524,14 @@ class MibTree(ObjectType):
             return node.readGet(varBind, **context)
 
     # Read next operation is subtree-specific
+    #
+    # The search starts at the branch where the 'name' OID may reside
+    # and then goes over the following branches of this tree in order.
+    #
+    # If a "cursor" dict is passed in the context, the tree nodes that
+    # yielded the returned OIDs get recorded in there, so that a subsequent
+    # *Next* operation on a returned OID could resume right from that node
+    # rather than descending from the top of the MIB once again.
 
     depthFirst, breadthFirst = 0, 1
 
@@ -534,80 +542,102 @@ class MibTree(ObjectType):
         if topOfTheMib:
             context["oName"] = name
 
-        nextName = name
-        direction = self.depthFirst
-
-        while True:  # NOTE(etingof): linear search here
-            if direction == self.depthFirst:
-                direction = self.breadthFirst
+            cursor = context.get("cursor")
+            if cursor is not None and name in cursor:
                 try:
-                    node = self.getBranch(nextName, **context)
+                    return cursor[name].readTestNext(varBind, **context)
 
-                except (error.NoSuchInstanceError, error.NoSuchObjectError):
-                    continue
+                except (
+                    error.NoAccessError,
+                    error.NoSuchInstanceError,
+                    error.NoSuchObjectError,
+                ):
+                    pass
 
-            else:
-                try:
-                    node = self.getNextBranch(nextName, **context)
+        try:
+            node = self.getBranch(name, **context)
+
+        except (error.NoSuchInstanceError, error.NoSuchObjectError):
+            node = None
+
+        nextName = name
 
-                except (error.NoSuchInstanceError, error.NoSuchObjectError):
-                    if topOfTheMib:
-                        return
-                    raise
+        while True:  # NOTE(etingof): linear search here
+            if node is not None:
+                try:
+                    return node.readTestNext((nextName, val), **context)
 
-                direction = self.depthFirst
-                nextName = node.name
+                except (
+                    error.NoAccessError,
+                    error.NoSuchInstanceError,
+                    error.NoSuchObjectError,
+                ):
+                    pass
 
             try:
-                return node.readTestNext(varBind, **context)
+                node = self.getNextBranch(nextName, **context)
 
-            except (
-                error.NoAccessError,
-                error.NoSuchInstanceError,
-                error.NoSuchObjectError,
-            ):
-                pass
+            except (error.NoSuchInstanceError, error.NoSuchObjectError):
+                if topOfTheMib:
+                    return
+                raise
+
+            nextName = node.name
 
     def readGetNext(self, varBind, **context):
         name, val = varBind
 
+        cursor = context.get("cursor")
+
         topOfTheMib = context.get("oName") is None
         if topOfTheMib:
             context["oName"] = name
 
-        nextName = name
-        direction = self.depthFirst
-
-        while True:  # NOTE(etingof): linear search ahead!
-            if direction == self.depthFirst:
-                direction = self.breadthFirst
+            if cursor is not None and name in cursor:
                 try:
-                    node = self.getBranch(nextName, **context)
+                    return cursor.pop(name).readGetNext(varBind, **context)
 
-                except (error.NoSuchInstanceError, error.NoSuchObjectError):
-                    continue
+                except (
+                    error.NoAccessError,
+                    error.NoSuchInstanceError,
+                    error.NoSuchObjectError,
+                ):
+                    pass
 
-            else:
+        try:
+            node = self.getBranch(name, **context)
+
+        except (error.NoSuchInstanceError, error.NoSuchObjectError):
+            node = None
+
+        nextName = name
+
+        while True:  # NOTE(etingof): linear search ahead!
+            if node is not None:
                 try:
-                    node = self.getNextBranch(nextName, **context)
+                    rval = node.readGetNext((nextName, val), **context)
 
-                except (error.NoSuchInstanceError, error.NoSuchObjectError):
-                    if topOfTheMib:
-                        return name, exval.endOfMib
-                    raise
+                except (
+                    error.NoAccessError,
+                    error.NoSuchInstanceError,
+                    error.NoSuchObjectError,
+                ):
+                    pass
 
-                direction = self.depthFirst
-                nextName = node.name
+                else:
+                    if cursor is not None and rval[0] not in cursor:
+                        cursor[rval[0]] = self
+                    return rval
 
             try:
-                return node.readGetNext((nextName, val), **context)
+                node = self.getNextBranch(nextName, **context)
 
-            except (
-                error.NoAccessError,
-                error.NoSuchInstanceError,
-                error.NoSuchObjectError,
-            ):
-                pass
+            except (error.NoSuchInstanceError, error.NoSuchObjectError):
+                if topOfTheMib:
+                    return name, exval.endOfMib
+                raise
+
+            nextName = node.name
 
     # Write operation
 
@@ -771,11 +801,12 @@ class MibScalar(MibTree):
 class MibScalarInstance(MibTree):
     """Scalar MIB variable instance. Implements read/write operations."""
 
+    __oldSyntax = None
+
     def __init__(self, typeName, instId, syntax):
         MibTree.__init__(self, typeName + instId, syntax)
         self.typeName = typeName
         self.instId = instId
-        self.__oldSyntax = None
 
     #
     # Managed object value access methods
@@ -1004,14 +1035,96 @@ class MibScalarInstance(MibTree):
         pass
 
 
+class MibCounterInstance(MibScalarInstance):
+    """Counter MIB variable instance.
+
+    Counts in a native integer `count` attribute, the SNMP value is
+    only built from it on read. Counters wrap around on overflow.
+    """
+
+    @property
+    def syntax(self):
+        count = self.count
+        if count != self.__count:
+            if count > self.__maxValue:
+                count = self.count = count % (self.__maxValue + 1)
+            self.__syntax = self.__syntax.clone(count)
+            self.__count = count
+        return self.__syntax
+
+    @syntax.setter
+    def syntax(self, value):
+        self.__syntax = value
+        self.__count = self.count = int(value)
+        self.__maxValue = (
+            isinstance(value, Counter64) and 0xFFFFFFFFFFFFFFFF or 0xFFFFFFFF
+        )
+
+
 # Conceptual table classes
 
 
+class MibTableDataSource:
+    """Columnar data source of a virtual MIB table.
+
+    Table rows are either given as a sorted sequence of instance
+    identifiers (OID suffixes built of row indices) along with `columns`
+    mapping column IDs to sequences of values, aligned with instance
+    identifiers, or fetched by `cbFun(instId, count)` returning up
+    to `count` rows, as (instId, {colId: value}) tuples, starting from
+    `instId` in order. None stands for a missing cell.
+    """
+
+    pageSize = 32
+
+    def __init__(self, instIds=(), columns=None, cbFun=None):
+        self.instIds = instIds
+        self.columns = columns or {}
+        self.cbFun = cbFun
+
+    def getValue(self, colId, instId):
+        """Return value at `colId` and `instId` or None if missing."""
+        if self.cbFun is not None:
+            for rowInstId, values in self.cbFun(instId, 1):
+                if rowInstId == instId:
+                    return values.get(colId)
+            return None
+
+        idx = bisect_left(self.instIds, instId)
+        if idx < len(self.instIds) and self.instIds[idx] == instId:
+            values = self.columns.get(colId)
+            if values is not None:
+                return values[idx]
+        return None
+
+    def getNextValue(self, colId, instId):
+        """Return (instId, value) at `colId` following `instId` or None."""
+        if self.cbFun is not None:
+            while True:
+                rows = self.cbFun(instId, self.pageSize)
+                for rowInstId, values in rows:
+                    if rowInstId > instId and values.get(colId) is not None:
+                        return rowInstId, values[colId]
+                if len(rows) < self.pageSize:
+                    return None
+                instId = rows[-1][0]
+
+        values = self.columns.get(colId)
+        if values is not None:
+            for idx in range(bisect_right(self.instIds, instId), len(self.instIds)):
+                if values[idx] is not None:
+                    return self.instIds[idx], values[idx]
+        return None
+
+
 class MibTableColumn(MibScalar):
     """MIB table column. Manages a set of column instance variables"""
 
     protoInstance = MibScalarInstance
 
+    # Virtual table columns are served by the data source set by row
+    dataSource = None
+
     def __init__(self, name, syntax):
         MibScalar.__init__(self, name, syntax)
         self.__createdInstances = {}
@@ -1032,6 +1145,82 @@ class MibTableColumn(MibScalar):
     def setProtoInstance(self, protoInstance):
         self.protoInstance = protoInstance
 
+    # Virtual table column reading
+
+    def __check_read_access(self, name, **context):
+        acFun = context.get("acFun")
+        if acFun:
+            if self.maxAccess not in (
+                "read-only",
+                "read-write",
+                "read-create",
+            ) or acFun("read", (name, self.syntax), **context):
+                raise error.NoAccessError(name=name, idx=context.get("idx"))
+
+    def __get_next_value(self, name, **context):
+        if name[: len(self.name)] == self.name:
+            instId = tuple(name[len(self.name) :])
+        else:
+            instId = ()
+
+        nextValue = self.dataSource.getNextValue(self.name[-1], instId)
+        if nextValue is None:
+            raise error.NoSuchInstanceError(name=name, idx=context.get("idx"))
+
+        instId, value = nextValue
+        return self.name + tuple(instId), self.syntax.clone(value)
+
+    def readTest(self, varBind, **context):
+        if self.dataSource is None:
+            return MibScalar.readTest(self, varBind, **context)
+
+        name, val = varBind
+
+        if name == self.name:
+            raise error.NoAccessError(name=name, idx=context.get("idx"))
+
+        self.__check_read_access(name, **context)
+
+    def readGet(self, varBind, **context):
+        if self.dataSource is None:
+            return MibScalar.readGet(self, varBind, **context)
+
+        name, val = varBind
+
+        if name[: len(self.name)] == self.name:
+            value = self.dataSource.getValue(
+                self.name[-1], tuple(name[len(self.name) :])
+            )
+            if value is not None:
+                return name, self.syntax.clone(value)
+
+        return name, exval.noSuchInstance
+
+    def readTestNext(self, varBind, **context):
+        if self.dataSource is None:
+            return MibScalar.readTestNext(self, varBind, **context)
+
+        name, val = varBind
+
+        self.__check_read_access(name, **context)
+        self.__get_next_value(name, **context)
+
+    def readGetNext(self, varBind, **context):
+        if self.dataSource is None:
+            return MibScalar.readGetNext(self, varBind, **context)
+
+        name, val = varBind
+
+        self.__check_read_access(name, **context)
+
+        nextName, value = self.__get_next_value(name, **context)
+
+        cursor = context.get("cursor")
+        if cursor is not None:
+            cursor[nextName] = self
+
+        return nextName, value
+
     # Column creation (this should probably be converted into some state
     # machine for clarity). Also, it might be a good idea to inidicate
     # defaulted cols creation in a clearer way than just a val == None.
@@ -1177,6 +1366,10 @@ class MibTableColumn(MibScalar):
     def writeTest(self, varBind, **context):
         name, val = varBind
 
+        # Virtual table can only be changed through its data source
+        if self.dataSource is not None:
+            raise error.NotWritableError(name=name, idx=context.get("idx"))
+
         # Besides common checks, request row creation on no-instance
         try:
             # First try the instance
@@ -1268,6 +1461,7 @@ class MibTableRow(MibTree):
         self.__idxToIdCache = cache.Cache()
         self.indexNames = ()
         self.augmentingRows = {}
+        self.rowObservers = []
 
     # Table indices resolution. Handle almost all possible rfc1902 types
     # explicitly rather than by means of isSuperTypeOf() method because
@@ -1510,10 +1704,57 @@ class MibTableRow(MibTree):
     def writeCleanup(self, varBind, **context):
         self.branchVersionId += 1
         self.__delegate("Cleanup", varBind, **context)
+        self.__notifyRowObservers(varBind[0][len(self.name) + 1 :])
 
     def writeUndo(self, varBind, **context):
         self.__delegate("Undo", varBind, **context)
 
+    # Row change notification
+
+    def registerSubtrees(self, *subTrees):
+        MibTree.registerSubtrees(self, *subTrees)
+        if self.dataSource is not None:
+            for subTree in subTrees:
+                subTree.dataSource = self.dataSource
+        self.__notifyRowObservers(None)
+
+    def unregisterSubtrees(self, *names):
+        MibTree.unregisterSubtrees(self, *names)
+        self.__notifyRowObservers(None)
+
+    def registerRowObserver(self, cbFun):
+        """Call `cbFun(instId)` whenever a row of this table gets written.
+
+        The `instId` is None if any row might have changed.
+        """
+        self.rowObservers.append(cbFun)
+        return self
+
+    def unregisterRowObserver(self, cbFun):
+        self.rowObservers.remove(cbFun)
+        return self
+
+    def __notifyRowObservers(self, instId):
+        for cbFun in self.rowObservers:
+            cbFun(instId)
+
+    # Virtual table
+
+    dataSource = None
+
+    def setDataSource(self, dataSource):
+        """Serve columns of this table from a `MibTableDataSource`.
+
+        Columns instances are not created then, read operations query
+        the data source directly. Pass None to go back to columns
+        instances.
+        """
+        self.dataSource = dataSource
+        for column in self._vars.values():
+            column.dataSource = dataSource
+        self.branchVersionId += 1
+        return self
+
     # Table row management
 
     # Table row access by instance name
@@ -1525,9 +1766,13 @@ class MibTableRow(MibTree):
 
     def getIndicesFromInstId(self, instId):
         """Return index values for instance identification"""
-        if instId in self.__idToIdxCache:
+        try:
             return self.__idToIdxCache[instId]
 
+        except KeyError:
+            pass
+
+        fullInstId = instId
         indices = []
         for impliedFlag, modName, symName in self.indexNames:
             (mibObj,) = mibBuilder.import_symbols(modName, symName)
@@ -1551,7 +1796,7 @@ class MibTableRow(MibTree):
             )
 
         indices = tuple(indices)
-        self.__idToIdxCache[instId] = indices
+        self.__idToIdxCache[fullInstId] = indices
 
         return indices
 
@@ -1914,6 +2159,8 @@ mibBuilder.export_symbols(
         "MibNode": MibNode,
         "MibScalar": MibScalar,
         "MibScalarInstance": MibScalarInstance,
+        "MibCounterInstance": MibCounterInstance,
+        "MibTableDataSource": MibTableDataSource,
         "MibIdentifier": MibIdentifier,
         "MibTree": MibTree,
         "MibTableColumn": MibTableColumn,
@@ -4,7 +4,9 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
-(MibScalarInstance,) = mibBuilder.import_symbols("SNMPv2-SMI", "MibScalarInstance")
+(MibScalarInstance, MibCounterInstance) = mibBuilder.import_symbols(
+    "SNMPv2-SMI", "MibScalarInstance", "MibCounterInstance"
+)
 
 (
     snmpUnknownSecurityModels,
@@ -17,13 +19,13 @@
     "snmpUnknownPDUHandlers",
 )
 
-__snmpUnknownSecurityModels = MibScalarInstance(
+__snmpUnknownSecurityModels = MibCounterInstance(
     snmpUnknownSecurityModels.name, (0,), snmpUnknownSecurityModels.syntax.clone(0)
 )
-__snmpInvalidMsgs = MibScalarInstance(
+__snmpInvalidMsgs = MibCounterInstance(
     snmpInvalidMsgs.name, (0,), snmpInvalidMsgs.syntax.clone(0)
 )
-__snmpUnknownPDUHandlers = MibScalarInstance(
+__snmpUnknownPDUHandlers = MibCounterInstance(
     snmpUnknownPDUHandlers.name, (0,), snmpUnknownPDUHandlers.syntax.clone(0)
 )
 
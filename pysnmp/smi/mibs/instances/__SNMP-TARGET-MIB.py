@@ -4,7 +4,9 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
-(MibScalarInstance,) = mibBuilder.import_symbols("SNMPv2-SMI", "MibScalarInstance")
+(MibScalarInstance, MibCounterInstance) = mibBuilder.import_symbols(
+    "SNMPv2-SMI", "MibScalarInstance", "MibCounterInstance"
+)
 
 (
     snmpTargetSpinLock,
@@ -20,10 +22,10 @@
 __snmpTargetSpinLock = MibScalarInstance(
     snmpTargetSpinLock.name, (0,), snmpTargetSpinLock.syntax.clone(0)
 )
-__snmpUnavailableContexts = MibScalarInstance(
+__snmpUnavailableContexts = MibCounterInstance(
     snmpUnavailableContexts.name, (0,), snmpUnavailableContexts.syntax.clone(0)
 )
-__snmpUnknownContexts = MibScalarInstance(
+__snmpUnknownContexts = MibCounterInstance(
     snmpUnknownContexts.name, (0,), snmpUnknownContexts.syntax.clone(0)
 )
 
@@ -4,7 +4,9 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
-(MibScalarInstance,) = mibBuilder.import_symbols("SNMPv2-SMI", "MibScalarInstance")
+(MibScalarInstance, MibCounterInstance) = mibBuilder.import_symbols(
+    "SNMPv2-SMI", "MibScalarInstance", "MibCounterInstance"
+)
 
 (
     usmStatsUnsupportedSecLevels,
@@ -25,24 +27,24 @@
     "usmUserSpinLock",
 )
 
-__usmStatsUnsupportedSecLevels = MibScalarInstance(
+__usmStatsUnsupportedSecLevels = MibCounterInstance(
     usmStatsUnsupportedSecLevels.name,
     (0,),
     usmStatsUnsupportedSecLevels.syntax.clone(0),
 )
-__usmStatsNotInTimeWindows = MibScalarInstance(
+__usmStatsNotInTimeWindows = MibCounterInstance(
     usmStatsNotInTimeWindows.name, (0,), usmStatsNotInTimeWindows.syntax.clone(0)
 )
-__usmStatsUnknownUserNames = MibScalarInstance(
+__usmStatsUnknownUserNames = MibCounterInstance(
     usmStatsUnknownUserNames.name, (0,), usmStatsUnknownUserNames.syntax.clone(0)
 )
-__usmStatsUnknownEngineIDs = MibScalarInstance(
+__usmStatsUnknownEngineIDs = MibCounterInstance(
     usmStatsUnknownEngineIDs.name, (0,), usmStatsUnknownEngineIDs.syntax.clone(0)
 )
-__usmStatsWrongDigests = MibScalarInstance(
+__usmStatsWrongDigests = MibCounterInstance(
     usmStatsWrongDigests.name, (0,), usmStatsWrongDigests.syntax.clone(0)
 )
-__usmStatsDecryptionErrors = MibScalarInstance(
+__usmStatsDecryptionErrors = MibCounterInstance(
     usmStatsDecryptionErrors.name, (0,), usmStatsDecryptionErrors.syntax.clone(0)
 )
 __usmUserSpinLock = MibScalarInstance(
@@ -9,8 +9,8 @@ from time import time
 
 from pysnmp import __version__
 
-(MibScalarInstance, TimeTicks) = mibBuilder.import_symbols(
-    "SNMPv2-SMI", "MibScalarInstance", "TimeTicks"
+(MibScalarInstance, MibCounterInstance, TimeTicks) = mibBuilder.import_symbols(
+    "SNMPv2-SMI", "MibScalarInstance", "MibCounterInstance", "TimeTicks"
 )
 
 (
@@ -127,82 +127,82 @@ __sysServices = MibScalarInstance(sysServices.name, (0,), sysServices.syntax.clo
 __sysORLastChange = MibScalarInstance(
     sysORLastChange.name, (0,), sysORLastChange.syntax.clone(0)
 )
-__snmpInPkts = MibScalarInstance(snmpInPkts.name, (0,), snmpInPkts.syntax.clone(0))
-__snmpOutPkts = MibScalarInstance(snmpOutPkts.name, (0,), snmpOutPkts.syntax.clone(0))
-__snmpInBadVersions = MibScalarInstance(
+__snmpInPkts = MibCounterInstance(snmpInPkts.name, (0,), snmpInPkts.syntax.clone(0))
+__snmpOutPkts = MibCounterInstance(snmpOutPkts.name, (0,), snmpOutPkts.syntax.clone(0))
+__snmpInBadVersions = MibCounterInstance(
     snmpInBadVersions.name, (0,), snmpInBadVersions.syntax.clone(0)
 )
-__snmpInBadCommunityNames = MibScalarInstance(
+__snmpInBadCommunityNames = MibCounterInstance(
     snmpInBadCommunityNames.name, (0,), snmpInBadCommunityNames.syntax.clone(0)
 )
-__snmpInBadCommunityUses = MibScalarInstance(
+__snmpInBadCommunityUses = MibCounterInstance(
     snmpInBadCommunityUses.name, (0,), snmpInBadCommunityUses.syntax.clone(0)
 )
-__snmpInASNParseErrs = MibScalarInstance(
+__snmpInASNParseErrs = MibCounterInstance(
     snmpInASNParseErrs.name, (0,), snmpInASNParseErrs.syntax.clone(0)
 )
-__snmpInTooBigs = MibScalarInstance(
+__snmpInTooBigs = MibCounterInstance(
     snmpInTooBigs.name, (0,), snmpInTooBigs.syntax.clone(0)
 )
-__snmpInNoSuchNames = MibScalarInstance(
+__snmpInNoSuchNames = MibCounterInstance(
     snmpInNoSuchNames.name, (0,), snmpInNoSuchNames.syntax.clone(0)
 )
-__snmpInBadValues = MibScalarInstance(
+__snmpInBadValues = MibCounterInstance(
     snmpInBadValues.name, (0,), snmpInBadValues.syntax.clone(0)
 )
-__snmpInReadOnlys = MibScalarInstance(
+__snmpInReadOnlys = MibCounterInstance(
     snmpInReadOnlys.name, (0,), snmpInReadOnlys.syntax.clone(0)
 )
-__snmpInGenErrs = MibScalarInstance(
+__snmpInGenErrs = MibCounterInstance(
     snmpInGenErrs.name, (0,), snmpInGenErrs.syntax.clone(0)
 )
-__snmpInTotalReqVars = MibScalarInstance(
+__snmpInTotalReqVars = MibCounterInstance(
     snmpInTotalReqVars.name, (0,), snmpInTotalReqVars.syntax.clone(0)
 )
-__snmpInTotalSetVars = MibScalarInstance(
+__snmpInTotalSetVars = MibCounterInstance(
     snmpInTotalSetVars.name, (0,), snmpInTotalSetVars.syntax.clone(0)
 )
-__snmpInGetRequests = MibScalarInstance(
+__snmpInGetRequests = MibCounterInstance(
     snmpInGetRequests.name, (0,), snmpInGetRequests.syntax.clone(0)
 )
-__snmpInGetNexts = MibScalarInstance(
+__snmpInGetNexts = MibCounterInstance(
     snmpInGetNexts.name, (0,), snmpInGetNexts.syntax.clone(0)
 )
-__snmpInSetRequests = MibScalarInstance(
+__snmpInSetRequests = MibCounterInstance(
     snmpInSetRequests.name, (0,), snmpInSetRequests.syntax.clone(0)
 )
-__snmpInGetResponses = MibScalarInstance(
+__snmpInGetResponses = MibCounterInstance(
     snmpInGetResponses.name, (0,), snmpInGetResponses.syntax.clone(0)
 )
-__snmpInTraps = MibScalarInstance(snmpInTraps.name, (0,), snmpInTraps.syntax.clone(0))
-__snmpOutTooBigs = MibScalarInstance(
+__snmpInTraps = MibCounterInstance(snmpInTraps.name, (0,), snmpInTraps.syntax.clone(0))
+__snmpOutTooBigs = MibCounterInstance(
     snmpOutTooBigs.name, (0,), snmpOutTooBigs.syntax.clone(0)
 )
-__snmpOutNoSuchNames = MibScalarInstance(
+__snmpOutNoSuchNames = MibCounterInstance(
     snmpOutNoSuchNames.name, (0,), snmpOutNoSuchNames.syntax.clone(0)
 )
-__snmpOutBadValues = MibScalarInstance(
+__snmpOutBadValues = MibCounterInstance(
     snmpOutBadValues.name, (0,), snmpOutBadValues.syntax.clone(0)
 )
-__snmpOutGenErrs = MibScalarInstance(
+__snmpOutGenErrs = MibCounterInstance(
     snmpOutGenErrs.name, (0,), snmpOutGenErrs.syntax.clone(0)
 )
-__snmpOutSetRequests = MibScalarInstance(
+__snmpOutSetRequests = MibCounterInstance(
     snmpOutSetRequests.name, (0,), snmpOutSetRequests.syntax.clone(0)
 )
-__snmpOutGetResponses = MibScalarInstance(
+__snmpOutGetResponses = MibCounterInstance(
     snmpOutGetResponses.name, (0,), snmpOutGetResponses.syntax.clone(0)
 )
-__snmpOutTraps = MibScalarInstance(
+__snmpOutTraps = MibCounterInstance(
     snmpOutTraps.name, (0,), snmpOutTraps.syntax.clone(0)
 )
 __snmpEnableAuthenTraps = MibScalarInstance(
     snmpEnableAuthenTraps.name, (0,), snmpEnableAuthenTraps.syntax.clone(1)
 )
-__snmpSilentDrops = MibScalarInstance(
+__snmpSilentDrops = MibCounterInstance(
     snmpSilentDrops.name, (0,), snmpSilentDrops.syntax.clone(0)
 )
-__snmpProxyDrops = MibScalarInstance(
+__snmpProxyDrops = MibCounterInstance(
     snmpProxyDrops.name, (0,), snmpProxyDrops.syntax.clone(0)
 )
 __snmpTrapOID = MibScalarInstance(
@@ -478,24 +478,24 @@ class ObjectIdentity:
                     except ValueError:
                         raise SmiError(f"Unknown object name component {suffix!r}")
                 self.__oid = rfc1902.ObjectName(prefix + suffix)
+
+                _, _, _, modName, symName, mibNode, rowNode = (
+                    mibViewController.get_managed_object(prefix)
+                )
             else:
-                prefix, label, suffix = mibViewController.get_node_name_by_oid(
-                    self.__oid
+                prefix, label, suffix, modName, symName, mibNode, rowNode = (
+                    mibViewController.get_managed_object(self.__oid)
                 )
 
             debug.logger & debug.FLAG_MIB and debug.logger(
                 f"resolved {self.__args!r} into prefix {prefix!r} and suffix {suffix!r}"
             )
 
-            modName, symName, _ = mibViewController.get_node_location(prefix)
-
             self.__modName = modName
             self.__symName = symName
 
             self.__label = label
 
-            (mibNode,) = mibViewController.mibBuilder.import_symbols(modName, symName)
-
             self.__mibNode = mibNode
 
             debug.logger & debug.FLAG_MIB and debug.logger(
@@ -504,12 +504,6 @@ class ObjectIdentity:
 
             if isinstance(mibNode, MibTableColumn):  # table column
                 if suffix:
-                    rowModName, rowSymName, _ = mibViewController.get_node_location(
-                        mibNode.name[:-1]
-                    )
-                    (rowNode,) = mibViewController.mibBuilder.import_symbols(
-                        rowModName, rowSymName
-                    )
                     self.__indices = rowNode.getIndicesFromInstId(suffix)
             else:
                 if suffix:
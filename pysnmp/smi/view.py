@@ -4,11 +4,13 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
+import pickle
 import warnings
+from bisect import bisect_left
 
-from pysnmp import debug
+from pysnmp import cache, debug
 from pysnmp.smi import error
-from pysnmp.smi.builder import MibBuilder
+from pysnmp.smi.builder import MibBuilder, SnapshotMibSource
 from pysnmp.smi.indices import OidOrderedDict, OrderedDict
 
 __all__ = ["MibViewController"]
@@ -20,25 +22,126 @@ instanceTypes = (object,)  # noqa: N816
 class MibViewController:
     """Create a MIB view controller."""
 
+    # Upper bound on the number of cached managed object resolutions
+    MAX_RESOLVED_OBJECTS = 4096
+
     def __init__(self, mibBuilder: MibBuilder):
         """Create a MIB view controller."""
         self.mibBuilder = mibBuilder
         self.lastBuildId = -1
         self.__mibSymbolsIdx = OrderedDict()
+        # Module name -> (type names, {var name: OID}) as indexed
+        self.__mibDefs = {}
+        # Module name -> resolution priority of ambiguous names
+        self.__mibRanks = {}
+        self.__varToModIdx = {}
+        self.__oidToModNames = {}
+        self.__resolvedObjects = cache.Cache(self.MAX_RESOLVED_OBJECTS)
+        self.__resolvedObjectsLens = []
+        self.__snapshotIndex = None
 
     # Indexing part
 
     def index_mib(self):
-        """Re-index MIB view."""
+        """Re-index MIB view.
+
+        Only the modules which MIB definitions have been added since
+        the last indexing get indexed. Changes to managed objects
+        instances are ignored.
+        """
         if self.lastBuildId == self.mibBuilder.lastBuildId:
             return
 
-        debug.logger & debug.FLAG_MIB and debug.logger("indexMib: re-indexing MIB view")
+        if self.lastBuildId < 0 or not self.__index_changed_modules():
+            if not self.__restore_snapshot_index():
+                self.__index_all_modules()
+
+        self.lastBuildId = self.mibBuilder.lastBuildId
+
+    def __get_snapshot_signature(self):
+        # Deferred and executed MIB modules load in different order
+        return [
+            (modName, self.mibBuilder.get_module_definitions(modName))
+            for modName in sorted(self.__get_module_names())
+        ]
+
+    def __restore_snapshot_index(self):
+        if self.__snapshotIndex is None:
+            return False
+
+        signature, indices = pickle.loads(self.__snapshotIndex)
 
-        (MibScalarInstance,) = self.mibBuilder.import_symbols(  # type: ignore
-            "SNMPv2-SMI", "MibScalarInstance"
+        # Only valid for the very same MIB modules contents
+        if signature != self.__get_snapshot_signature():
+            return False
+
+        debug.logger & debug.FLAG_MIB and debug.logger(
+            "indexMib: restoring MIB view from snapshot"
         )
 
+        (
+            self.__mibSymbolsIdx,
+            self.__mibDefs,
+            self.__mibRanks,
+            self.__varToModIdx,
+            self.__oidToModNames,
+        ) = indices
+
+        self.__resolvedObjects.clear()
+        self.__resolvedObjectsLens = []
+
+        return True
+
+    def save_snapshot(self, path):
+        """Save loaded MIB modules and MIB view indices into a snapshot file.
+
+        See :py:meth:`load_snapshot`.
+        """
+        self.index_mib()
+
+        indices = (
+            self.__mibSymbolsIdx,
+            self.__mibDefs,
+            self.__mibRanks,
+            self.__varToModIdx,
+            self.__oidToModNames,
+        )
+
+        self.mibBuilder.save_snapshot(
+            path,
+            index=pickle.dumps(
+                (self.__get_snapshot_signature(), indices), pickle.HIGHEST_PROTOCOL
+            ),
+        )
+
+    def load_snapshot(self, path):
+        """Use a snapshot file saved by :py:meth:`save_snapshot`.
+
+        MIB modules found in the snapshot load from it in favor of
+        other MIB sources. Once the same MIB modules are loaded, MIB
+        view indices get restored from the snapshot rather than built.
+
+        Snapshot files must come from a trusted source.
+        """
+        mibSource = SnapshotMibSource(path).init()
+
+        self.mibBuilder.set_mib_sources(mibSource, *self.mibBuilder.get_mib_sources())
+
+        self.__snapshotIndex = mibSource.get_index()
+
+    def __get_module_names(self):
+        """Return names of loaded MIB modules, deferred ones included."""
+        mibSymbols = self.mibBuilder.mibSymbols
+
+        return list(mibSymbols) + [
+            modName
+            for modName in self.mibBuilder.lazyModules
+            if modName not in mibSymbols
+        ]
+
+    def __index_all_modules(self):
+        debug.logger & debug.FLAG_MIB and debug.logger("indexMib: re-indexing MIB view")
+
         #
         # Create indices
         #
@@ -46,109 +149,265 @@ class MibViewController:
         # Module name -> module-scope indices
         self.__mibSymbolsIdx.clear()
 
+        self.__mibDefs.clear()
+        self.__mibRanks.clear()
+        self.__varToModIdx.clear()
+        self.__oidToModNames.clear()
+
+        self.__resolvedObjects.clear()
+        self.__resolvedObjectsLens = []
+
         # Oid <-> label indices
 
         # This is potentially ambiguous mapping. Sort modules in
         # ascending age for resolution
-        def __sorting_function(x, b: MibBuilder = self.mibBuilder):
-            if b.module_id in b.mibSymbols[x]:
-                m = b.mibSymbols[x][b.module_id]
-                r = m.getRevisions()
-                if r:
-                    return r[0][0]
+        for seq, modName in enumerate(self.__get_module_names()):
+            revision, typeNames, varNames = self.mibBuilder.get_module_definitions(
+                modName
+            )
+            self.__mibRanks[modName] = revision, seq
+            self.__mibDefs[modName] = typeNames, varNames
 
-            return "1970-01-01 00:00"
+        modNames = sorted(self.__mibRanks, key=self.__mibRanks.get)
 
-        modNames = list(self.mibBuilder.mibSymbols.keys())
-        modNames.sort(key=__sorting_function)
+        self.__mibSymbolsIdx[""] = self.__new_module_index()
 
         # Index modules names
-        for modName in [""] + modNames:
-            # Modules index
-            self.__mibSymbolsIdx[modName] = mibMod = {
-                "oidToLabelIdx": OidOrderedDict(),
-                "labelToOidIdx": {},
-                "varToNameIdx": {},
-                "typeToModIdx": OrderedDict(),
-                "oidToModIdx": {},
-            }
-
-            if not modName:
-                globMibMod = mibMod
-                continue
-
-            # Types & MIB vars indices
-            for n, v in self.mibBuilder.mibSymbols[modName].items():
-                if n == self.mibBuilder.module_id:  # do not index this
-                    continue  # special symbol
-                if isinstance(v, classTypes):
-                    if n in mibMod["typeToModIdx"]:
-                        raise error.SmiError(
-                            "Duplicate SMI type {}::{}, has {}".format(
-                                modName, n, mibMod["typeToModIdx"][n]
-                            )
-                        )
-                    globMibMod["typeToModIdx"][n] = modName
-                    mibMod["typeToModIdx"][n] = modName
-                elif isinstance(v, instanceTypes):
-                    if isinstance(v, MibScalarInstance):
-                        continue
-                    if n in mibMod["varToNameIdx"]:
-                        raise error.SmiError(
-                            "Duplicate MIB variable {}::{} has {}".format(
-                                modName, n, mibMod["varToNameIdx"][n]
-                            )
-                        )
-                    globMibMod["varToNameIdx"][n] = v.name
-                    mibMod["varToNameIdx"][n] = v.name
-                    # Potentionally ambiguous mapping ahead
-                    globMibMod["oidToModIdx"][v.name] = modName
-                    mibMod["oidToModIdx"][v.name] = modName
-                    globMibMod["oidToLabelIdx"][v.name] = (n,)
-                    mibMod["oidToLabelIdx"][v.name] = (n,)
-                else:
-                    raise error.SmiError(f"Unexpected object {modName}::{n}")
-
-        # Build oid->long-label index
+        for modName in modNames:
+            self.__index_module(modName, *self.__mibDefs[modName])
+
+        self.__index_labels()
+
+    def __index_changed_modules(self):
+        """Index added MIB definitions, return False if full re-index is due."""
+        modNames = self.__get_module_names()
+
+        changedModNames = {
+            modName
+            for modName, buildId in self.mibBuilder.moduleBuildIds.items()
+            if buildId > self.lastBuildId
+        }
+
+        # Changed modules may have had MIB objects replaced under the
+        # same names and OIDs, so resolutions are out of date
+        if changedModNames:
+            self.__resolvedObjects.clear()
+            self.__resolvedObjectsLens = []
+
+        changedDefs = []
+
+        for modName in changedModNames:
+            if modName not in modNames:
+                return False  # removed module
+
+            if modName not in self.__mibDefs:
+                continue  # new module
+
+            revision, typeNames, varNames = self.mibBuilder.get_module_definitions(
+                modName
+            )
+
+            if self.__mibRanks[modName][0] != revision:
+                return False
+
+            oldTypeNames, oldVarNames = self.__mibDefs[modName]
+
+            if not oldTypeNames.issubset(typeNames):
+                return False  # removed types
+
+            for n, oid in oldVarNames.items():
+                if varNames.get(n) != oid:
+                    return False  # removed or redefined MIB variables
+
+            if len(varNames) > len(oldVarNames) or typeNames != oldTypeNames:
+                self.__mibDefs[modName] = typeNames, varNames
+                changedDefs.append((
+                    modName,
+                    typeNames - oldTypeNames,
+                    {n: varNames[n] for n in varNames if n not in oldVarNames},
+                ))
+
+        # New modules take priority in order of appearance
+        seq = max((x[1] for x in self.__mibRanks.values()), default=-1) + 1
+
+        for modName in modNames:
+            if modName in changedModNames and modName not in self.__mibDefs:
+                revision, typeNames, varNames = self.mibBuilder.get_module_definitions(
+                    modName
+                )
+                self.__mibRanks[modName] = revision, seq
+                self.__mibDefs[modName] = typeNames, varNames
+                changedDefs.append((modName, typeNames, varNames))
+                seq += 1
+
+        if not changedDefs:
+            return True  # managed objects instances only
+
+        debug.logger & debug.FLAG_MIB and debug.logger(
+            "indexMib: indexing MIB modules %s" % ", ".join(x[0] for x in changedDefs)
+        )
+
+        changedOids = []
+
+        for modName, typeNames, varNames in changedDefs:
+            changedOids.extend(self.__index_module(modName, typeNames, varNames))
+
+        self.__index_labels(changedOids)
+
+        return True
+
+    @staticmethod
+    def __new_module_index():
+        return {
+            "oidToLabelIdx": OidOrderedDict(),
+            "labelToOidIdx": {},
+            "varToNameIdx": {},
+            "typeToModIdx": OrderedDict(),
+            "oidToModIdx": {},
+            "oidTrie": {},
+        }
+
+    def __index_module(self, modName, typeNames, varNames):
+        """Index module types & MIB vars, return OIDs to re-label."""
+        if modName not in self.__mibSymbolsIdx:
+            self.__mibSymbolsIdx[modName] = self.__new_module_index()
+
+        mibMod = self.__mibSymbolsIdx[modName]
+        globMibMod = self.__mibSymbolsIdx[""]
+
+        rank = self.__mibRanks[modName]
+
+        changedOids = []
+
+        for n in typeNames:
+            mibMod["typeToModIdx"][n] = modName
+
+            owner = globMibMod["typeToModIdx"].get(n)
+            if owner is None or self.__mibRanks[owner] <= rank:
+                globMibMod["typeToModIdx"][n] = modName
+
+        for n, oid in varNames.items():
+            mibMod["varToNameIdx"][n] = oid
+            mibMod["oidToModIdx"][oid] = modName
+            self.__add_oid(mibMod["oidTrie"], oid)
+
+            # Potentionally ambiguous mapping ahead
+            owner = self.__varToModIdx.get(n)
+            if owner is None or self.__mibRanks[owner] <= rank:
+                globMibMod["varToNameIdx"][n] = oid
+                self.__varToModIdx[n] = modName
+
+            owner = globMibMod["oidToModIdx"].get(oid)
+            if owner is None or self.__mibRanks[owner] <= rank:
+                globMibMod["oidToModIdx"][oid] = modName
+                globMibMod["oidToLabelIdx"][oid] = (n,)
+                mibMod["oidToLabelIdx"][oid] = (n,)
+                self.__add_oid(globMibMod["oidTrie"], oid)
+                changedOids.append(oid)
+            else:
+                # Long label is already known
+                label = globMibMod["oidToLabelIdx"][oid]
+                mibMod["oidToLabelIdx"][oid] = label
+                mibMod["labelToOidIdx"][label] = oid
+
+            self.__oidToModNames.setdefault(oid, []).append(modName)
+
+        return changedOids
+
+    @staticmethod
+    def __add_oid(oidTrie, oid):
+        # Build sub-OID -> children trie for longest-prefix OID lookup
+        trieNode = oidTrie
+        for arc in oid:
+            trieNode = trieNode.setdefault(arc, {})
+        # Indexed OIDs are marked by the None key
+        trieNode[None] = oid
+
+    def __index_labels(self, changedOids=None):
+        """Build oid->long-label index.
+
+        If `changedOids` is given, re-label only these OIDs along with
+        whatever follows them up to the first OID the label of which
+        remains the same.
+        """
         oidToLabelIdx = self.__mibSymbolsIdx[""]["oidToLabelIdx"]
         labelToOidIdx = self.__mibSymbolsIdx[""]["labelToOidIdx"]
-        prevOid = ()
-        baseLabel = ()
-        for key in oidToLabelIdx.keys():
-            keydiff = len(key) - len(prevOid)
-            if keydiff > 0:
-                if prevOid:
-                    if keydiff == 1:
-                        baseLabel = oidToLabelIdx[prevOid]
-                    else:
-                        baseLabel += key[-keydiff:-1]
-                else:
-                    baseLabel = ()
-            elif keydiff < 0:
+
+        keys = oidToLabelIdx.keys()
+
+        if changedOids is None:
+            changedOids = set(keys)
+            startIdxs = [0]
+        else:
+            changedOids = set(changedOids)
+            startIdxs = sorted(bisect_left(keys, oid) for oid in changedOids)
+
+        keyIdx = 0
+
+        for startIdx in startIdxs:
+            if startIdx < keyIdx:
+                continue  # already re-labeled
+
+            keyIdx = startIdx
+
+            if keyIdx:
+                prevOid = keys[keyIdx - 1]
+                baseLabel = oidToLabelIdx[prevOid][:-1]
+            else:
+                prevOid = ()
                 baseLabel = ()
-                keyLen = len(key)
-                i = keyLen - 1
-                while i:
-                    k = key[:i]
-                    if k in oidToLabelIdx:
-                        baseLabel = oidToLabelIdx[k]
-                        if i != keyLen - 1:
-                            baseLabel += key[i:-1]
-                        break
-                    i -= 1
-            # Build oid->long-label index
-            oidToLabelIdx[key] = baseLabel + oidToLabelIdx[key]
-            # Build label->oid index
-            labelToOidIdx[oidToLabelIdx[key]] = key
-            prevOid = key
-
-        # Build module-scope oid->long-label index
-        for mibMod in self.__mibSymbolsIdx.values():
-            for oid in mibMod["oidToLabelIdx"].keys():
-                mibMod["oidToLabelIdx"][oid] = oidToLabelIdx[oid]
-                mibMod["labelToOidIdx"][oidToLabelIdx[oid]] = oid
 
-        self.lastBuildId = self.mibBuilder.lastBuildId
+            while keyIdx < len(keys):
+                key = keys[keyIdx]
+                keydiff = len(key) - len(prevOid)
+                if keydiff > 0:
+                    if prevOid:
+                        if keydiff == 1:
+                            baseLabel = oidToLabelIdx[prevOid]
+                        else:
+                            baseLabel += key[-keydiff:-1]
+                    else:
+                        baseLabel = ()
+                elif keydiff < 0:
+                    baseLabel = ()
+                    keyLen = len(key)
+                    i = keyLen - 1
+                    while i:
+                        k = key[:i]
+                        if k in oidToLabelIdx:
+                            baseLabel = oidToLabelIdx[k]
+                            if i != keyLen - 1:
+                                baseLabel += key[i:-1]
+                            break
+                        i -= 1
+
+                oldLabel = oidToLabelIdx[key]
+                label = baseLabel + oldLabel[-1:]
+
+                keyIdx += 1
+                prevOid = key
+
+                if label == oldLabel and key not in changedOids:
+                    break  # labels that follow remain the same
+
+                # Build oid->long-label index
+                oidToLabelIdx[key] = label
+                # Build label->oid index
+                if label != oldLabel and labelToOidIdx.get(oldLabel) == key:
+                    del labelToOidIdx[oldLabel]
+                labelToOidIdx[label] = key
+
+                # Build module-scope oid->long-label index
+                for modName in self.__oidToModNames[key]:
+                    mibMod = self.__mibSymbolsIdx[modName]
+                    oldLabel = mibMod["oidToLabelIdx"][key]
+                    if (
+                        oldLabel != label
+                        and mibMod["labelToOidIdx"].get(oldLabel) == key
+                    ):
+                        del mibMod["labelToOidIdx"][oldLabel]
+                    mibMod["oidToLabelIdx"][key] = label
+                    mibMod["labelToOidIdx"][label] = key
 
     # Module management
 
@@ -200,16 +459,42 @@ class MibViewController:
             return resOid, oidToLabelIdx[resOid], ()
         return oid, label, suffix
 
-    def get_node_name_by_oid(self, nodeName, modName=""):
-        """Return node name by OID."""
-        self.index_mib()
-        if modName in self.__mibSymbolsIdx:
-            mibMod = self.__mibSymbolsIdx[modName]
+    @staticmethod
+    def __get_oid_prefix(nodeName, oidTrie):
+        """getOidPrefix(nodeName) -> (oid, suffix) or None."""
+        trieNode = oidTrie
+        oid = None
+        prefixLen = 0
+
+        for arc in nodeName:
+            if not isinstance(arc, int):
+                # labels and string sub-OIDs
+                return
+
+            trieNode = trieNode.get(arc)
+            if trieNode is None:
+                break
+
+            prefixLen += 1
+
+            if None in trieNode:
+                oid = trieNode[None]
+                oidLen = prefixLen
+
+        if oid is None:
+            return
+
+        return oid, tuple(nodeName)[oidLen:]
+
+    def __get_node_name_by_oid(self, nodeName, mibMod, modName):
+        prefix = self.__get_oid_prefix(nodeName, mibMod["oidTrie"])
+        if prefix is None:
+            oid, label, suffix = self.__get_oid_label(
+                nodeName, mibMod["oidToLabelIdx"], mibMod["labelToOidIdx"]
+            )
         else:
-            raise error.SmiError(f"No module {modName} at {self}")
-        oid, label, suffix = self.__get_oid_label(
-            nodeName, mibMod["oidToLabelIdx"], mibMod["labelToOidIdx"]
-        )
+            oid, suffix = prefix
+            label = mibMod["oidToLabelIdx"][oid]
         if oid == label:
             raise error.NoSuchObjectError(
                 str=f"Can't resolve node name {modName}::{nodeName} at {self}"
@@ -219,6 +504,31 @@ class MibViewController:
         )
         return oid, label, suffix
 
+    def get_node_name_by_oid(self, nodeName, modName=""):
+        """Return node name by OID."""
+        self.index_mib()
+        if modName in self.__mibSymbolsIdx:
+            mibMod = self.__mibSymbolsIdx[modName]
+        else:
+            raise error.SmiError(f"No module {modName} at {self}")
+        return self.__get_node_name_by_oid(nodeName, mibMod, modName)
+
+    def get_node_names_by_oid(self, nodeNames, modName=""):
+        """Return node names by OIDs.
+
+        Returns a list of `(oid, label, suffix)` tuples, one per each
+        of `nodeNames`, as :py:meth:`get_node_name_by_oid` would.
+        """
+        self.index_mib()
+        if modName in self.__mibSymbolsIdx:
+            mibMod = self.__mibSymbolsIdx[modName]
+        else:
+            raise error.SmiError(f"No module {modName} at {self}")
+        return [
+            self.__get_node_name_by_oid(nodeName, mibMod, modName)
+            for nodeName in nodeNames
+        ]
+
     def get_node_name_by_desc(self, nodeName, modName=""):
         """Return node name by MIB symbol."""
         self.index_mib()
@@ -304,6 +614,72 @@ class MibViewController:
         oid, label, suffix = self.get_node_name(nodeName, modName)
         return self.__mibSymbolsIdx[""]["oidToModIdx"][oid], label[-1], suffix
 
+    def get_managed_object(self, nodeName):
+        """Return MIB objects managing an OID.
+
+        Returns `(oid, label, suffix, modName, symName, mibNode, rowNode)`
+        where `oid` is the closest MIB node `nodeName` belongs to, `suffix`
+        is the rest of `nodeName` and `rowNode` is the table row object
+        if `mibNode` is a table column.
+
+        Scalar and table column resolutions are kept by their OID, so
+        that subsequent instances of the same objects resolve by a
+        prefix lookup.
+        """
+        self.index_mib()
+
+        nodeName = tuple(nodeName)
+
+        resolvedObjects = self.__resolvedObjects
+
+        for prefixLen in self.__resolvedObjectsLens:
+            resolution = resolvedObjects.get(nodeName[:prefixLen])
+            if resolution is not None:
+                oid, label, modName, symName, mibNode, rowNode = resolution
+                return (
+                    oid,
+                    label,
+                    nodeName[prefixLen:],
+                    modName,
+                    symName,
+                    mibNode,
+                    rowNode,
+                )
+
+        oid, label, suffix = self.get_node_name_by_oid(nodeName)
+
+        modName, symName, _ = self.get_node_location(oid)
+
+        (mibNode,) = self.mibBuilder.import_symbols(modName, symName)
+
+        MibScalar, MibTableColumn = self.mibBuilder.import_symbols(
+            "SNMPv2-SMI", "MibScalar", "MibTableColumn"
+        )
+
+        rowNode = None
+
+        if isinstance(mibNode, MibTableColumn):
+            rowModName, rowSymName, _ = self.get_node_location(mibNode.name[:-1])
+            (rowNode,) = self.mibBuilder.import_symbols(rowModName, rowSymName)
+
+        if isinstance(mibNode, MibScalar):
+            # Other MIB nodes underneath would shadow this one
+            try:
+                nextOid = self.__mibSymbolsIdx[""]["oidToLabelIdx"].next_key(oid)
+
+            except KeyError:
+                nextOid = ()
+
+            if nextOid[: len(oid)] != oid:
+                resolvedObjects[oid] = oid, label, modName, symName, mibNode, rowNode
+
+                if len(oid) not in self.__resolvedObjectsLens:
+                    self.__resolvedObjectsLens = sorted(
+                        self.__resolvedObjectsLens + [len(oid)], reverse=True
+                    )
+
+        return oid, label, suffix, modName, symName, mibNode, rowNode
+
     # MIB type management
 
     def get_type_name(self, typeName, modName=""):
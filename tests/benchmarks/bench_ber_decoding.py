@@ -0,0 +1,128 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Microbenchmark for SNMP messages BER decoding.
+
+Reports the rate of decoding typical SNMP messages, as seen on the
+wire, by the generic pyasn1 BER decoder and by the fast SNMP message
+decoder.
+
+Run with::
+
+    python tests/benchmarks/bench_ber_decoding.py [messages]
+"""
+
+import sys
+import time
+
+from pyasn1.codec.ber import decoder, encoder
+
+from pysnmp.proto.api import msgdec, v1, v2c
+from pysnmp.proto.mpmod.rfc3412 import SnmpV3MessageProcessingModel
+from pysnmp.proto.secmod.rfc3414.service import UsmSecurityParameters
+
+
+def build_v2c_message(pdu, varBinds):
+    v2c.apiPDU.set_defaults(pdu)
+    v2c.apiPDU.set_varbinds(pdu, varBinds)
+    msg = v2c.Message()
+    v2c.apiMessage.set_defaults(msg)
+    v2c.apiMessage.set_pdu(msg, pdu)
+    return msg
+
+
+def build_v3_message(pdu):
+    msgSpec = SnmpV3MessageProcessingModel()._snmpMsgSpec
+
+    msg = msgSpec.clone()
+    msg.setComponentByPosition(0, 3)
+    headerData = msg.setComponentByPosition(1).getComponentByPosition(1)
+    headerData.setComponentByPosition(0, 1234)
+    headerData.setComponentByPosition(1, 65507)
+    headerData.setComponentByPosition(2, b"\x04")
+    headerData.setComponentByPosition(3, 3)
+
+    securityParameters = UsmSecurityParameters()
+    for idx, value in enumerate((b"\x80\x00\x4f\xb8\x05", 1, 42, b"usr", b"", b"")):
+        securityParameters.setComponentByPosition(idx, value)
+    msg.setComponentByPosition(2, encoder.encode(securityParameters))
+
+    scopedPDU = msg.setComponentByPosition(3).getComponentByPosition(3)
+    scopedPDU = scopedPDU.setComponentByPosition(0).getComponentByPosition(0)
+    scopedPDU.setComponentByPosition(0, b"\x80\x00\x4f\xb8\x05")
+    scopedPDU.setComponentByPosition(1, b"")
+    scopedPDU.setComponentByPosition(2).getComponentByPosition(2).setComponentByType(
+        pdu.tagSet, pdu
+    )
+
+    return msgSpec, msg
+
+
+def build_messages():
+    pdu = v1.GetRequestPDU()
+    v1.apiPDU.set_defaults(pdu)
+    v1.apiPDU.set_varbinds(pdu, [((1, 3, 6, 1, 2, 1, 1, 1, 0), None)])
+    msg = v1.Message()
+    v1.apiMessage.set_defaults(msg)
+    v1.apiMessage.set_pdu(msg, pdu)
+
+    yield "SNMPv1 GET request", v1.Message(), msg
+
+    yield (
+        "SNMPv2c response of 10 var-binds",
+        v2c.Message(),
+        build_v2c_message(
+            v2c.ResponsePDU(),
+            [
+                ((1, 3, 6, 1, 2, 1, 2, 2, 1, 10, index), v2c.Counter32(index * 1000))
+                for index in range(10)
+            ],
+        ),
+    )
+
+    yield (
+        "SNMPv2c GETBULK response of 50 var-binds",
+        v2c.Message(),
+        build_v2c_message(
+            v2c.ResponsePDU(),
+            [
+                (
+                    (1, 3, 6, 1, 2, 1, 31, 1, 1, 1, column, index),
+                    column % 2 and v2c.Counter64(index) or v2c.OctetString("eth0"),
+                )
+                for column in range(1, 6)
+                for index in range(1, 11)
+            ],
+        ),
+    )
+
+    pdu = v2c.GetRequestPDU()
+    v2c.apiPDU.set_defaults(pdu)
+    v2c.apiPDU.set_varbinds(pdu, [((1, 3, 6, 1, 2, 1, 1, 1, 0), None)])
+
+    yield ("SNMPv3 GET request", *build_v3_message(pdu))
+
+
+def run(count):
+    for title, msgSpec, msg in build_messages():
+        substrate = encoder.encode(msg)
+
+        for name, decode in (("pyasn1", decoder.decode), ("fast", msgdec.decode)):
+            started = time.perf_counter()
+
+            for _ in range(count):
+                decode(substrate, asn1Spec=msgSpec)
+
+            elapsed = time.perf_counter() - started
+
+            print(
+                f"{title} ({len(substrate)} octets), {name} decoder: "
+                f"{count / elapsed:.0f} messages/s"
+            )
+
+
+if __name__ == "__main__":
+    run(len(sys.argv) > 1 and int(sys.argv[1]) or 2000)
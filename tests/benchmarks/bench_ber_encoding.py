@@ -0,0 +1,77 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Microbenchmark for SNMP requests BER encoding.
+
+Reports the rate of building and serializing SNMPv2c GET requests for
+the same set of OIDs, as a poller would repeatedly send them, by the
+pyasn1 BER encoder, by the fast SNMP message encoder and by the fast
+encoder with pre-encoded var-bind list.
+
+Run with::
+
+    python tests/benchmarks/bench_ber_encoding.py [requests]
+"""
+
+import sys
+import time
+
+from pyasn1.codec.ber import encoder
+
+from pysnmp.proto.api import msgenc, v2c
+
+OIDS = [
+    (1, 3, 6, 1, 2, 1, 2, 2, 1, column, index)
+    for column in (10, 16)
+    for index in range(1, 6)
+]
+
+
+def build_message(requestId, varBindList=None):
+    pdu = v2c.GetRequestPDU()
+    v2c.apiPDU.set_defaults(pdu)
+    v2c.apiPDU.set_request_id(pdu, requestId)
+
+    if varBindList is None:
+        v2c.apiPDU.set_varbinds(pdu, [(oid, None) for oid in OIDS])
+    else:
+        pdu.setComponentByPosition(
+            3,
+            varBindList,
+            verifyConstraints=False,
+            matchTags=False,
+            matchConstraints=False,
+        )
+
+    msg = v2c.Message()
+    v2c.apiMessage.set_defaults(msg)
+    v2c.apiMessage.set_community(msg, "public")
+    v2c.apiMessage.set_pdu(msg, pdu)
+    return msg
+
+
+def run(count):
+    varBindList = msgenc.freeze(
+        v2c.apiMessage.get_pdu(build_message(0)).getComponentByPosition(3)
+    )
+
+    for name, encode, template in (
+        ("pyasn1 encoder", encoder.encode, None),
+        ("fast encoder", msgenc.encode, None),
+        ("fast encoder, pre-encoded var-binds", msgenc.encode, varBindList),
+    ):
+        started = time.perf_counter()
+
+        for requestId in range(count):
+            encode(build_message(requestId, template))
+
+        elapsed = time.perf_counter() - started
+
+        print(f"{name}: {count / elapsed:.0f} requests of {len(OIDS)} OIDs/s")
+
+
+if __name__ == "__main__":
+    run(len(sys.argv) > 1 and int(sys.argv[1]) or 5000)
@@ -0,0 +1,95 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Microbenchmark for the limited-size cache.
+
+Reports the rate of cache lookups and insertions, with the working
+set of keys larger than the cache, along with the tail latency of
+single operations, for the LRU cache and for the previous usage-counting
+cache that sorts all entries on overflow.
+
+Run with::
+
+    python tests/benchmarks/bench_cache.py [operations]
+"""
+
+import gc
+import random
+import sys
+import time
+
+from pysnmp.cache import Cache
+
+
+class UsageSortingCache:
+    """Cache as implemented before LRU, kept for comparison."""
+
+    def __init__(self, maxSize=256):
+        self.__maxSize = maxSize
+        self.__size = 0
+        self.__chopSize = max(maxSize // 10, 1)
+        self.__cache = {}
+        self.__usage = {}
+
+    def __contains__(self, k):
+        return k in self.__cache
+
+    def __getitem__(self, k):
+        self.__usage[k] += 1
+        return self.__cache[k]
+
+    def __setitem__(self, k, v):
+        if self.__size >= self.__maxSize:
+            usageKeys = sorted(self.__usage, key=lambda x, d=self.__usage: d[x])
+            for _k in usageKeys[: self.__chopSize]:
+                del self.__cache[_k]
+                del self.__usage[_k]
+            self.__size -= self.__chopSize
+        if k not in self.__cache:
+            self.__size += 1
+            self.__usage[k] = 0
+        self.__cache[k] = v
+
+
+def run(count):
+    random.seed(1)
+
+    for maxSize in (256, 16384):
+        keys = [random.randrange(maxSize * 2) for _ in range(count)]
+
+        for cacheClass in (UsageSortingCache, Cache):
+            cache = cacheClass(maxSize)
+
+            timings = []
+
+            gc.disable()
+
+            started = now = time.perf_counter()
+
+            for k in keys:
+                if k in cache:
+                    cache[k]
+                else:
+                    cache[k] = k
+
+                then, now = now, time.perf_counter()
+                timings.append(now - then)
+
+            gc.enable()
+
+            elapsed = now - started
+            timings.sort()
+
+            print(
+                f"{cacheClass.__name__} of {maxSize} entries: "
+                f"{count / elapsed:.0f} operations/s, "
+                f"99.99% of operations within "
+                f"{timings[int(len(timings) * 0.9999)] * 1000000:.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    run(len(sys.argv) > 1 and int(sys.argv[1]) or 200000)
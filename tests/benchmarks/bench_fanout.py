@@ -0,0 +1,67 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Microbenchmark for fanning out datagrams to many targets.
+
+Reports the time it takes the transport dispatcher to send a burst of
+messages, both queued before the transport endpoint gets connected and
+sent over a connected endpoint.
+
+Run with::
+
+    python tests/benchmarks/bench_fanout.py [messages]
+"""
+
+import asyncio
+import socket
+import sys
+import time
+
+from pysnmp.carrier.asyncio.dgram import udp
+from pysnmp.carrier.asyncio.dispatch import AsyncioDispatcher
+
+
+async def run(messages):
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    address = receiver.getsockname()
+
+    outgoingMessages = [(b"x" * 64, address)] * messages
+
+    def drain():
+        receiver.setblocking(False)
+        try:
+            while True:
+                receiver.recv(100)
+
+        except BlockingIOError:
+            pass
+
+    dispatcher = AsyncioDispatcher()
+    transport = udp.UdpTransport().open_client_mode()
+    dispatcher.register_transport(udp.DOMAIN_NAME, transport)
+
+    started = time.perf_counter()
+    for outgoingMessage, transportAddress in outgoingMessages:
+        dispatcher.send_message(outgoingMessage, udp.DOMAIN_NAME, transportAddress)
+    await transport._lport
+    print(f"{messages} messages queued: {time.perf_counter() - started:.3f} s")
+
+    drain()
+
+    started = time.perf_counter()
+    for outgoingMessage, transportAddress in outgoingMessages:
+        dispatcher.send_message(outgoingMessage, udp.DOMAIN_NAME, transportAddress)
+    print(f"{messages} messages sent: {time.perf_counter() - started:.3f} s")
+
+    drain()
+
+    dispatcher.close_dispatcher()
+    receiver.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(len(sys.argv) > 1 and int(sys.argv[1]) or 10000))
@@ -0,0 +1,163 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Benchmark for serving GETBULK requests by an SNMP agent.
+
+A local UDP client walks a populated table with SNMPv2c GETBULK
+requests and the number of var-binds the agent responds with per
+second gets reported for the single pass GETBULK execution and for
+the GETNEXT-per-repetition one.
+
+Run with::
+
+    python tests/benchmarks/bench_getbulk.py [rows]
+"""
+
+import asyncio
+import socket
+import sys
+import time
+
+from pysnmp.carrier.asyncio.dgram import udp
+from pysnmp.entity import config, engine
+from pysnmp.entity.rfc3413 import cmdrsp, context
+from pysnmp.proto.api import msgdec, msgenc, v2c
+from pysnmp.smi import builder, instrum
+
+TABLE = (1, 3, 6, 1, 4, 1, 20408, 999, 1)
+COLUMNS = (1, 2, 3, 4)
+MAX_REPETITIONS = 25
+
+
+class GetNextMibInstrumController(instrum.MibInstrumController):
+    read_bulk_variables = instrum.AbstractMibInstrumController.read_bulk_variables
+    _read_bulk_round = instrum.AbstractMibInstrumController._read_bulk_round
+
+
+def populate(mibBuilder, rows):
+    (MibTable, MibTableRow, MibTableColumn, MibScalarInstance) = (
+        mibBuilder.import_symbols(
+            "SNMPv2-SMI",
+            "MibTable",
+            "MibTableRow",
+            "MibTableColumn",
+            "MibScalarInstance",
+        )
+    )
+
+    columns = [
+        MibTableColumn(TABLE + (1, column), v2c.Integer32()) for column in COLUMNS
+    ]
+
+    mibBuilder.export_symbols(
+        "__BENCH-MIB",
+        MibTable(TABLE),
+        MibTableRow(TABLE + (1,)),
+        *columns,
+        *[
+            MibScalarInstance(column.name, (row,), v2c.Integer32(row))
+            for column in columns
+            for row in range(rows)
+        ],
+    )
+
+
+def encode_request(requestId, varBinds):
+    pdu = v2c.GetBulkRequestPDU()
+    v2c.apiBulkPDU.set_defaults(pdu)
+    v2c.apiBulkPDU.set_request_id(pdu, requestId)
+    v2c.apiBulkPDU.set_non_repeaters(pdu, 0)
+    v2c.apiBulkPDU.set_max_repetitions(pdu, MAX_REPETITIONS)
+    v2c.apiBulkPDU.set_varbinds(pdu, varBinds)
+
+    msg = v2c.Message()
+    v2c.apiMessage.set_defaults(msg)
+    v2c.apiMessage.set_community(msg, "public")
+    v2c.apiMessage.set_pdu(msg, pdu)
+
+    return msgenc.encode(msg)
+
+
+async def walk(sender, address):
+    varBinds = [(TABLE + (1, column), None) for column in COLUMNS]
+    count = requestId = 0
+
+    while True:
+        requestId += 1
+
+        sender.sendto(encode_request(requestId, varBinds), address)
+
+        while True:
+            try:
+                wholeMsg = sender.recv(65535)
+                break
+
+            except BlockingIOError:
+                await asyncio.sleep(0)
+
+        rspMsg, _ = msgdec.decode(wholeMsg, asn1Spec=v2c.Message())
+
+        rspVarBinds = v2c.apiPDU.get_varbinds(v2c.apiMessage.get_pdu(rspMsg))
+
+        for varBind in rspVarBinds:
+            if varBind[0][: len(TABLE)] != TABLE or isinstance(
+                varBind[1], v2c.EndOfMibView
+            ):
+                return count
+            count += 1
+
+        varBinds = [(oid, None) for oid, _ in rspVarBinds[-len(COLUMNS) :]]
+
+
+async def run(rows, mibInstrumClass):
+    snmpEngine = engine.SnmpEngine()
+
+    transport = udp.UdpTransport().open_server_mode(("127.0.0.1", 0))
+    config.add_transport(snmpEngine, udp.DOMAIN_NAME, transport)
+    config.add_v1_system(snmpEngine, "my-area", "public")
+    config.add_vacm_user(snmpEngine, 2, "my-area", "noAuthNoPriv", (1, 3, 6))
+
+    mibBuilder = builder.MibBuilder()
+    populate(mibBuilder, rows)
+
+    snmpContext = context.SnmpContext(snmpEngine)
+    snmpContext.unregister_context_name(b"")
+    snmpContext.register_context_name(b"", mibInstrumClass(mibBuilder))
+
+    cmdrsp.BulkCommandResponder(snmpEngine, snmpContext)
+
+    await transport._lport
+
+    address = transport.transport.get_extra_info("sockname")
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender.setblocking(False)
+
+    # Warm up MIB indexing and code paths
+    await walk(sender, address)
+
+    started = time.perf_counter()
+
+    count = await walk(sender, address)
+
+    elapsed = time.perf_counter() - started
+
+    sender.close()
+    snmpEngine.close_dispatcher()
+
+    print(
+        f"{mibInstrumClass.__name__}: {count} var-binds in {elapsed:.3f}s, "
+        f"{count / elapsed:.0f} var-binds/s"
+    )
+
+
+if __name__ == "__main__":
+    rows = len(sys.argv) > 1 and int(sys.argv[1]) or 5000
+
+    for mibInstrumClass in (
+        GetNextMibInstrumController,
+        instrum.MibInstrumController,
+    ):
+        asyncio.run(run(rows, mibInstrumClass))
@@ -0,0 +1,86 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Microbenchmark for GETNEXT traversal of the MIB instrumentation tree.
+
+Walks a populated table the way GETBULK repetitions do, with and
+without resuming traversal from the previously returned positions.
+
+Run with::
+
+    python tests/benchmarks/bench_getnext.py [rows]
+"""
+
+import sys
+import time
+
+from pysnmp.proto.api import v2c
+from pysnmp.smi import builder, instrum
+
+TABLE = (1, 3, 6, 1, 4, 1, 20408, 999, 1)
+COLUMNS = (1, 2, 3, 4)
+
+
+def build(rows):
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.load_modules("SNMPv2-MIB", "__SNMPv2-MIB")
+
+    (MibTable, MibTableRow, MibTableColumn, MibScalarInstance) = (
+        mibBuilder.import_symbols(
+            "SNMPv2-SMI",
+            "MibTable",
+            "MibTableRow",
+            "MibTableColumn",
+            "MibScalarInstance",
+        )
+    )
+
+    columns = [
+        MibTableColumn(TABLE + (1, column), v2c.Integer32()) for column in COLUMNS
+    ]
+
+    mibBuilder.export_symbols(
+        "__BENCH-MIB",
+        MibTable(TABLE),
+        MibTableRow(TABLE + (1,)),
+        *columns,
+        *[
+            MibScalarInstance(column.name, (row,), v2c.Integer32(row))
+            for column in columns
+            for row in range(rows)
+        ],
+    )
+
+    return instrum.MibInstrumController(mibBuilder)
+
+
+def walk(mibInstrum, **context):
+    varBinds = [(TABLE + (1, column), None) for column in COLUMNS]
+    count = 0
+
+    while True:
+        varBinds = mibInstrum.read_next_variables(*varBinds, **context)
+        if varBinds[0][0][: len(TABLE) + 2] != TABLE + (1, COLUMNS[0]):
+            return count
+        count += len(varBinds)
+
+
+def run(rows):
+    mibInstrum = build(rows)
+
+    for label, context in (("restart from root", {}), ("resume", {"cursor": {}})):
+        started = time.perf_counter()
+        count = walk(mibInstrum, **context)
+        elapsed = time.perf_counter() - started
+
+        print(
+            f"{label}: {count} var-binds in {elapsed:.3f}s, "
+            f"{count / elapsed:.0f} var-binds/s"
+        )
+
+
+if __name__ == "__main__":
+    run(len(sys.argv) > 1 and int(sys.argv[1]) or 10000)
@@ -0,0 +1,67 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Microbenchmark for interleaved OidOrderedDict writes and successor lookups.
+
+Models a dynamic table column where rows are continuously created and
+destroyed while GETNEXT traffic walks the column.
+
+Run with::
+
+    python tests/benchmarks/bench_indices.py [rows] [operations]
+"""
+
+import random
+import sys
+import time
+
+from pysnmp.smi.indices import OidOrderedDict
+
+COLUMN = (1, 3, 6, 1, 2, 1, 4, 22, 1, 2)
+
+
+def make_name(index):
+    return COLUMN + (index % 64 + 1, 10, index // 256 % 256, index % 256)
+
+
+def run(rows, operations):
+    column = OidOrderedDict()
+    for index in range(rows):
+        column[make_name(index)] = index
+
+    names = column.keys()
+    random.seed(0)
+
+    started = time.perf_counter()
+
+    for step in range(operations):
+        # One row gets created and another one destroyed per GETNEXT
+        name = make_name(rows + step)
+        column[name] = step
+
+        victim = random.randrange(len(names))
+        del column[names[victim]]
+        names[victim] = name
+
+        try:
+            column.next_key(random.choice(names))
+
+        except KeyError:
+            pass
+
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{rows} rows, {operations} write+GETNEXT operations: "
+        f"{elapsed:.3f}s, {operations / elapsed:.0f} ops/s"
+    )
+
+
+if __name__ == "__main__":
+    run(
+        len(sys.argv) > 1 and int(sys.argv[1]) or 50000,
+        len(sys.argv) > 2 and int(sys.argv[2]) or 10000,
+    )
@@ -0,0 +1,56 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Microbenchmark for USM passphrase to key conversion.
+
+Reports the time it takes to turn a number of distinct pass phrases
+into master keys one by one, in bulk over a process pool and once
+again from the key cache.
+
+Run with::
+
+    python tests/benchmarks/bench_key_derivation.py [passphrases]
+"""
+
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha1
+
+from pysnmp.proto.secmod.rfc3414 import localkey
+
+
+def run(count):
+    passphrases = [f"passphrase-{index}" for index in range(count)]
+
+    localkey.set_key_cache(localkey.KeyCache(maxSize=count))
+
+    started = time.perf_counter()
+
+    for passphrase in passphrases:
+        localkey.hash_passphrase(passphrase, sha1)
+
+    print(f"{count} passphrases one by one: {time.perf_counter() - started:.2f} s")
+
+    started = time.perf_counter()
+
+    for passphrase in passphrases:
+        localkey.hash_passphrase(passphrase, sha1)
+
+    print(f"{count} passphrases from cache: {time.perf_counter() - started:.2f} s")
+
+    localkey.set_key_cache(localkey.KeyCache(maxSize=count))
+
+    with ProcessPoolExecutor() as executor:
+        started = time.perf_counter()
+
+        localkey.hash_passphrases(passphrases, sha1, executor)
+
+        print(f"{count} passphrases in bulk: {time.perf_counter() - started:.2f} s")
+
+
+if __name__ == "__main__":
+    run(len(sys.argv) > 1 and int(sys.argv[1]) or 2000)
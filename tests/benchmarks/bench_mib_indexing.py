@@ -0,0 +1,99 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Microbenchmark for MIB view indexing.
+
+Reports the time it takes to load a number of MIB modules one at a
+time, resolving an OID against the MIB view after each module, as it
+happens when MIBs get loaded on demand while walking an agent. Then
+measures the same for managed objects instances being exported one
+at a time.
+
+Every MIB module defines a handful of scalars and a table.
+
+Run with::
+
+    python tests/benchmarks/bench_mib_indexing.py [modules]
+"""
+
+import sys
+import time
+
+from pysnmp.proto import rfc1902
+from pysnmp.smi import builder, view
+
+PREFIX = (1, 3, 6, 1, 4, 1, 20408, 999)
+
+
+def export_module(mibBuilder, index):
+    (
+        MibIdentifier,
+        MibScalar,
+        MibTable,
+        MibTableRow,
+        MibTableColumn,
+    ) = mibBuilder.import_symbols(
+        "SNMPv2-SMI",
+        "MibIdentifier",
+        "MibScalar",
+        "MibTable",
+        "MibTableRow",
+        "MibTableColumn",
+    )
+
+    oid = PREFIX + (index,)
+    modName = f"TEST{index}-MIB"
+    indexName = 0, modName, f"test{index}Index"
+
+    symbols = {
+        f"test{index}Objects": MibIdentifier(oid),
+        f"test{index}Table": MibTable(oid + (2,)),
+        f"test{index}Entry": MibTableRow(oid + (2, 1)).setIndexNames(indexName),
+    }
+
+    for column in range(1, 21):
+        symbols[f"test{index}Scalar{column}"] = MibScalar(
+            oid + (1, column), rfc1902.Integer32()
+        )
+        symbols[f"test{index}Column{column}"] = MibTableColumn(
+            oid + (2, 1, column), rfc1902.Integer32()
+        )
+
+    symbols[f"test{index}Index"] = symbols.pop(f"test{index}Column1")
+
+    mibBuilder.export_symbols(modName, **symbols)
+
+
+def run(count):
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.load_modules("SNMPv2-MIB")
+
+    mibViewController = view.MibViewController(mibBuilder)
+
+    started = time.perf_counter()
+
+    for index in range(count):
+        export_module(mibBuilder, index)
+        mibViewController.get_node_name_by_oid(PREFIX + (index, 2, 1, 2, 1))
+
+    print(f"{count} MIB modules one by one: {time.perf_counter() - started:.2f} s")
+
+    (MibScalarInstance,) = mibBuilder.import_symbols("SNMPv2-SMI", "MibScalarInstance")
+
+    started = time.perf_counter()
+
+    for index in range(count):
+        mibBuilder.export_symbols(
+            "__TEST-MIB",
+            MibScalarInstance(PREFIX + (index, 1, 2), (0,), rfc1902.Integer32()),
+        )
+        mibViewController.get_node_name_by_oid(PREFIX + (index, 1, 2, 0))
+
+    print(f"{count} instances one by one: {time.perf_counter() - started:.2f} s")
+
+
+if __name__ == "__main__":
+    run(len(sys.argv) > 1 and int(sys.argv[1]) or 300)
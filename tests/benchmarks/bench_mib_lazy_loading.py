@@ -0,0 +1,125 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Microbenchmark for deferred MIB modules loading.
+
+Reports the time and memory it takes to load a number of vendor
+MIB modules from a MIB snapshot and resolve a few notification
+var-binds against them, with MIB modules executed at load time or
+deferred till their symbols are needed.
+
+Every MIB module defines a handful of scalars and a table.
+
+Run with::
+
+    python tests/benchmarks/bench_mib_lazy_loading.py [modules]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pysnmp.proto import rfc1902
+from pysnmp.smi import builder, view
+
+PREFIX = (1, 3, 6, 1, 4, 1, 20408, 999)
+
+
+def write_module(path, index):
+    oid = PREFIX + (index,)
+    modName = f"TEST{index}-MIB"
+
+    lines = [
+        "(MibIdentifier, MibScalar, MibTable, MibTableRow, MibTableColumn,"
+        " Integer32) = mibBuilder.import_symbols('SNMPv2-SMI', 'MibIdentifier',"
+        " 'MibScalar', 'MibTable', 'MibTableRow', 'MibTableColumn', 'Integer32')",
+        f"test{index}Objects = MibIdentifier({oid})",
+        f"test{index}Table = MibTable({oid + (2,)})",
+        f"test{index}Entry = MibTableRow({oid + (2, 1)})"
+        f".setIndexNames((0, '{modName}', 'test{index}Index'))",
+    ]
+
+    symNames = [f"test{index}Objects", f"test{index}Table", f"test{index}Entry"]
+
+    for column in range(1, 21):
+        scalarName = f"test{index}Scalar{column}"
+        columnName = column > 1 and f"test{index}Column{column}" or f"test{index}Index"
+        lines.append(f"{scalarName} = MibScalar({oid + (1, column)}, Integer32())")
+        lines.append(
+            f"{columnName} = MibTableColumn({oid + (2, 1, column)}, Integer32())"
+        )
+        symNames.extend((scalarName, columnName))
+
+    lines.append(
+        f"mibBuilder.export_symbols('{modName}', "
+        + ", ".join(f"{n}={n}" for n in symNames)
+        + ")"
+    )
+
+    with open(os.path.join(path, f"{modName}.py"), "w") as fp:
+        fp.write("\n".join(lines) + "\n")
+
+    return modName
+
+
+def start(snapshotPath, modNames, varBinds, lazyLoad):
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.lazyLoad = lazyLoad
+    mibViewController = view.MibViewController(mibBuilder)
+    mibViewController.load_snapshot(snapshotPath)
+    mibBuilder.load_modules(*modNames)
+
+    for oid, value in varBinds:
+        mibViewController.get_managed_object(oid)
+
+    return mibViewController
+
+
+def run(count):
+    path = tempfile.mkdtemp()
+    snapshotPath = os.path.join(path, "mibs.snapshot")
+
+    modNames = ["SNMPv2-MIB"] + [write_module(path, index) for index in range(count)]
+
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.add_mib_sources(builder.DirMibSource(path))
+    mibBuilder.load_modules(*modNames)
+    view.MibViewController(mibBuilder).save_snapshot(snapshotPath)
+
+    # Start up with the same MIB modules, as a worker process would
+    modNames = list(mibBuilder.mibSymbols)
+
+    # Notification touching a few MIB modules
+    varBinds = [
+        ((1, 3, 6, 1, 2, 1, 1, 3, 0), rfc1902.TimeTicks(1)),
+        ((1, 3, 6, 1, 6, 3, 1, 1, 4, 1, 0), rfc1902.ObjectName(PREFIX + (0, 3))),
+    ]
+
+    for index in range(0, count, max(1, count // 4)):
+        varBinds.append((PREFIX + (index, 2, 1, 2, 7), rfc1902.Integer32(1)))
+
+    for label, lazyLoad in (("eagerly", False), ("lazily", True)):
+        tracemalloc.start()
+        started = time.perf_counter()
+
+        mibViewController = start(snapshotPath, modNames, varBinds, lazyLoad)
+
+        elapsed = time.perf_counter() - started
+        size, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"{len(modNames)} MIB modules {label}, "
+            f"{len(mibViewController.mibBuilder.mibSymbols)} executed: "
+            f"{elapsed * 1000:.1f} ms, {size / 1024 / 1024:.1f} MB "
+            f"({peak / 1024 / 1024:.1f} MB peak)"
+        )
+
+
+if __name__ == "__main__":
+    run(len(sys.argv) > 1 and int(sys.argv[1]) or 200)
@@ -0,0 +1,87 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Microbenchmark for MIB objects memory footprint.
+
+Reports memory taken by MIB objects of all the MIB modules found in
+the MIB search path, and by managed objects instances of a MIB table
+populated with a number of rows, as an agent would hold them.
+
+Run with::
+
+    python tests/benchmarks/bench_mib_memory.py [rows]
+"""
+
+import sys
+import tracemalloc
+
+from pysnmp.proto import rfc1902
+from pysnmp.smi import builder
+
+COLUMNS = 5
+
+
+def run(rows):
+    tracemalloc.start()
+
+    mibBuilder = builder.MibBuilder()
+
+    size = tracemalloc.get_traced_memory()[0]
+
+    mibBuilder.load_modules()
+
+    size = tracemalloc.get_traced_memory()[0] - size
+
+    count = sum(
+        1
+        for mibSymbols in mibBuilder.mibSymbols.values()
+        for symObj in mibSymbols.values()
+        if hasattr(symObj, "name") and not isinstance(symObj, type)
+    )
+
+    print(f"{count} MIB objects: {size // count} bytes per object")
+
+    (
+        MibTable,
+        MibTableRow,
+        MibTableColumn,
+        MibScalarInstance,
+    ) = mibBuilder.import_symbols(
+        "SNMPv2-SMI", "MibTable", "MibTableRow", "MibTableColumn", "MibScalarInstance"
+    )
+
+    tableName = (1, 3, 6, 1, 4, 1, 20408, 999, 1)
+
+    table = MibTable(tableName)
+    row = MibTableRow(tableName + (1,))
+    columns = [
+        MibTableColumn(row.name + (column,), rfc1902.Integer32())
+        for column in range(1, COLUMNS + 1)
+    ]
+
+    table.registerSubtrees(row)
+    row.registerSubtrees(*columns)
+
+    size = tracemalloc.get_traced_memory()[0]
+
+    for index in range(1, rows + 1):
+        for column in columns:
+            column.registerSubtrees(
+                MibScalarInstance(column.name, (index,), rfc1902.Integer32(index))
+            )
+
+    size = tracemalloc.get_traced_memory()[0] - size
+
+    tracemalloc.stop()
+
+    print(
+        f"{rows} rows of {COLUMNS} columns: {size // rows} bytes per row, "
+        f"{size // rows // COLUMNS} bytes per instance"
+    )
+
+
+if __name__ == "__main__":
+    run(len(sys.argv) > 1 and int(sys.argv[1]) or 100000)
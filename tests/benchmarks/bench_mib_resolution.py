@@ -0,0 +1,68 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Microbenchmark for response var-binds resolution against MIB.
+
+Reports the rate at which table column and scalar var-binds, as
+they come in a response, get resolved into MIB objects and values,
+and the rate of bare OID to MIB node name lookups.
+
+Run with::
+
+    python tests/benchmarks/bench_mib_resolution.py [rows]
+"""
+
+import sys
+import time
+
+from pysnmp.proto import rfc1902
+from pysnmp.smi import builder, view
+from pysnmp.smi.rfc1902 import ObjectIdentity, ObjectType
+
+
+def run(rows):
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.load_modules("SNMPv2-MIB", "SNMP-TARGET-MIB")
+    mibViewController = view.MibViewController(mibBuilder)
+
+    varBinds = []
+
+    for row in range(1, rows + 1):
+        varBinds.append((
+            (1, 3, 6, 1, 6, 3, 12, 1, 2, 1, 4) + tuple(b"target-%d" % row),
+            rfc1902.Integer32(1500),
+        ))
+        varBinds.append((
+            (1, 3, 6, 1, 2, 1, 1, 9, 1, 3, row),
+            rfc1902.OctetString("module"),
+        ))
+        varBinds.append(((1, 3, 6, 1, 2, 1, 1, 3, 0), rfc1902.TimeTicks(row)))
+
+    for _ in range(2):
+        started = time.perf_counter()
+
+        for oid, value in varBinds:
+            ObjectType(ObjectIdentity(rfc1902.ObjectName(oid)), value).resolve_with_mib(
+                mibViewController
+            )
+
+        elapsed = time.perf_counter() - started
+
+        print(f"{len(varBinds)} var-binds: {len(varBinds) / elapsed:.0f} var-binds/s")
+
+    oids = [rfc1902.ObjectName(oid) for oid, _ in varBinds]
+
+    started = time.perf_counter()
+
+    mibViewController.get_node_names_by_oid(oids)
+
+    elapsed = time.perf_counter() - started
+
+    print(f"{len(oids)} OIDs: {len(oids) / elapsed:.0f} lookups/s")
+
+
+if __name__ == "__main__":
+    run(len(sys.argv) > 1 and int(sys.argv[1]) or 2000)
@@ -0,0 +1,62 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Microbenchmark for MIB subsystem start up.
+
+Reports the time it takes to load all the MIB modules found in the
+MIB search path and index them for MIB view, as a freshly started
+process would do, either from MIB sources or from a MIB snapshot.
+
+Run with::
+
+    python tests/benchmarks/bench_mib_startup.py [rounds]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from pysnmp.smi import builder, view
+
+
+def start(snapshotPath=None):
+    mibBuilder = builder.MibBuilder()
+    mibViewController = view.MibViewController(mibBuilder)
+
+    if snapshotPath:
+        mibViewController.load_snapshot(snapshotPath)
+
+    mibBuilder.load_modules()
+    mibViewController.index_mib()
+
+    return mibViewController
+
+
+def run(rounds):
+    snapshotPath = os.path.join(tempfile.mkdtemp(), "mibs.snapshot")
+
+    modNames = list(start().mibBuilder.mibSymbols)
+
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.load_modules(*modNames)
+    view.MibViewController(mibBuilder).save_snapshot(snapshotPath)
+
+    for label, path in (("sources", None), ("snapshot", snapshotPath)):
+        started = time.perf_counter()
+
+        for _ in range(rounds):
+            start(path)
+
+        elapsed = (time.perf_counter() - started) / rounds
+
+        print(f"{len(modNames)} MIB modules from {label}: {elapsed * 1000:.1f} ms")
+
+    os.remove(snapshotPath)
+
+
+if __name__ == "__main__":
+    run(len(sys.argv) > 1 and int(sys.argv[1]) or 20)
@@ -0,0 +1,230 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Benchmark for walking a table with parallel requests.
+
+A local agent serves a populated table behind a UDP relay which delays
+every datagram, as a network round trip would. The table gets walked
+with GETNEXT and GETBULK requests, sequentially and in parallel, and
+the time taken along with the number of requests sent gets reported.
+
+Run with::
+
+    python tests/benchmarks/bench_parallel_walk.py [rows] [delay-ms]
+"""
+
+import asyncio
+import sys
+import time
+
+from pysnmp.carrier.asyncio.dgram import udp
+from pysnmp.entity import config, engine
+from pysnmp.entity.rfc3413 import cmdgen, cmdrsp, context
+from pysnmp.hlapi.v3arch.asyncio import (
+    CommunityData,
+    ContextData,
+    ObjectIdentity,
+    ObjectType,
+    SnmpEngine,
+    UdpTransportTarget,
+    bulk_walk_cmd,
+    walk_cmd,
+)
+from pysnmp.hlapi.v3arch.asyncio.cmdgen import VB_PROCESSOR
+from pysnmp.proto.api import v2c
+
+TABLE = (1, 3, 6, 1, 4, 1, 20408, 999, 1)
+COLUMNS = (1, 2, 3, 4, 5, 6)
+MAX_REPETITIONS = 25
+
+
+def populate(mibBuilder, rows):
+    (MibTable, MibTableRow, MibTableColumn, MibScalarInstance) = (
+        mibBuilder.import_symbols(
+            "SNMPv2-SMI",
+            "MibTable",
+            "MibTableRow",
+            "MibTableColumn",
+            "MibScalarInstance",
+        )
+    )
+
+    columns = [
+        MibTableColumn(TABLE + (1, column), v2c.Integer32()).setMaxAccess("read-only")
+        for column in COLUMNS
+    ]
+
+    instances = [
+        MibScalarInstance(column.name, (row,), v2c.Integer32(row))
+        for column in columns
+        for row in range(rows)
+    ]
+
+    mibBuilder.export_symbols(
+        "__BENCH-MIB",
+        *columns[1:],
+        *instances,
+        benchTable=MibTable(TABLE),
+        benchEntry=MibTableRow(TABLE + (1,)).setIndexNames((
+            0,
+            "__BENCH-MIB",
+            "benchIndex",
+        )),
+        benchIndex=columns[0],
+    )
+
+
+class Upstream(asyncio.DatagramProtocol):
+    """Pass agent responses back to one client after a delay."""
+
+    def __init__(self, relay, clientAddress):
+        self.relay = relay
+        self.clientAddress = clientAddress
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        asyncio.get_running_loop().call_later(
+            self.relay.delay, self.relay.transport.sendto, data, self.clientAddress
+        )
+
+
+class Relay(asyncio.DatagramProtocol):
+    """Forward client datagrams to the agent after a delay."""
+
+    def __init__(self, agentAddress, delay):
+        self.agentAddress = agentAddress
+        self.delay = delay
+        self.upstreams = {}
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        asyncio.ensure_future(self.forward(data, addr))
+
+    async def forward(self, data, addr):
+        if addr not in self.upstreams:
+            self.upstreams[addr] = asyncio.ensure_future(
+                asyncio.get_running_loop().create_datagram_endpoint(
+                    lambda: Upstream(self, addr), remote_addr=self.agentAddress
+                )
+            )
+
+        transport, _ = await self.upstreams[addr]
+
+        asyncio.get_running_loop().call_later(self.delay, transport.sendto, data)
+
+    def close(self):
+        for upstream in self.upstreams.values():
+            upstream.result()[0].close()
+
+        self.transport.close()
+
+
+async def walk(relayAddress, maxParallelRequests, bulk):
+    with SnmpEngine() as snmpEngine:
+        populate(VB_PROCESSOR.get_mib_view_controller(snmpEngine.cache).mibBuilder, 0)
+
+        target = await UdpTransportTarget.create(relayAddress)
+
+        if bulk:
+            objects = bulk_walk_cmd(
+                snmpEngine,
+                CommunityData("public"),
+                target,
+                ContextData(),
+                0,
+                MAX_REPETITIONS,
+                ObjectType(ObjectIdentity(TABLE)),
+                lexicographicMode=False,
+                lookupMib=False,
+                maxParallelRequests=maxParallelRequests,
+            )
+
+        else:
+            objects = walk_cmd(
+                snmpEngine,
+                CommunityData("public"),
+                target,
+                ContextData(),
+                ObjectType(ObjectIdentity(TABLE)),
+                lexicographicMode=False,
+                lookupMib=False,
+                maxParallelRequests=maxParallelRequests,
+            )
+
+        count = 0
+
+        async for errorIndication, errorStatus, errorIndex, varBinds in objects:
+            assert not errorIndication and not errorStatus
+            count += len(varBinds)
+
+        return count
+
+
+async def run(rows, delay):
+    snmpEngine = engine.SnmpEngine()
+
+    transport = udp.UdpTransport().open_server_mode(("127.0.0.1", 0))
+    config.add_transport(snmpEngine, udp.DOMAIN_NAME, transport)
+    config.add_v1_system(snmpEngine, "my-area", "public")
+    config.add_vacm_user(snmpEngine, 2, "my-area", "noAuthNoPriv", (1, 3, 6))
+
+    snmpContext = context.SnmpContext(snmpEngine)
+    populate(snmpContext.get_mib_instrum().get_mib_builder(), rows)
+
+    cmdrsp.NextCommandResponder(snmpEngine, snmpContext)
+    cmdrsp.BulkCommandResponder(snmpEngine, snmpContext)
+
+    await transport._lport
+
+    agentAddress = transport.transport.get_extra_info("sockname")
+
+    relayTransport, relay = await asyncio.get_running_loop().create_datagram_endpoint(
+        lambda: Relay(agentAddress, delay), local_addr=("127.0.0.1", 0)
+    )
+
+    relayAddress = relayTransport.get_extra_info("sockname")
+
+    requests = [0]
+
+    for cls in (cmdgen.NextCommandGenerator, cmdgen.BulkCommandGenerator):
+        send_varbinds = cls.send_varbinds
+
+        def counting_send_varbinds(self, *args, __send_varbinds=send_varbinds):
+            requests[0] += 1
+            return __send_varbinds(self, *args)
+
+        cls.send_varbinds = counting_send_varbinds
+
+    for bulk in (False, True):
+        for maxParallelRequests in (1, 4, 8):
+            requests[0] = 0
+
+            started = time.perf_counter()
+
+            count = await walk(relayAddress, maxParallelRequests, bulk)
+
+            elapsed = time.perf_counter() - started
+
+            print(
+                f"{bulk and 'GETBULK' or 'GETNEXT'} x{maxParallelRequests}: "
+                f"{count} var-binds in {elapsed:.3f}s, {requests[0]} requests"
+            )
+
+    relay.close()
+    snmpEngine.close_dispatcher()
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        run(
+            len(sys.argv) > 1 and int(sys.argv[1]) or 100,
+            (len(sys.argv) > 2 and int(sys.argv[2]) or 10) / 1000,
+        )
+    )
@@ -0,0 +1,61 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Microbenchmark for request cache timer ticks.
+
+Reports the cost of a dispatcher timer tick against the number of
+outstanding requests, while requests keep getting answered before
+they time out.
+
+Run with::
+
+    python tests/benchmarks/bench_request_cache.py [ticks]
+"""
+
+import sys
+import time
+
+from pysnmp.proto.cache import Cache
+
+
+def expire_request(index, cachedParams, timeNow):
+    # Mirrors MsgAndPduDispatcher request expiration check
+    return timeNow >= cachedParams["timeout"]
+
+
+def run(outstanding, ticks):
+    cache = Cache()
+
+    # Spread deadlines over 10 seconds worth of 0.1s ticks
+    for index in range(outstanding):
+        cache.add(index, timeout=index % 100 + ticks)
+
+    handle = outstanding
+
+    started = time.perf_counter()
+
+    for timeNow in range(ticks):
+        cache.expire(expire_request, timeNow, timeNow)
+
+        # Keep the request pool at a steady size
+        for _ in range(10):
+            cache.add(handle, timeout=timeNow + 100)
+            cache.pop(handle - outstanding)
+            handle += 1
+
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{outstanding} outstanding requests: "
+        f"{elapsed / ticks * 1000000:.1f} us per tick"
+    )
+
+
+if __name__ == "__main__":
+    ticks = len(sys.argv) > 1 and int(sys.argv[1]) or 100
+
+    for outstanding in (100, 1000, 10000, 20000):
+        run(outstanding, ticks)
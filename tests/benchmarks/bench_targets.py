@@ -0,0 +1,74 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Microbenchmark for target resolution while new targets get configured.
+
+Models a poller onboarding devices: every new target row is followed by
+a round of lookups of already known targets.
+
+Run with::
+
+    python tests/benchmarks/bench_targets.py [targets] [lookups]
+"""
+
+import random
+import sys
+import time
+from unittest import mock
+
+from pysnmp.carrier.asyncio.dgram import udp
+from pysnmp.entity import config
+from pysnmp.entity.engine import SnmpEngine
+from pysnmp.entity.rfc3413 import config as rfc3413_config
+
+
+def run(targets, lookups):
+    snmpEngine = SnmpEngine()
+    snmpEngine.transport_dispatcher = mock.Mock()
+    snmpEngine.transport_dispatcher.get_transport.return_value = udp.UdpTransport
+
+    config.add_target_parameters(snmpEngine, "params", "public", "noAuthNoPriv", 1)
+
+    random.seed(0)
+
+    configTime = lookupTime = 0.0
+
+    for index in range(targets):
+        name = f"device-{index}"
+
+        started = time.perf_counter()
+
+        config.add_target_address(
+            snmpEngine,
+            name,
+            udp.DOMAIN_NAME,
+            (f"10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}", 161),
+            "params",
+        )
+
+        configTime += time.perf_counter() - started
+
+        started = time.perf_counter()
+
+        for _ in range(lookups):
+            rfc3413_config.get_target_info(
+                snmpEngine, f"device-{random.randrange(index + 1)}"
+            )
+
+        lookupTime += time.perf_counter() - started
+
+    print(
+        f"{targets} targets added in {configTime:.3f}s, "
+        f"{targets * lookups} lookups in {lookupTime:.3f}s, "
+        f"{targets * lookups / lookupTime:.0f} lookups/s"
+    )
+
+
+if __name__ == "__main__":
+    run(
+        len(sys.argv) > 1 and int(sys.argv[1]) or 10000,
+        len(sys.argv) > 2 and int(sys.argv[2]) or 10,
+    )
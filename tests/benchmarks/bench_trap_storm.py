@@ -0,0 +1,103 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Benchmark for receiving a storm of SNMPv2c traps.
+
+A local UDP sender fires bursts of traps at a notification receiver
+and the number of traps processed per second gets reported for the
+default and inline datagram receive paths.
+
+Run with::
+
+    python tests/benchmarks/bench_trap_storm.py [traps]
+"""
+
+import asyncio
+import socket
+import sys
+import time
+
+from pyasn1.codec.ber import encoder
+
+from pysnmp.carrier.asyncio.dgram import udp
+from pysnmp.entity import config, engine
+from pysnmp.entity.rfc3413 import ntfrcv
+from pysnmp.proto.api import v2c
+
+# Traps sent before waiting for the receiver to catch up
+BURST = 200
+
+
+def encode_trap():
+    pdu = v2c.SNMPv2TrapPDU()
+    v2c.apiTrapPDU.set_defaults(pdu)
+    v2c.apiTrapPDU.set_varbinds(
+        pdu,
+        v2c.apiTrapPDU.get_varbinds(pdu)
+        + [((1, 3, 6, 1, 2, 1, 1, 5, 0), v2c.OctetString("storm"))],
+    )
+
+    msg = v2c.Message()
+    v2c.apiMessage.set_defaults(msg)
+    v2c.apiMessage.set_community(msg, "public")
+    v2c.apiMessage.set_pdu(msg, pdu)
+
+    return encoder.encode(msg)
+
+
+async def run(traps, **options):
+    snmpEngine = engine.SnmpEngine()
+
+    transport = udp.UdpTransport(**options).open_server_mode(("127.0.0.1", 0))
+    config.add_transport(snmpEngine, udp.DOMAIN_NAME, transport)
+    config.add_v1_system(snmpEngine, "my-area", "public")
+
+    received = []
+
+    def cbFun(
+        snmpEngine, stateReference, contextEngineId, contextName, varBinds, cbCtx
+    ):
+        received.append(stateReference)
+
+    ntfrcv.NotificationReceiver(snmpEngine, cbFun)
+
+    await transport._lport
+
+    address = transport.transport.get_extra_info("sockname")
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    wholeMsg = encode_trap()
+
+    # Warm up MIB loading and code paths
+    sender.sendto(wholeMsg, address)
+    while not received:
+        await asyncio.sleep(0)
+
+    del received[:]
+
+    started = time.perf_counter()
+
+    for _ in range(traps // BURST):
+        expected = len(received) + BURST
+
+        for _ in range(BURST):
+            sender.sendto(wholeMsg, address)
+
+        while len(received) < expected:
+            await asyncio.sleep(0)
+
+    elapsed = time.perf_counter() - started
+
+    sender.close()
+    snmpEngine.close_dispatcher()
+
+    print(f"{options or 'default'}: {len(received) / elapsed:.0f} traps per second")
+
+
+if __name__ == "__main__":
+    traps = len(sys.argv) > 1 and int(sys.argv[1]) or 10000
+
+    for options in ({}, {"inline": True}):
+        asyncio.run(run(traps, **options))
@@ -0,0 +1,111 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Microbenchmark for VACM access checks against a large view.
+
+Builds a read view of many subtree families, some of them masked, then
+authorizes a GETBULK-sized batch of variables one by one and all at once.
+Then keeps adding and removing a small view of another tenant, checking
+access after each change.
+
+Run with::
+
+    python tests/benchmarks/bench_vacm.py [families] [variables]
+"""
+
+import random
+import sys
+import time
+
+from pysnmp.entity import config
+from pysnmp.entity.engine import SnmpEngine
+from pysnmp.proto import error
+
+ROOT = (1, 3, 6, 1, 4, 1, 20408, 999)
+
+
+def run(families, variables):
+    snmpEngine = SnmpEngine()
+
+    config.add_context(snmpEngine, b"")
+    config.add_vacm_group(snmpEngine, "group", 2, "user")
+    config.add_vacm_access(
+        snmpEngine, "group", b"", 2, "noAuthNoPriv", "exact", "view", "", ""
+    )
+
+    started = time.perf_counter()
+
+    for index in range(families):
+        if index % 10:
+            config.add_vacm_view(snmpEngine, "view", "included", ROOT + (index, 1), b"")
+        else:
+            config.add_vacm_view(
+                snmpEngine,
+                "view",
+                "excluded",
+                ROOT + (index, 1, 0, 7),
+                "1." * (len(ROOT) + 2) + "0.1",
+            )
+
+    configTime = time.perf_counter() - started
+
+    random.seed(0)
+
+    variableNames = [
+        ROOT + (random.randrange(families), 1, random.randrange(5), 7)
+        for _ in range(variables)
+    ]
+
+    vacm = snmpEngine.access_control_model[3]
+
+    # build access and view maps
+    vacm.are_access_allowed(snmpEngine, 2, b"user", 1, "read", b"", variableNames)
+
+    started = time.perf_counter()
+
+    for variableName in variableNames:
+        try:
+            vacm.is_access_allowed(snmpEngine, 2, b"user", 1, "read", b"", variableName)
+
+        except error.StatusInformation:
+            pass
+
+    singleTime = time.perf_counter() - started
+
+    started = time.perf_counter()
+
+    vacm.are_access_allowed(snmpEngine, 2, b"user", 1, "read", b"", variableNames)
+
+    batchTime = time.perf_counter() - started
+
+    changes = 100
+
+    started = time.perf_counter()
+
+    for index in range(changes):
+        if index % 2:
+            config.delete_vacm_view(snmpEngine, "tenant", ROOT)
+        else:
+            config.add_vacm_view(snmpEngine, "tenant", "included", ROOT, b"")
+
+        vacm.are_access_allowed(snmpEngine, 2, b"user", 1, "read", b"", variableNames)
+
+    churnTime = time.perf_counter() - started
+
+    print(
+        f"{families} view families configured in {configTime:.3f}s, "
+        f"{variables} variables checked in {singleTime:.3f}s one by one "
+        f"({variables / singleTime:.0f}/s), in {batchTime:.3f}s "
+        f"all at once ({variables / batchTime:.0f}/s), {changes} changes "
+        f"of another view in {churnTime:.3f}s ({changes / churnTime:.0f}/s)"
+    )
+
+
+if __name__ == "__main__":
+    run(
+        len(sys.argv) > 1 and int(sys.argv[1]) or 1000,
+        len(sys.argv) > 2 and int(sys.argv[2]) or 500,
+    )
@@ -0,0 +1,131 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+"""Microbenchmark for large MIB tables.
+
+Reports time and memory it takes to set up a MIB table of a number of
+rows, along with GET and GETNEXT rates against it, for the table
+populated with managed objects instances and for the table served
+from a columnar data source.
+
+Run with::
+
+    python tests/benchmarks/bench_virtual_table.py [rows]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from pysnmp.proto import rfc1902
+from pysnmp.smi import builder, instrum
+
+COLUMNS = 3
+QUERIES = 2000
+
+
+def build_mib_instrum(rows, virtual):
+    mibBuilder = builder.MibBuilder()
+
+    (
+        MibTable,
+        MibTableRow,
+        MibTableColumn,
+        MibScalarInstance,
+        MibTableDataSource,
+    ) = mibBuilder.import_symbols(
+        "SNMPv2-SMI",
+        "MibTable",
+        "MibTableRow",
+        "MibTableColumn",
+        "MibScalarInstance",
+        "MibTableDataSource",
+    )
+
+    tableName = (1, 3, 6, 1, 4, 1, 20408, 999, 1)
+
+    row = MibTableRow(tableName + (1,))
+    columns = [
+        MibTableColumn(row.name + (column,), rfc1902.Integer32())
+        for column in range(1, COLUMNS + 1)
+    ]
+
+    # (ifIndex, IP address) alike indices
+    instIds = [
+        (1, 10, index >> 16 & 0xFF, index >> 8 & 0xFF, index & 0xFF)
+        for index in range(rows)
+    ]
+
+    tracemalloc.start()
+    started = time.perf_counter()
+
+    if virtual:
+        row.setDataSource(
+            MibTableDataSource(
+                instIds,
+                {column: list(range(rows)) for column in range(1, COLUMNS + 1)},
+            )
+        )
+        instances = []
+
+    else:
+        instances = [
+            MibScalarInstance(column.name, instId, rfc1902.Integer32(value))
+            for column in columns
+            for value, instId in enumerate(instIds)
+        ]
+
+    mibBuilder.export_symbols(
+        "__BENCH-MIB", MibTable(tableName), row, *columns, *instances
+    )
+
+    mibInstrum = instrum.MibInstrumController(mibBuilder)
+    mibInstrum.read_variables((row.name, None))
+
+    elapsed = time.perf_counter() - started
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (
+        mibInstrum,
+        elapsed,
+        size,
+        [column.name + instId for column in columns for instId in instIds],
+    )
+
+
+def run(rows):
+    random.seed(1)
+
+    for virtual in (False, True):
+        mibInstrum, elapsed, size, oids = build_mib_instrum(rows, virtual)
+
+        oids = random.sample(oids, min(QUERIES, len(oids)))
+
+        started = time.perf_counter()
+
+        for oid in oids:
+            mibInstrum.read_variables((oid, None))
+
+        getRate = len(oids) / (time.perf_counter() - started)
+
+        started = time.perf_counter()
+
+        for oid in oids:
+            mibInstrum.read_next_variables((oid, None))
+
+        getNextRate = len(oids) / (time.perf_counter() - started)
+
+        print(
+            f"{virtual and 'data source' or 'instances'} of {rows} rows: "
+            f"set up in {elapsed:.2f} s, {size // 1024} KiB, "
+            f"{getRate:.0f} GETs/s, {getNextRate:.0f} GETNEXTs/s"
+        )
+
+
+if __name__ == "__main__":
+    run(len(sys.argv) > 1 and int(sys.argv[1]) or 50000)
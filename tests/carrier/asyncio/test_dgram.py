@@ -0,0 +1,87 @@
+import asyncio
+import socket
+
+import pytest
+
+from pysnmp.carrier.asyncio.dgram import udp
+
+
+async def receive_datagrams(transport, count):
+    received = []
+
+    def cbFun(transport, transportAddress, datagram):
+        received.append(datagram)
+
+    transport.register_callback(cbFun)
+    transport.open_server_mode(("127.0.0.1", 0))
+    await transport._lport
+
+    port = transport.transport.get_extra_info("sockname")[1]
+
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    for index in range(count):
+        sender.sendto(b"datagram-%d" % index, ("127.0.0.1", port))
+    sender.close()
+
+    for _ in range(100):
+        if len(received) == count:
+            break
+        await asyncio.sleep(0.01)
+
+    transport.close_transport()
+
+    return received
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("options", [{}, {"inline": True}])
+async def test_datagrams_received_in_order(options):
+    transport = udp.UdpTransport(loop=asyncio.get_running_loop(), **options)
+
+    received = await receive_datagrams(transport, 10)
+
+    assert received == [b"datagram-%d" % index for index in range(10)]
+
+
+def test_inline_datagram_received_skips_event_loop():
+    loop = asyncio.new_event_loop()
+    transport = udp.UdpTransport(loop=loop, inline=True)
+
+    received = []
+    transport.register_callback(
+        lambda transport, transportAddress, datagram: received.append(datagram)
+    )
+
+    transport.datagram_received(b"datagram", ("127.0.0.1", 161))
+
+    assert received == [b"datagram"]
+
+    loop.close()
+
+
+@pytest.mark.asyncio
+async def test_send_message_queued_until_connected():
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(1)
+    address = receiver.getsockname()
+
+    transport = udp.UdpTransport(loop=asyncio.get_running_loop())
+    transport.open_client_mode()
+
+    # Queued until the endpoint gets connected
+    for index in range(3):
+        transport.send_message(b"queued-%d" % index, address)
+
+    await transport._lport
+
+    for index in range(3):
+        transport.send_message(b"sent-%d" % index, address)
+
+    received = [receiver.recv(100) for _ in range(6)]
+
+    transport.close_transport()
+    receiver.close()
+
+    assert received[:3] == [b"queued-%d" % index for index in range(3)]
+    assert received[3:] == [b"sent-%d" % index for index in range(3)]
@@ -91,3 +91,43 @@ def test_run_dispatcher_exits_when_closed():
 
     assert not loop.is_running()
     loop.close()
+
+
+def test_exact_timers_tick_on_request_only():
+    loop = asyncio.new_event_loop()
+    dispatcher = AsyncioDispatcher(loop=loop, exactTimers=True)
+
+    ticks = []
+    dispatcher.register_timer_callback(
+        lambda timeNow: ticks.append(dispatcher.get_timer_ticks())
+    )
+
+    loop.run_until_complete(asyncio.sleep(0.3))
+
+    assert ticks == []
+
+    timerTicks = dispatcher.get_timer_ticks() + 1.5
+    dispatcher.request_timer_tick(timerTicks)
+
+    loop.run_until_complete(asyncio.sleep(0.3))
+
+    assert len(ticks) == 1
+    assert timerTicks <= ticks[0] < timerTicks + 0.5
+
+    dispatcher.close_dispatcher()
+    loop.close()
+
+
+def test_exact_timers_keep_custom_intervals():
+    loop = asyncio.new_event_loop()
+    dispatcher = AsyncioDispatcher(loop=loop, exactTimers=True)
+
+    calls = []
+    dispatcher.register_timer_callback(calls.append, 0.05)
+
+    loop.run_until_complete(asyncio.sleep(0.32))
+
+    assert 5 <= len(calls) <= 8
+
+    dispatcher.close_dispatcher()
+    loop.close()
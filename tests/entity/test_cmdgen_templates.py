@@ -0,0 +1,53 @@
+"""Tests for pre-encoded var-bind lists of command generator requests."""
+
+from pyasn1.codec.ber import encoder
+
+from pysnmp.entity.rfc3413 import cmdgen
+from pysnmp.proto.api import msgenc, v2c
+
+OIDS = [(1, 3, 6, 1, 2, 1, 2, 2, 1, 10, index) for index in range(1, 4)]
+
+
+def send_requests(cmdGen, *varBindsSets):
+    reqPDUs = []
+
+    def send_pdu(
+        snmpEngine, targetName, contextEngineId, contextName, PDU, cbFun, cbCtx
+    ):
+        reqPDUs.append(PDU)
+
+    cmdGen.send_pdu = send_pdu
+
+    for varBinds in varBindsSets:
+        cmdGen.send_varbinds(None, "target", None, "", varBinds, None)
+
+    return reqPDUs
+
+
+def test_varbinds_reused():
+    firstPDU, secondPDU, otherPDU = send_requests(
+        cmdgen.GetCommandGenerator(varBindsTemplates=8),
+        [(oid, None) for oid in OIDS],
+        [(v2c.ObjectIdentifier(oid), v2c.null) for oid in OIDS],
+        [(oid, None) for oid in OIDS[1:]],
+    )
+
+    assert firstPDU is not secondPDU
+    assert firstPDU.getComponentByPosition(3) is secondPDU.getComponentByPosition(3)
+    assert firstPDU.getComponentByPosition(3) is not otherPDU.getComponentByPosition(3)
+
+    v2c.apiPDU.set_request_id(secondPDU, 1000)
+
+    assert msgenc.encode(secondPDU) == encoder.encode(secondPDU)
+    assert msgenc.encode(otherPDU) == encoder.encode(otherPDU)
+    assert [oid for oid, _ in v2c.apiPDU.get_varbinds(secondPDU)] == OIDS
+
+
+def test_varbinds_not_reused_by_default():
+    firstPDU, secondPDU = send_requests(
+        cmdgen.GetCommandGenerator(),
+        [(oid, None) for oid in OIDS],
+        [(oid, None) for oid in OIDS],
+    )
+
+    assert firstPDU.getComponentByPosition(3) is not secondPDU.getComponentByPosition(3)
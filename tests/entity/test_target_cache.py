@@ -0,0 +1,105 @@
+from unittest import mock
+
+import pytest
+
+from pysnmp.carrier.asyncio.dgram import udp
+from pysnmp.entity import config
+from pysnmp.entity.engine import SnmpEngine
+from pysnmp.entity.rfc3413 import config as rfc3413_config
+from pysnmp.smi.error import SmiError
+
+
+@pytest.fixture
+def snmpEngine():
+    with SnmpEngine() as snmpEngine:
+        snmpEngine.transport_dispatcher = mock.Mock()
+        snmpEngine.transport_dispatcher.get_transport.return_value = udp.UdpTransport
+        yield snmpEngine
+
+
+def test_get_target_address_survives_other_targets_churn(snmpEngine):
+    config.add_target_address(
+        snmpEngine, "target-1", udp.DOMAIN_NAME, ("127.0.0.1", 161), "params"
+    )
+
+    info = rfc3413_config.get_target_address(snmpEngine, "target-1")
+
+    config.add_target_address(
+        snmpEngine, "target-2", udp.DOMAIN_NAME, ("127.0.0.2", 161), "params"
+    )
+    config.delete_target_address(snmpEngine, "target-2")
+
+    assert rfc3413_config.get_target_address(snmpEngine, "target-1") is info
+
+
+def test_get_target_address_invalidated_on_row_change(snmpEngine):
+    config.add_target_address(
+        snmpEngine, "target-1", udp.DOMAIN_NAME, ("127.0.0.1", 161), "params"
+    )
+
+    _, addr, _, _, _ = rfc3413_config.get_target_address(snmpEngine, "target-1")
+    assert tuple(addr) == ("127.0.0.1", 161)
+
+    config.add_target_address(
+        snmpEngine, "target-1", udp.DOMAIN_NAME, ("127.0.0.3", 162), "params"
+    )
+
+    _, addr, _, _, _ = rfc3413_config.get_target_address(snmpEngine, "target-1")
+    assert tuple(addr) == ("127.0.0.3", 162)
+
+    config.delete_target_address(snmpEngine, "target-1")
+
+    with pytest.raises(SmiError):
+        rfc3413_config.get_target_address(snmpEngine, "target-1")
+
+
+def test_get_target_parameters_invalidated_on_row_change(snmpEngine):
+    config.add_target_parameters(snmpEngine, "params-1", "public", "noAuthNoPriv")
+    config.add_target_parameters(snmpEngine, "params-2", "public", "noAuthNoPriv")
+
+    info = rfc3413_config.get_target_parameters(snmpEngine, "params-1")
+    assert info[1] == 3
+
+    config.add_target_parameters(
+        snmpEngine, "params-2", "public", "noAuthNoPriv", mpModel=0
+    )
+
+    assert rfc3413_config.get_target_parameters(snmpEngine, "params-1") is info
+    assert rfc3413_config.get_target_parameters(snmpEngine, "params-2")[0] == 0
+
+    config.delete_target_parameters(snmpEngine, "params-1")
+
+    with pytest.raises(SmiError):
+        rfc3413_config.get_target_parameters(snmpEngine, "params-1")
+
+
+def test_replaced_rows_not_observed(snmpEngine):
+    config.add_target_address(
+        snmpEngine, "target-1", udp.DOMAIN_NAME, ("127.0.0.1", 161), "params"
+    )
+
+    rfc3413_config.get_target_address(snmpEngine, "target-1")
+
+    mibBuilder = snmpEngine.get_mib_builder()
+
+    (MibTableRow, snmpTargetAddrEntry) = mibBuilder.import_symbols(
+        "SNMPv2-SMI", "MibTableRow"
+    ) + mibBuilder.import_symbols("SNMP-TARGET-MIB", "snmpTargetAddrEntry")
+
+    observers = len(snmpTargetAddrEntry.rowObservers)
+
+    newSnmpTargetAddrEntry = MibTableRow(snmpTargetAddrEntry.name).setIndexNames(
+        *snmpTargetAddrEntry.indexNames
+    )
+
+    # As if the MIB module got reloaded
+    mibBuilder.unexport_symbols("SNMP-TARGET-MIB", "snmpTargetAddrEntry")
+    mibBuilder.export_symbols(
+        "SNMP-TARGET-MIB", snmpTargetAddrEntry=newSnmpTargetAddrEntry
+    )
+
+    for _ in range(2):
+        rfc3413_config.get_target_address(snmpEngine, "target-1")
+
+    assert len(snmpTargetAddrEntry.rowObservers) == observers - 1
+    assert len(newSnmpTargetAddrEntry.rowObservers) == 1
@@ -2,6 +2,7 @@ import asyncio
 from datetime import datetime
 import pytest
 
+from pysnmp.carrier.asyncio.dispatch import AsyncioDispatcher
 from pysnmp.hlapi.v3arch.asyncio import *
 from pysnmp.proto.errind import RequestTimedOut
 from pysnmp.proto.rfc1905 import errorStatus as pysnmp_errorStatus
@@ -78,6 +79,36 @@ async def test_v1_get_timeout_invalid_target():
             assert False, "Test case timed out"
 
 
+@pytest.mark.asyncio
+async def test_v1_get_timeout_exact_timers():
+    with SnmpEngine() as snmpEngine:
+        snmpEngine.register_transport_dispatcher(AsyncioDispatcher(exactTimers=True))
+
+        transportTarget = await UdpTransportTarget.create(
+            ("1.2.3.4", 161), timeout=0.25, retries=1
+        )
+
+        async def run_get():
+            return await get_cmd(
+                snmpEngine,
+                CommunityData("community_string"),
+                transportTarget,
+                ContextData(),
+                ObjectType(ObjectIdentity("1.3.6.1.4.1.60069.9.1.0")),
+            )
+
+        await asyncio.wait_for(run_get(), timeout=5)  # warm up MIB loading
+
+        start = datetime.now()
+        errorIndication, errorStatus, errorIndex, varBinds = await asyncio.wait_for(
+            run_get(), timeout=3
+        )
+        elapsed_time = (datetime.now() - start).total_seconds()
+
+        assert isinstance(errorIndication, RequestTimedOut)
+        assert 0.5 <= elapsed_time < 0.55  # two exact transport timeouts
+
+
 @pytest.mark.asyncio
 async def test_v1_get_slow_object():
     async with AgentContextManager(enable_custom_objects=True):
@@ -78,6 +78,40 @@ async def test_v2_walk_subtree():
             assert len(objects_list) == 8
 
 
+@pytest.mark.asyncio
+async def test_v2_walk_subtree_parallel():
+    async with AgentContextManager():
+        with SnmpEngine() as snmpEngine:
+            names = []
+            for maxParallelRequests in (1, 3):
+                objects = walk_cmd(
+                    snmpEngine,
+                    CommunityData("public"),
+                    await UdpTransportTarget.create(("localhost", AGENT_PORT)),
+                    ContextData(),
+                    ObjectType(ObjectIdentity("SNMP-USER-BASED-SM-MIB", "usmUser")),
+                    lexicographicMode=False,
+                    maxParallelRequests=maxParallelRequests,
+                )
+
+                objects_list = [item async for item in objects]
+
+                for errorIndication, errorStatus, errorIndex, varBinds in objects_list:
+                    assert errorIndication is None
+                    assert errorStatus == 0
+                    assert len(varBinds) == 1
+
+                names.append([
+                    varBinds[0][0].prettyPrint() for _, _, _, varBinds in objects_list
+                ])
+
+            assert names[0][0].startswith(
+                "SNMP-USER-BASED-SM-MIB::usmUserSecurityName."
+            )
+            assert len(names[0]) == 44
+            assert names[1] == names[0]
+
+
 @pytest.mark.asyncio
 async def test_v2_walk_yields_error_status():
     """Regression test for issue #236: walk_cmd must yield errorStatus before terminating."""
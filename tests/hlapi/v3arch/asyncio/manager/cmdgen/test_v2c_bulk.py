@@ -75,3 +75,25 @@ async def test_v2c_bulk_multiple_input():
 
 
 # snmpbulkget -v2c -c public -C n1 -C r2 localhost 1.3.6.1.2.1.1.4 1.3.6.1.2.1.1.9.1.1 1.3.6.1.2.1.1.9.1.3
+
+
+@pytest.mark.asyncio
+async def test_v2c_bulk_fills_response():
+    async with AgentContextManager():
+        with SnmpEngine() as snmpEngine:
+            errorIndication, errorStatus, errorIndex, varBinds = await bulk_cmd(
+                snmpEngine,
+                CommunityData("public"),
+                await UdpTransportTarget.create(("localhost", AGENT_PORT)),
+                ContextData(),
+                0,
+                1000,
+                ObjectType(ObjectIdentity("SNMPv2-MIB", "sysDescr", 0)),
+                retries=0,
+                lookupMib=False,
+            )
+
+            assert errorIndication is None
+            assert errorStatus == 0
+            # more than a fixed var-binds cap would let through
+            assert 64 < len(varBinds) < 1000
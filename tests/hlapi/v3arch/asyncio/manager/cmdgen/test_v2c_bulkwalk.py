@@ -1,6 +1,8 @@
+import asyncio
 import math
 import pytest
 
+from pysnmp.entity.rfc3413.cmdgen import BulkCommandGenerator
 from pysnmp.hlapi.v3arch.asyncio import *
 from tests.agent_context import AGENT_PORT, AgentContextManager
 
@@ -361,6 +363,108 @@ async def test_bulk_walk_lookupmib_true():
             assert count > 0, "No lookupMib=True responses processed"
 
 
+async def _bulk_walk_responses(snmpEngine, maxRepetitions, objectIdentity, **options):
+    objects = bulk_walk_cmd(
+        snmpEngine,
+        CommunityData("public"),
+        await UdpTransportTarget.create(("localhost", AGENT_PORT)),
+        ContextData(),
+        0,
+        maxRepetitions,
+        ObjectType(objectIdentity),
+        lexicographicMode=False,
+        **options,
+    )
+
+    responses = []
+    async for errorIndication, errorStatus, errorIndex, varBinds in objects:
+        assert errorIndication is None
+        assert errorStatus == 0
+        responses.append([name.prettyPrint() for name, _ in varBinds])
+
+    return responses
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "options", [{}, {"maxRows": 3}, {"maxRows": 7}, {"maxCalls": 2}]
+)
+async def test_v2c_get_table_bulk_parallel(options):
+    async with AgentContextManager():
+        with SnmpEngine() as snmpEngine:
+            sequential = await _bulk_walk_responses(
+                snmpEngine,
+                5,
+                ObjectIdentity("SNMP-USER-BASED-SM-MIB", "usmUser"),
+                **options,
+            )
+            parallel = await _bulk_walk_responses(
+                snmpEngine,
+                5,
+                ObjectIdentity("SNMP-USER-BASED-SM-MIB", "usmUser"),
+                maxParallelRequests=4,
+                **options,
+            )
+
+            assert sequential[0][0].startswith(
+                "SNMP-USER-BASED-SM-MIB::usmUserSecurityName."
+            )
+            assert parallel == sequential
+
+
+@pytest.mark.asyncio
+async def test_v2c_get_table_bulk_parallel_small_subtree(monkeypatch):
+    requests = []
+
+    send_varbinds = BulkCommandGenerator.send_varbinds
+
+    def counting_send_varbinds(self, *args):
+        requests.append(args)
+        return send_varbinds(self, *args)
+
+    monkeypatch.setattr(BulkCommandGenerator, "send_varbinds", counting_send_varbinds)
+
+    async with AgentContextManager():
+        with SnmpEngine() as snmpEngine:
+            responses = await _bulk_walk_responses(
+                snmpEngine,
+                10,
+                ObjectIdentity("SNMPv2-MIB", "system"),
+                maxParallelRequests=4,
+            )
+
+            # whole subtree fits into one response, nothing to split
+            assert len(responses) == 1
+            assert len(responses[0]) == 8
+            assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_v2c_get_table_bulk_parallel_stopped_early():
+    loopErrors = []
+
+    asyncio.get_running_loop().set_exception_handler(
+        lambda loop, context: loopErrors.append(context)
+    )
+
+    async with AgentContextManager():
+        with SnmpEngine() as snmpEngine:
+            responses = await _bulk_walk_responses(
+                snmpEngine,
+                2,
+                ObjectIdentity("SNMP-USER-BASED-SM-MIB", "usmUser"),
+                maxParallelRequests=4,
+                maxRows=3,
+            )
+
+            assert [len(varBinds) for varBinds in responses] == [2, 2, 1]
+
+        # would responses still be coming in, they would hit closed engine
+        await asyncio.sleep(0.5)
+
+    assert not loopErrors
+
+
 @pytest.mark.asyncio
 async def test_bulk_walk_lookupmib_false():
     """
@@ -0,0 +1,67 @@
+"""Tests for the request cache used by the message dispatcher."""
+
+from pysnmp.proto.cache import Cache
+
+
+def expire_request(index, cachedParams, expired):
+    expired.append(index)
+    return True
+
+
+def test_expire_visits_due_entries_only():
+    cache = Cache()
+    for index in range(10):
+        cache.add(index, timeout=10 - index)
+
+    expired = []
+    cache.expire(expire_request, expired, 3)
+
+    assert sorted(expired) == [7, 8, 9]
+
+    cache.expire(expire_request, expired, 5)
+
+    assert sorted(expired) == [5, 6, 7, 8, 9]
+    assert cache.pop(9) is None
+    assert cache.pop(4) == {"timeout": 6}
+
+
+def test_expire_skips_popped_and_rescheduled_entries():
+    cache = Cache()
+    cache.add(1, timeout=1)
+    cache.add(2, timeout=1)
+    cache.add(3, timeout=1)
+
+    cache.pop(1)
+    cache.update(2, timeout=5)
+
+    expired = []
+    cache.expire(expire_request, expired, 2)
+
+    assert expired == [3]
+
+    cache.expire(expire_request, expired, 5)
+
+    assert expired == [3, 2]
+
+
+def test_expire_keeps_entries_not_expired_by_callback():
+    cache = Cache()
+    cache.add(1, timeout=1)
+
+    calls = []
+    cache.expire(lambda index, cachedParams, cbCtx: calls.append(index), None, 1)
+    cache.expire(lambda index, cachedParams, cbCtx: calls.append(index), None, 2)
+
+    assert calls == [1, 1]
+    assert cache.pop(1) == {"timeout": 1}
+
+
+def test_expire_without_time_checks_all_entries():
+    cache = Cache()
+    cache.add(1, timeout=100)
+    cache.add(2)
+
+    expired = []
+    cache.expire(expire_request, expired)
+
+    assert sorted(expired) == [1, 2]
@@ -0,0 +1,127 @@
+"""Tests for USM passphrase to key conversion and key caching."""
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import md5, sha1, sha256
+
+import pytest
+from pyasn1.type import univ
+
+from pysnmp.entity import config
+from pysnmp.proto.secmod.rfc3414 import localkey
+
+
+@pytest.fixture
+def key_cache():
+    keyCache = localkey.KeyCache(maxSize=2)
+    previousKeyCache = localkey.get_key_cache()
+    localkey.set_key_cache(keyCache)
+    yield keyCache
+    localkey.set_key_cache(previousKeyCache)
+    keyCache.close()
+
+
+def test_password_to_key_rfc3414_vectors():
+    # RFC3414: A.3.1 & A.3.2
+    engineId = univ.OctetString(hexValue="000000000000000000000002")
+
+    assert (
+        localkey.password_to_key_md5("maplesyrup", engineId).asOctets().hex()
+        == "526f5eed9fcce26f8964c2930787d82b"
+    )
+    assert (
+        localkey.password_to_key_sha("maplesyrup", engineId).asOctets().hex()
+        == "6695febc9288e36282235fc7151f128497b38f3f"
+    )
+
+
+def test_hash_passphrase_uses_cache(key_cache):
+    masterKey = localkey.hash_passphrase("maplesyrup", sha1)
+
+    index = key_cache.get_index(b"maplesyrup", "sha1")
+
+    assert key_cache.get(index) == masterKey.asOctets()
+
+    key_cache.set(index, b"cached")
+
+    assert localkey.hash_passphrase("maplesyrup", sha1) == b"cached"
+    assert localkey.hash_passphrase("maplesyrup", md5) != b"cached"
+
+
+def test_key_cache_evicts_least_recently_used():
+    keyCache = localkey.KeyCache(maxSize=2)
+    keyCache.set(b"a", b"1")
+    keyCache.set(b"b", b"2")
+    keyCache.get(b"a")
+    keyCache.set(b"c", b"3")
+
+    assert keyCache.get(b"a") == b"1"
+    assert keyCache.get(b"b") is None
+    assert keyCache.get(b"c") == b"3"
+
+
+def test_key_cache_persists_keys(tmp_path):
+    path = str(tmp_path / "keys")
+
+    keyCache = localkey.KeyCache(path=path)
+    keyCache.set(b"a", b"1")
+    keyCache.close()
+
+    keyCache = localkey.KeyCache(path=path)
+
+    assert keyCache.get(b"a") == b"1"
+    assert keyCache.get(b"b") is None
+
+    keyCache.close()
+
+
+def test_key_cache_index_is_keyed_per_store(tmp_path):
+    path = str(tmp_path / "keys")
+
+    keyCache = localkey.KeyCache(path=path)
+    index = keyCache.get_index(b"maplesyrup", "sha1")
+    keyCache.close()
+
+    # Unsalted digest of the passphrase would be the same in every store
+    assert index != hashlib.sha256(b"sha1:maplesyrup").digest()
+    assert index != localkey.KeyCache().get_index(b"maplesyrup", "sha1")
+
+    keyCache = localkey.KeyCache(path=path)
+
+    assert keyCache.get_index(b"maplesyrup", "sha1") == index
+    assert keyCache.get_index(b"maplesyrup", "md5") != index
+
+    keyCache.close()
+
+
+def test_hash_passphrases(key_cache):
+    passphrases = ["maplesyrup", "authkey1", "maplesyrup"]
+
+    with ThreadPoolExecutor(2) as executor:
+        masterKeys = localkey.hash_passphrases(passphrases, sha256, executor)
+
+    localkey.set_key_cache(None)
+
+    assert masterKeys == [localkey.hash_passphrase(x, sha256) for x in passphrases]
+
+
+def test_hash_v3_user_keys(key_cache):
+    users = [
+        (
+            config.USM_AUTH_HMAC96_SHA,
+            "authkey1",
+            config.USM_PRIV_CFB128_AES,
+            "privkey1",
+        ),
+        (config.USM_AUTH_HMAC96_MD5, "authkey1", config.USM_PRIV_NONE, None),
+        (config.USM_AUTH_NONE, None, config.USM_PRIV_NONE, None),
+    ]
+
+    assert config.hash_v3_user_keys(users) == [
+        (
+            localkey.hash_passphrase("authkey1", sha1),
+            localkey.hash_passphrase("privkey1", sha1),
+        ),
+        (localkey.hash_passphrase("authkey1", md5), None),
+        (None, None),
+    ]
@@ -0,0 +1,177 @@
+"""Tests for the fast SNMP message BER decoder."""
+
+import pytest
+from pyasn1.codec.ber import decoder, encoder
+from pyasn1.error import PyAsn1Error
+
+from pysnmp.proto import rfc1905
+from pysnmp.proto.api import msgdec, v1, v2c
+from pysnmp.proto.mpmod.rfc3412 import SnmpV3MessageProcessingModel
+from pysnmp.proto.secmod.rfc3414.service import UsmSecurityParameters
+
+
+def build_v2c_message(pdu, varBinds):
+    v2c.apiPDU.set_defaults(pdu)
+    v2c.apiPDU.set_request_id(pdu, 12345)
+    v2c.apiPDU.set_varbinds(pdu, varBinds)
+    msg = v2c.Message()
+    v2c.apiMessage.set_defaults(msg)
+    v2c.apiMessage.set_community(msg, "public")
+    v2c.apiMessage.set_pdu(msg, pdu)
+    return msg
+
+
+def assert_decoded_alike(substrate, asn1Spec):
+    expected, expectedRest = decoder.decode(substrate, asn1Spec=asn1Spec)
+    value, rest = msgdec.decode(substrate, asn1Spec=asn1Spec)
+
+    assert value == expected
+    assert value.prettyPrint() == expected.prettyPrint()
+    assert rest == expectedRest
+    return value
+
+
+def test_v2c_response():
+    msg = build_v2c_message(
+        v2c.ResponsePDU(),
+        [
+            ((1, 3, 6, 1, 2, 1, 1, 1, 0), v2c.OctetString("Linux box")),
+            ((1, 3, 6, 1, 2, 1, 1, 2, 0), v2c.ObjectIdentifier((1, 3, 6, 1, 4, 1))),
+            ((1, 3, 6, 1, 2, 1, 1, 3, 0), v2c.TimeTicks(123)),
+            ((1, 3, 6, 1, 2, 1, 2, 1, 0), v2c.Integer(-3)),
+            ((1, 3, 6, 1, 2, 1, 2, 2, 1, 10, 1), v2c.Counter32(0xFFFFFFFF)),
+            ((1, 3, 6, 1, 2, 1, 31, 1, 1, 1, 6, 1), v2c.Counter64(2**64 - 1)),
+            ((1, 3, 6, 1, 2, 1, 4, 20, 1, 1, 1), v2c.IpAddress("10.0.0.1")),
+            ((1, 3, 6, 1, 2, 1, 25, 1, 1, 0), v2c.Gauge32(7)),
+            ((1, 3, 6, 1, 4, 1, 20408, 1), v2c.Opaque(b"\x00\x01")),
+            ((1, 3, 6, 1, 4, 1, 20408, 2), rfc1905.noSuchObject),
+            ((1, 3, 6, 1, 4, 1, 20408, 3), rfc1905.noSuchInstance),
+            ((2, 999, 1), rfc1905.endOfMibView),
+        ],
+    )
+
+    substrate = encoder.encode(msg)
+
+    value = assert_decoded_alike(substrate + b"\x00\x00", v2c.Message())
+
+    assert v2c.apiPDU.get_varbinds(v2c.apiMessage.get_pdu(value)) == [
+        (oid, val) for oid, val in v2c.apiPDU.get_varbinds(v2c.apiMessage.get_pdu(msg))
+    ]
+
+
+def test_v2c_requests():
+    assert_decoded_alike(
+        encoder.encode(
+            build_v2c_message(
+                v2c.GetRequestPDU(), [((1, 3, 6, 1, 2, 1, 1, 1, 0), None)]
+            )
+        ),
+        v2c.Message(),
+    )
+
+    pdu = v2c.GetBulkRequestPDU()
+    v2c.apiBulkPDU.set_defaults(pdu)
+    v2c.apiBulkPDU.set_max_repetitions(pdu, 25)
+    v2c.apiBulkPDU.set_varbinds(pdu, [((1, 3, 6), None)])
+    msg = v2c.Message()
+    v2c.apiMessage.set_defaults(msg)
+    v2c.apiMessage.set_pdu(msg, pdu)
+
+    assert_decoded_alike(encoder.encode(msg), v2c.Message())
+
+
+def test_v1_trap():
+    pdu = v1.TrapPDU()
+    v1.apiTrapPDU.set_defaults(pdu)
+    v1.apiTrapPDU.set_varbinds(pdu, [((1, 3, 6, 1, 4, 1, 1), v1.Integer(1))])
+    msg = v1.Message()
+    v1.apiMessage.set_defaults(msg)
+    v1.apiMessage.set_pdu(msg, pdu)
+
+    assert_decoded_alike(encoder.encode(msg), v1.Message())
+
+
+def test_v3_message():
+    mpModel = SnmpV3MessageProcessingModel()
+
+    msg = mpModel._snmpMsgSpec.clone()
+    msg.setComponentByPosition(0, 3)
+    headerData = msg.setComponentByPosition(1).getComponentByPosition(1)
+    headerData.setComponentByPosition(0, 1234)
+    headerData.setComponentByPosition(1, 65507)
+    headerData.setComponentByPosition(2, b"\x04")
+    headerData.setComponentByPosition(3, 3)
+
+    securityParameters = UsmSecurityParameters()
+    securityParameters.setComponentByPosition(0, b"\x80\x00\x4f\xb8\x05")
+    securityParameters.setComponentByPosition(1, 1)
+    securityParameters.setComponentByPosition(2, 42)
+    securityParameters.setComponentByPosition(3, b"usr")
+    securityParameters.setComponentByPosition(4, b"")
+    securityParameters.setComponentByPosition(5, b"")
+    msg.setComponentByPosition(2, encoder.encode(securityParameters))
+
+    scopedPDU = msg.setComponentByPosition(3).getComponentByPosition(3)
+    scopedPDU = scopedPDU.setComponentByPosition(0).getComponentByPosition(0)
+    scopedPDU.setComponentByPosition(0, b"\x80\x00\x4f\xb8\x05")
+    scopedPDU.setComponentByPosition(1, b"")
+    pdu = v2c.GetRequestPDU()
+    v2c.apiPDU.set_defaults(pdu)
+    v2c.apiPDU.set_varbinds(pdu, [((1, 3, 6, 1, 2, 1, 1, 1, 0), None)])
+    scopedPDU.setComponentByPosition(2).getComponentByPosition(2).setComponentByType(
+        pdu.tagSet, pdu
+    )
+
+    value = assert_decoded_alike(encoder.encode(msg), mpModel._snmpMsgSpec)
+
+    assert_decoded_alike(value.getComponentByPosition(2), UsmSecurityParameters())
+
+
+def test_fast_path_taken(monkeypatch):
+    substrate = encoder.encode(
+        build_v2c_message(
+            v2c.ResponsePDU(), [((1, 3, 6, 1, 2, 1, 1, 1, 0), rfc1905.noSuchObject)]
+        )
+    )
+
+    monkeypatch.setattr(msgdec, "decoder", None)
+
+    msg, rest = msgdec.decode(substrate, asn1Spec=v2c.Message())
+
+    assert v2c.apiPDU.get_varbinds(v2c.apiMessage.get_pdu(msg)) == [
+        ((1, 3, 6, 1, 2, 1, 1, 1, 0), rfc1905.noSuchObject)
+    ]
+    assert not rest
+
+
+def test_long_length_form():
+    substrate = encoder.encode(
+        build_v2c_message(
+            v2c.ResponsePDU(),
+            [((1, 3, 6, 1, 2, 1, 1, 1, 0), v2c.OctetString("x" * 300))],
+        )
+    )
+
+    assert substrate[1] == 0x82
+
+    assert_decoded_alike(substrate, v2c.Message())
+
+
+def test_indefinite_length_falls_back():
+    msg = build_v2c_message(v2c.GetRequestPDU(), [((1, 3, 6, 1, 2, 1, 1, 1, 0), None)])
+
+    substrate = encoder.encode(msg, defMode=False)
+
+    assert substrate[1] == 0x80
+
+    assert_decoded_alike(substrate, v2c.Message())
+
+
+def test_malformed_message():
+    substrate = encoder.encode(
+        build_v2c_message(v2c.GetRequestPDU(), [((1, 3, 6), None)])
+    )
+
+    for badSubstrate in (substrate[:-3], b"\x30\x03\x02\x01", b"\x04\x00"):
+        with pytest.raises(PyAsn1Error):
+            msgdec.decode(badSubstrate, asn1Spec=v2c.Message())
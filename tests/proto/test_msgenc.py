@@ -0,0 +1,150 @@
+"""Tests for the fast SNMP message BER encoder."""
+
+import pytest
+from pyasn1.codec.ber import decoder, encoder
+from pyasn1.error import PyAsn1Error
+
+from pysnmp.proto import rfc1905
+from pysnmp.proto.api import msgenc, v1, v2c
+from pysnmp.proto.mpmod.rfc3412 import SnmpV3MessageProcessingModel
+from pysnmp.proto.secmod.rfc3414.service import UsmSecurityParameters
+
+
+def build_v2c_message(pdu, varBinds):
+    v2c.apiPDU.set_defaults(pdu)
+    v2c.apiPDU.set_request_id(pdu, 12345)
+    v2c.apiPDU.set_varbinds(pdu, varBinds)
+    msg = v2c.Message()
+    v2c.apiMessage.set_defaults(msg)
+    v2c.apiMessage.set_community(msg, "public")
+    v2c.apiMessage.set_pdu(msg, pdu)
+    return msg
+
+
+def test_v2c_response():
+    msg = build_v2c_message(
+        v2c.ResponsePDU(),
+        [
+            ((1, 3, 6, 1, 2, 1, 1, 1, 0), v2c.OctetString("x" * 300)),
+            ((1, 3, 6, 1, 2, 1, 1, 2, 0), v2c.ObjectIdentifier((2, 999, 16384))),
+            ((1, 3, 6, 1, 2, 1, 1, 3, 0), v2c.TimeTicks(0)),
+            ((1, 3, 6, 1, 2, 1, 2, 1, 0), v2c.Integer(-129)),
+            ((1, 3, 6, 1, 2, 1, 2, 1, 2), v2c.Integer(128)),
+            ((1, 3, 6, 1, 2, 1, 2, 2, 1, 10, 1), v2c.Counter32(0xFFFFFFFF)),
+            ((1, 3, 6, 1, 2, 1, 31, 1, 1, 1, 6, 1), v2c.Counter64(2**64 - 1)),
+            ((1, 3, 6, 1, 2, 1, 4, 20, 1, 1, 1), v2c.IpAddress("10.0.0.1")),
+            ((1, 3, 6, 1, 4, 1, 20408, 1), v2c.Opaque(b"\x00\x01")),
+            ((1, 3, 6, 1, 4, 1, 20408, 2), rfc1905.noSuchObject),
+            ((1, 3, 6, 1, 4, 1, 20408, 3), rfc1905.endOfMibView),
+        ],
+    )
+
+    assert msgenc.encode(msg) == encoder.encode(msg)
+
+
+def test_minimal_integers():
+    # pyasn1 encodes some negative numbers with a redundant leading octet
+    for value, substrate in ((-128, b"\x80"), (-32768, b"\x80\x00"), (-1, b"\xff")):
+        assert (
+            msgenc.encode(v2c.Integer(value))
+            == b"\x02" + bytes((len(substrate),)) + substrate
+        )
+        assert decoder.decode(msgenc.encode(v2c.Integer(value)))[0] == value
+
+
+def test_v1_trap():
+    pdu = v1.TrapPDU()
+    v1.apiTrapPDU.set_defaults(pdu)
+    v1.apiTrapPDU.set_varbinds(pdu, [((1, 3, 6, 1, 4, 1, 1), v1.Integer(1))])
+    msg = v1.Message()
+    v1.apiMessage.set_defaults(msg)
+    v1.apiMessage.set_pdu(msg, pdu)
+
+    assert msgenc.encode(msg) == encoder.encode(msg)
+
+
+def test_v3_message():
+    msg = SnmpV3MessageProcessingModel()._snmpMsgSpec.clone()
+    msg.setComponentByPosition(0, 3)
+    headerData = msg.setComponentByPosition(1).getComponentByPosition(1)
+    headerData.setComponentByPosition(0, 1234)
+    headerData.setComponentByPosition(1, 65507)
+    headerData.setComponentByPosition(2, b"\x04")
+    headerData.setComponentByPosition(3, 3)
+
+    securityParameters = UsmSecurityParameters()
+    for idx, value in enumerate((b"\x80\x00\x4f\xb8\x05", 1, 42, b"usr", b"", b"")):
+        securityParameters.setComponentByPosition(idx, value)
+
+    assert msgenc.encode(securityParameters) == encoder.encode(securityParameters)
+
+    msg.setComponentByPosition(2, msgenc.encode(securityParameters))
+
+    scopedPDU = msg.setComponentByPosition(3).getComponentByPosition(3)
+    scopedPDU = scopedPDU.setComponentByPosition(0).getComponentByPosition(0)
+    scopedPDU.setComponentByPosition(0, b"\x80\x00\x4f\xb8\x05")
+    scopedPDU.setComponentByPosition(1, b"")
+    pdu = v2c.GetRequestPDU()
+    v2c.apiPDU.set_defaults(pdu)
+    v2c.apiPDU.set_varbinds(pdu, [((1, 3, 6, 1, 2, 1, 1, 1, 0), None)])
+    scopedPDU.setComponentByPosition(2).getComponentByPosition(2).setComponentByType(
+        pdu.tagSet, pdu
+    )
+
+    assert msgenc.encode(msg) == encoder.encode(msg)
+
+
+def test_frozen_varbinds():
+    msg = build_v2c_message(
+        v2c.GetRequestPDU(), [((1, 3, 6, 1, 2, 1, 1, 1, 0), None)] * 3
+    )
+    pdu = v2c.apiMessage.get_pdu(msg)
+
+    varBindList = msgenc.freeze(pdu.getComponentByPosition(3))
+
+    for requestId in (1, 100000, 2**31 - 1):
+        v2c.apiPDU.set_request_id(pdu, requestId)
+        v2c.apiMessage.set_community(msg, "c" * requestId.bit_length())
+
+        assert msgenc.encode(msg) == encoder.encode(msg)
+
+    # make sure it's the substrate that gets copied in
+    varBindList._substrate = varBindList._substrate.replace(b"\x2b", b"\x2c")
+
+    assert msgenc.encode(msg) != encoder.encode(msg)
+
+
+def test_incomplete_message():
+    msg = v2c.Message()
+    v2c.apiMessage.set_defaults(msg)
+
+    with pytest.raises(PyAsn1Error):
+        msgenc.encode(msg)
+
+    pdu = v2c.GetRequestPDU()
+    pdu.setComponentByPosition(0, 1)
+
+    with pytest.raises(PyAsn1Error):
+        msgenc.encode(pdu)
+
+
+def test_var_bind():
+    for name, value in (
+        ((1, 3, 6, 1, 2, 1, 1, 1, 0), v2c.OctetString("x" * 200)),
+        (v2c.ObjectIdentifier((1, 3, 6, 1, 4, 1, 20408, 2**32)), rfc1905.endOfMibView),
+        ((2, 100, 3), v2c.Integer(-1)),
+    ):
+        varBind = rfc1905.VarBind()
+        varBind.setComponentByPosition(0, name)
+        varBind.setComponentByPosition(1).getComponentByPosition(1).setComponentByType(
+            value.tagSet, value, innerFlag=True
+        )
+
+        assert msgenc.encode_var_bind(name, value) == encoder.encode(varBind)
+
+
+def test_encoded_size():
+    for length in (0, 1, 127, 128, 255, 256, 65535):
+        assert msgenc.get_encoded_size(length) == len(
+            encoder.encode(v2c.OctetString(b"x" * length))
+        )
@@ -0,0 +1,152 @@
+"""Tests for the USM authentication services."""
+
+import gc
+import hmac
+from hashlib import md5, sha1, sha256
+
+import pytest
+from pyasn1.codec.ber import encoder
+from pyasn1.type import univ
+
+from pysnmp.proto import errind, error
+from pysnmp.proto.mpmod.rfc3412 import SNMPv3Message
+from pysnmp.proto.secmod.rfc3414.auth import hmacmd5, hmacsha
+from pysnmp.proto.secmod.rfc3414.service import (
+    SnmpUSMSecurityModel,
+    UsmSecurityParameters,
+)
+from pysnmp.proto.secmod.rfc7860.auth import hmacsha2
+
+AUTH_SERVICES = [
+    (hmacmd5.HmacMd5(), md5, 16, 12),
+    (hmacsha.HmacSha(), sha1, 20, 12),
+    (hmacsha2.HmacSha2(hmacsha2.HmacSha2.SHA256_SERVICE_ID), sha256, 32, 24),
+]
+
+
+def encode_message(digest):
+    securityParameters = UsmSecurityParameters()
+    securityParameters.setComponentByPosition(0, b"\x80\x00\x4f\xb8\x05" + b"x" * 300)
+    securityParameters.setComponentByPosition(1, 1)
+    securityParameters.setComponentByPosition(2, 12345)
+    securityParameters.setComponentByPosition(3, "usr-sha-none")
+    securityParameters.setComponentByPosition(4, digest)
+    securityParameters.setComponentByPosition(5, "")
+
+    msg = SNMPv3Message()
+    msg.setComponentByPosition(0, 3)
+    headerData = msg.setComponentByPosition(1).getComponentByPosition(1)
+    headerData.setComponentByPosition(0, 1)
+    headerData.setComponentByPosition(1, 65507)
+    headerData.setComponentByPosition(2, b"\x01")
+    headerData.setComponentByPosition(3, 3)
+    msg.setComponentByPosition(2, encoder.encode(securityParameters))
+    scopedPduData = msg.setComponentByPosition(3).getComponentByPosition(3)
+    # Plaintext PDU would not survive a digest search: pretend it is encrypted
+    scopedPduData.setComponentByPosition(1, bytes(64))
+    return encoder.encode(msg)
+
+
+@pytest.mark.parametrize("authService,hashAlgo,keyLength,digestLength", AUTH_SERVICES)
+def test_authenticate_outgoing_message(authService, hashAlgo, keyLength, digestLength):
+    authKey = univ.OctetString(bytes(range(keyLength)))
+    wholeMsg = encode_message(bytes(digestLength))
+
+    digestOffset = SnmpUSMSecurityModel._SnmpUSMSecurityModel__get_digest_offset(
+        wholeMsg
+    )
+
+    # Located digest precedes the zero-filled PDU
+    assert wholeMsg.find(bytes(digestLength)) == digestOffset
+
+    mac = hmac.new(authKey.asOctets(), wholeMsg, hashAlgo).digest()[:digestLength]
+
+    for _ in range(2):
+        assert authService.authenticate_outgoing_message(
+            authKey, wholeMsg, digestOffset=digestOffset
+        ) == encode_message(mac)
+
+    assert authService.authenticate_outgoing_message(
+        authKey, wholeMsg
+    ) == encode_message(mac)
+
+
+@pytest.mark.parametrize("authService,hashAlgo,keyLength,digestLength", AUTH_SERVICES)
+def test_authenticate_incoming_message(authService, hashAlgo, keyLength, digestLength):
+    authKey = univ.OctetString(bytes(range(keyLength)))
+    placeholderMsg = encode_message(bytes(digestLength))
+    mac = hmac.new(authKey.asOctets(), placeholderMsg, hashAlgo).digest()
+    mac = mac[:digestLength]
+    wholeMsg = encode_message(mac)
+
+    digestOffset = SnmpUSMSecurityModel._SnmpUSMSecurityModel__get_digest_offset(
+        wholeMsg
+    )
+
+    assert wholeMsg[digestOffset : digestOffset + digestLength] == mac
+
+    assert (
+        authService.authenticate_incoming_message(
+            authKey, univ.OctetString(mac), wholeMsg, digestOffset=digestOffset
+        )
+        == placeholderMsg
+    )
+
+    # Wrong offset falls back to digest search
+    assert (
+        authService.authenticate_incoming_message(
+            authKey, univ.OctetString(mac), wholeMsg, digestOffset=0
+        )
+        == placeholderMsg
+    )
+
+    otherKey = univ.OctetString(bytes(range(1, keyLength + 1)))
+
+    with pytest.raises(error.StatusInformation) as exc:
+        authService.authenticate_incoming_message(
+            otherKey, univ.OctetString(mac), wholeMsg, digestOffset=digestOffset
+        )
+
+    assert exc.value["errorIndication"] == errind.authenticationFailure
+
+
+def test_get_digest_offset_truncated_message():
+    wholeMsg = encode_message(bytes(12))
+
+    assert (
+        SnmpUSMSecurityModel._SnmpUSMSecurityModel__get_digest_offset(wholeMsg[:20])
+        is None
+    )
+
+
+@pytest.mark.parametrize("authService,hashAlgo,keyLength,digestLength", AUTH_SERVICES)
+def test_keyed_hashes_follow_auth_keys(authService, hashAlgo, keyLength, digestLength):
+    keyedHashes = next(
+        value
+        for name, value in vars(authService).items()
+        if name.endswith("__keyedHashes")
+    )
+
+    wholeMsg = encode_message(bytes(digestLength))
+
+    # As many keys as agents a manager may talk to, none evicting another
+    authKeys = [
+        univ.OctetString(index.to_bytes(keyLength, "big")) for index in range(2000)
+    ]
+
+    for authKey in authKeys:
+        authService.authenticate_outgoing_message(authKey, wholeMsg)
+
+    assert len(keyedHashes) == len(authKeys)
+
+    for authKey in authKeys[:3]:
+        mac = hmac.new(authKey.asOctets(), wholeMsg, hashAlgo).digest()
+        assert authService.authenticate_outgoing_message(
+            authKey, wholeMsg
+        ) == encode_message(mac[:digestLength])
+
+    # Keys removed from the user table take their keyed hashes with them
+    del authKey, authKeys
+    gc.collect()
+
+    assert not keyedHashes
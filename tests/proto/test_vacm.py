@@ -0,0 +1,248 @@
+import pytest
+
+from pysnmp.entity import config
+from pysnmp.entity.engine import SnmpEngine
+from pysnmp.proto import errind, error
+from pysnmp.proto.acmod import rfc3415
+
+
+@pytest.fixture
+def snmpEngine():
+    with SnmpEngine() as snmpEngine:
+        config.add_context(snmpEngine, b"")
+        config.add_vacm_group(snmpEngine, "group", 2, "user")
+        config.add_vacm_access(
+            snmpEngine, "group", b"", 2, "noAuthNoPriv", "exact", "view", "", ""
+        )
+        yield snmpEngine
+
+
+def is_access_allowed(snmpEngine, variableName, viewType="read"):
+    try:
+        snmpEngine.access_control_model[3].is_access_allowed(
+            snmpEngine, 2, b"user", 1, viewType, b"", variableName
+        )
+
+    except error.StatusInformation as exc:
+        assert exc["errorIndication"] == errind.notInView
+        return False
+
+    return True
+
+
+def test_subtree_families(snmpEngine):
+    config.add_vacm_view(snmpEngine, "view", "included", (1, 3, 6, 1, 2), b"")
+    config.add_vacm_view(snmpEngine, "view", "excluded", (1, 3, 6, 1, 2, 1, 4), b"")
+    config.add_vacm_view(snmpEngine, "view", "included", (1, 3, 6, 1, 2, 1, 4, 20), b"")
+
+    assert is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1, 1, 1, 0))
+    assert not is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1, 4, 1, 0))
+    assert is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1, 4, 20, 1, 1))
+    assert not is_access_allowed(snmpEngine, (1, 3, 6, 1, 4, 1))
+    assert not is_access_allowed(snmpEngine, (1, 3, 6, 1))
+
+
+def test_masked_subtree_families(snmpEngine):
+    # ifTable entries of any column, but only for the 3rd interface
+    config.add_vacm_view(
+        snmpEngine,
+        "view",
+        "included",
+        (1, 3, 6, 1, 2, 1, 2, 2, 1, 0, 3),
+        "1.1.1.1.1.1.1.1.1.0.1",
+    )
+    config.add_vacm_view(
+        snmpEngine, "view", "excluded", (1, 3, 6, 1, 2, 1, 2, 2, 1, 5), b""
+    )
+
+    assert is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1, 2, 2, 1, 2, 3))
+    assert is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1, 2, 2, 1, 10, 3))
+    assert not is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1, 2, 2, 1, 2, 4))
+    # longer family wins
+    assert is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1, 2, 2, 1, 5, 3))
+    assert not is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1, 2, 2, 1, 5, 4))
+    assert not is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1, 2, 2, 1))
+
+
+def test_batch_same_as_single(snmpEngine):
+    config.add_vacm_view(snmpEngine, "view", "included", (1, 3, 6, 1, 2), b"")
+    config.add_vacm_view(snmpEngine, "view", "excluded", (1, 3, 6, 1, 2, 1, 4), b"")
+    config.add_vacm_view(
+        snmpEngine, "view", "included", (1, 3, 6, 1, 2, 1, 0, 3), "1.1.1.1.1.1.0.1"
+    )
+
+    variableNames = [
+        (1, 3, 6, 1, 2, 1, 1, 1, 0),
+        (1, 3, 6, 1, 2, 1, 4, 1, 0),
+        (1, 3, 6, 1, 2, 1, 4, 3),
+        (1, 3, 6, 1, 4, 1),
+        (1, 3),
+    ]
+
+    assert snmpEngine.access_control_model[3].are_access_allowed(
+        snmpEngine, 2, b"user", 1, "read", b"", variableNames
+    ) == [is_access_allowed(snmpEngine, name) for name in variableNames]
+    assert [is_access_allowed(snmpEngine, name) for name in variableNames] == [
+        True,
+        False,
+        True,
+        False,
+        False,
+    ]
+
+
+def test_batch_fails_as_a_whole(snmpEngine):
+    with pytest.raises(error.StatusInformation) as exc:
+        snmpEngine.access_control_model[3].are_access_allowed(
+            snmpEngine, 2, b"nobody", 1, "read", b"", [(1, 3, 6)]
+        )
+
+    assert exc.value["errorIndication"] == errind.noGroupName
+
+
+def test_view_changes_take_effect(snmpEngine):
+    config.add_vacm_view(snmpEngine, "view", "included", (1, 3, 6, 1, 2), b"")
+
+    assert is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1))
+
+    config.add_vacm_view(snmpEngine, "view", "excluded", (1, 3, 6, 1, 2, 1), b"")
+
+    assert not is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1))
+
+    config.delete_vacm_access(snmpEngine, "group", b"", 2, "noAuthNoPriv")
+    config.add_vacm_access(
+        snmpEngine, "group", b"", 2, "noAuthNoPriv", "exact", "other", "", ""
+    )
+    config.add_vacm_view(snmpEngine, "other", "included", (1, 3, 6, 1, 2, 1), b"")
+
+    assert is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1))
+
+
+def test_view_tree_matches_linear_scan():
+    entries = [
+        ((1, 3, 6, 1), set(), True),
+        ((1, 3, 6, 1, 2, 0, 5), {5}, False),
+        ((1, 3, 6, 1, 2, 1, 5), set(), True),
+        ((1, 3, 0, 1, 2), {2}, False),
+    ]
+
+    viewTree = rfc3415.Vacm._compile_view_tree(entries)
+
+    for variableName in (
+        (1, 3, 6, 1, 2, 7, 5, 1),
+        (1, 3, 6, 1, 2, 1, 5, 1),
+        (1, 3, 6, 1, 2, 1, 6),
+        (1, 3, 7, 1, 2, 3),
+        (1, 3, 6, 1, 2),
+        (1, 3, 6),
+    ):
+        accessAllowed = False
+
+        for subtree, ignoredSubOids, included in sorted(
+            entries, key=lambda x: (len(x[0]), x[0])
+        ):
+            normalized = tuple(
+                0 if idx in ignoredSubOids else subOid
+                for idx, subOid in enumerate(variableName)
+            )
+            if normalized[: len(subtree)] == subtree:
+                accessAllowed = included
+
+        assert rfc3415.Vacm._is_in_view(viewTree, variableName) == accessAllowed
+
+
+def test_view_change_recompiles_that_view_only(snmpEngine):
+    vacm = snmpEngine.access_control_model[3]
+
+    config.add_vacm_view(snmpEngine, "view", "included", (1, 3, 6, 1, 2), b"")
+    config.add_vacm_view(snmpEngine, "tenant", "included", (1, 3, 6, 1, 4), b"")
+
+    assert is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1))
+
+    viewTree = vacm._viewTreeMap[b"view"]
+
+    config.add_vacm_view(snmpEngine, "tenant", "excluded", (1, 3, 6, 1, 4, 1), b"")
+    config.add_vacm_view(snmpEngine, "other", "included", (1, 3, 6, 1, 4, 1), b"")
+
+    assert is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1))
+    assert vacm._viewTreeMap[b"view"] is viewTree
+    assert vacm._viewTreeMap[b"tenant"] is not None
+
+    config.delete_vacm_view(snmpEngine, "tenant", (1, 3, 6, 1, 4))
+    config.delete_vacm_view(snmpEngine, "tenant", (1, 3, 6, 1, 4, 1))
+
+    assert is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1))
+    assert vacm._viewTreeMap[b"view"] is viewTree
+    assert b"tenant" not in vacm._viewTreeMap
+
+    config.delete_vacm_view(snmpEngine, "view", (1, 3, 6, 1, 2))
+
+    # 3.2.5a: no view left, nothing is in view
+    assert not is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1))
+    assert vacm.are_access_allowed(
+        snmpEngine, 2, b"user", 1, "read", b"", [(1, 3, 6, 1, 2, 1), (1, 3, 6, 1, 4)]
+    ) == [False, False]
+    assert b"view" not in vacm._viewTreeMap
+
+
+def test_access_change_affects_that_group_only(snmpEngine):
+    vacm = snmpEngine.access_control_model[3]
+
+    config.add_vacm_group(snmpEngine, "tenant", 2, "tenant-user")
+    config.add_vacm_view(snmpEngine, "view", "included", (1, 3, 6, 1, 2), b"")
+
+    assert is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1))
+
+    accessEntries = vacm._accessMap[b"group"]
+
+    config.add_vacm_access(
+        snmpEngine, "tenant", b"", 2, "noAuthNoPriv", "exact", "view", "", ""
+    )
+
+    assert is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1))
+    assert vacm._accessMap[b"group"] is accessEntries
+    assert b"tenant" in vacm._accessMap
+
+    config.delete_vacm_access(snmpEngine, "group", b"", 2, "noAuthNoPriv")
+
+    with pytest.raises(error.StatusInformation) as exc:
+        vacm.is_access_allowed(snmpEngine, 2, b"user", 1, "read", b"", (1, 3, 6))
+
+    assert exc.value["errorIndication"] == errind.noGroupName
+
+    config.delete_vacm_group(snmpEngine, 2, "user")
+
+    with pytest.raises(error.StatusInformation) as exc:
+        vacm.is_access_allowed(snmpEngine, 2, b"user", 1, "read", b"", (1, 3, 6))
+
+    assert exc.value["errorIndication"] == errind.noGroupName
+
+
+def test_replaced_rows_not_observed(snmpEngine):
+    config.add_vacm_view(snmpEngine, "view", "included", (1, 3, 6, 1, 2), b"")
+
+    assert is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1))
+
+    mibBuilder = snmpEngine.get_mib_builder()
+
+    (MibTableRow, vacmViewTreeFamilyEntry) = mibBuilder.import_symbols(
+        "SNMPv2-SMI", "MibTableRow"
+    ) + mibBuilder.import_symbols("SNMP-VIEW-BASED-ACM-MIB", "vacmViewTreeFamilyEntry")
+
+    observers = len(vacmViewTreeFamilyEntry.rowObservers)
+
+    newVacmViewTreeFamilyEntry = MibTableRow(
+        vacmViewTreeFamilyEntry.name
+    ).setIndexNames(*vacmViewTreeFamilyEntry.indexNames)
+
+    # As if the MIB module got reloaded
+    mibBuilder.unexport_symbols("SNMP-VIEW-BASED-ACM-MIB", "vacmViewTreeFamilyEntry")
+    mibBuilder.export_symbols(
+        "SNMP-VIEW-BASED-ACM-MIB", vacmViewTreeFamilyEntry=newVacmViewTreeFamilyEntry
+    )
+
+    for _ in range(2):
+        assert is_access_allowed(snmpEngine, (1, 3, 6, 1, 2, 1))
+
+    assert len(vacmViewTreeFamilyEntry.rowObservers) == observers - 1
+    assert len(newVacmViewTreeFamilyEntry.rowObservers) == 1
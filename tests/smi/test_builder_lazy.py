@@ -0,0 +1,165 @@
+"""Tests for deferred loading of MIB modules from MIB snapshots."""
+
+import pytest
+
+from pysnmp.smi import builder, error, instrum, view
+from pysnmp.smi.rfc1902 import ObjectIdentity
+
+MIB_MODULES = ["SNMPv2-MIB", "SNMP-TARGET-MIB", "SNMP-PROXY-MIB"]
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    path = str(tmp_path / "mibs.snapshot")
+
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.load_modules(*MIB_MODULES)
+    view.MibViewController(mibBuilder).save_snapshot(path)
+
+    return path
+
+
+@pytest.fixture
+def mib_view(snapshot_path):
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.lazyLoad = True
+    mibView = view.MibViewController(mibBuilder)
+    mibView.load_snapshot(snapshot_path)
+    mibBuilder.load_modules(*MIB_MODULES)
+    return mibView
+
+
+def test_modules_deferred(mib_view):
+    mibBuilder = mib_view.mibBuilder
+
+    assert sorted(mibBuilder.lazyModules) == sorted(MIB_MODULES)
+    assert not mibBuilder.mibSymbols
+
+    revision, typeNames, varNames = mibBuilder.get_module_definitions("SNMP-TARGET-MIB")
+
+    assert "SnmpTagValue" in typeNames
+    assert varNames["snmpTargetAddrTimeout"] == (1, 3, 6, 1, 6, 3, 12, 1, 2, 1, 4)
+    assert not mibBuilder.mibSymbols
+
+
+def test_view_lookup_does_not_load(mib_view):
+    oid, label, suffix = mib_view.get_node_name_by_oid((1, 3, 6, 1, 2, 1, 1, 3, 0))
+
+    assert label[-1] == "sysUpTime"
+    assert suffix == (0,)
+
+    assert mib_view.get_node_location(("snmpProxyType",)) == (
+        "SNMP-PROXY-MIB",
+        "snmpProxyType",
+        (),
+    )
+
+    assert not mib_view.mibBuilder.mibSymbols
+
+
+def test_import_symbols_loads_module(mib_view):
+    mibBuilder = mib_view.mibBuilder
+
+    (sysUpTime,) = mibBuilder.import_symbols("SNMPv2-MIB", "sysUpTime")
+
+    assert sysUpTime.name == (1, 3, 6, 1, 2, 1, 1, 3)
+    assert "SNMPv2-MIB" in mibBuilder.mibSymbols
+    assert "SNMPv2-MIB" not in mibBuilder.lazyModules
+    assert "SNMP-PROXY-MIB" in mibBuilder.lazyModules
+
+
+def test_resolution_loads_module(mib_view):
+    mibBuilder = mib_view.mibBuilder
+
+    objectIdentity = ObjectIdentity(
+        (1, 3, 6, 1, 6, 3, 12, 1, 2, 1, 4) + tuple(b"abc")
+    ).resolve_with_mib(mib_view)
+
+    assert (
+        objectIdentity.prettyPrint() == 'SNMP-TARGET-MIB::snmpTargetAddrTimeout."abc"'
+    )
+    assert "SNMP-TARGET-MIB" in mibBuilder.mibSymbols
+    assert "SNMP-PROXY-MIB" in mibBuilder.lazyModules
+
+
+def walk_mib_view(mibView):
+    nodeNames = []
+
+    oid, label, _ = mibView.get_first_node_name()
+
+    try:
+        while True:
+            nodeNames.append((oid, label, mibView.get_node_location(oid)))
+            oid, label, _ = mibView.get_next_node_name(oid)
+
+    except error.NoSuchObjectError:
+        return nodeNames
+
+
+def test_loaded_view_matches_eager(mib_view):
+    mibBuilder = mib_view.mibBuilder
+
+    for modName, symName in zip(
+        MIB_MODULES, ["sysUpTime", "snmpTargetAddrTimeout", "snmpProxyType"]
+    ):
+        mibBuilder.import_symbols(modName, symName)
+        mib_view.index_mib()
+
+    assert not mibBuilder.lazyModules
+
+    eagerBuilder = builder.MibBuilder()
+    eagerBuilder.load_modules(*MIB_MODULES)
+
+    assert sorted(mibBuilder.mibSymbols) == sorted(eagerBuilder.mibSymbols)
+    assert walk_mib_view(mib_view) == walk_mib_view(
+        view.MibViewController(eagerBuilder)
+    )
+
+
+def test_deferred_module_unloaded(mib_view):
+    mibBuilder = mib_view.mibBuilder
+
+    mibBuilder.unload_modules("SNMP-PROXY-MIB")
+
+    with pytest.raises(error.NoSuchObjectError):
+        mib_view.get_node_name(("snmpProxyType",))
+
+    mibBuilder.load_modules("SNMP-PROXY-MIB")
+
+    assert "SNMP-PROXY-MIB" in mibBuilder.lazyModules
+    oid, label, suffix = mib_view.get_node_name(("snmpProxyType",))
+
+    assert label[-1] == "snmpProxyType"
+
+
+def test_instrumentation_loads_deferred_modules(tmp_path):
+    snapshotPath = str(tmp_path / "instances.snapshot")
+    modNames = ["SNMPv2-MIB", "__SNMPv2-MIB"]
+
+    eagerBuilder = builder.MibBuilder()
+    eagerBuilder.load_modules(*modNames)
+    view.MibViewController(eagerBuilder).save_snapshot(snapshotPath)
+
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.lazyLoad = True
+    view.MibViewController(mibBuilder).load_snapshot(snapshotPath)
+    mibBuilder.load_modules(*modNames)
+
+    assert sorted(mibBuilder.lazyModules) == modNames
+
+    mibInstrum = instrum.MibInstrumController(mibBuilder)
+    eagerInstrum = instrum.MibInstrumController(eagerBuilder)
+
+    varBinds = [((1, 3, 6, 1, 2, 1, 1, 1, 0), None)]
+
+    assert mibInstrum.read_variables(*varBinds) == eagerInstrum.read_variables(
+        *varBinds
+    )
+
+    assert not mibBuilder.lazyModules
+
+    varBinds = [((1, 3, 6, 1, 2, 1, 1), None)]
+
+    assert mibInstrum.read_next_variables(
+        *varBinds
+    ) == eagerInstrum.read_next_variables(*varBinds)
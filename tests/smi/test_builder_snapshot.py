@@ -0,0 +1,115 @@
+"""Tests for loading compiled MIB modules and MIB snapshots."""
+
+import os
+import py_compile
+from importlib.util import cache_from_source
+
+import pytest
+
+from pysnmp.smi import builder, error, view
+
+MIB_MODULES = ["SNMPv2-MIB", "SNMP-TARGET-MIB"]
+
+
+def write_mib_module(path, value, mtime):
+    with open(path, "w") as fp:
+        fp.write(
+            "(MibScalar,) = mibBuilder.import_symbols('SNMPv2-SMI', 'MibScalar')\n"
+            f"testScalar = MibScalar((1, 3, 6, 6, {value}))\n"
+            "mibBuilder.export_symbols('TEST-MIB', testScalar=testScalar)\n"
+        )
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.mark.parametrize(
+    "sourceMtime,oid", [(1000000000, (1, 3, 6, 6, 1)), (1000000001, (1, 3, 6, 6, 2))]
+)
+def test_compiled_module_loaded_unless_outdated(tmp_path, sourceMtime, oid):
+    path = str(tmp_path / "TEST-MIB.py")
+
+    write_mib_module(path, 1, 1000000000)
+    py_compile.compile(path, cache_from_source(path), doraise=True)
+
+    # Leaves compiled code behind the source unless it gets newer
+    write_mib_module(path, 2, sourceMtime)
+
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.add_mib_sources(builder.DirMibSource(str(tmp_path)))
+    mibBuilder.load_modules("TEST-MIB")
+
+    (testScalar,) = mibBuilder.import_symbols("TEST-MIB", "testScalar")
+
+    assert testScalar.name == oid
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    path = str(tmp_path / "mibs.snapshot")
+
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.load_modules(*MIB_MODULES)
+    view.MibViewController(mibBuilder).save_snapshot(path)
+
+    return path
+
+
+def test_snapshot_source(snapshot_path):
+    mibSource = builder.SnapshotMibSource(snapshot_path).init()
+
+    assert "SNMPv2-MIB" in mibSource.listdir()
+    assert "SNMPv2-SMI" in mibSource.listdir()
+
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.set_mib_sources(mibSource)
+    mibBuilder.load_modules(*MIB_MODULES)
+
+    assert "SNMP-TARGET-MIB" in mibBuilder.mibSymbols
+
+    with pytest.raises(error.MibNotFoundError):
+        mibBuilder.load_modules("SNMP-PROXY-MIB")
+
+
+def test_snapshot_index_restored(snapshot_path, monkeypatch):
+    mibBuilder = builder.MibBuilder()
+    mibView = view.MibViewController(mibBuilder)
+    mibView.load_snapshot(snapshot_path)
+    mibBuilder.load_modules(*MIB_MODULES)
+
+    def index_all_modules(self):
+        raise AssertionError("MIB view got re-indexed")
+
+    with monkeypatch.context() as m:
+        m.setattr(
+            view.MibViewController,
+            "_MibViewController__index_all_modules",
+            index_all_modules,
+        )
+
+        oid, label, suffix = mibView.get_node_name_by_oid((1, 3, 6, 1, 2, 1, 1, 3, 0))
+
+    assert label[-1] == "sysUpTime"
+
+    mibBuilder.load_modules("SNMP-PROXY-MIB")
+
+    assert mibView.get_node_location((1, 3, 6, 1, 6, 3, 14, 1, 2, 1, 2)) == (
+        "SNMP-PROXY-MIB",
+        "snmpProxyType",
+        (),
+    )
+
+
+def test_snapshot_index_ignored_for_other_modules(snapshot_path):
+    mibBuilder = builder.MibBuilder()
+    mibView = view.MibViewController(mibBuilder)
+    mibView.load_snapshot(snapshot_path)
+    mibBuilder.load_modules("SNMPv2-MIB")
+
+    oid, label, suffix = mibView.get_node_name_by_oid((1, 3, 6, 1, 6, 3, 12, 1))
+
+    assert label[-1] == "snmpModules"
+    assert suffix == (12, 1)
+
+
+def test_snapshot_missing(tmp_path):
+    with pytest.raises(error.MibLoadError):
+        builder.SnapshotMibSource(str(tmp_path / "mibs.snapshot")).init()
@@ -0,0 +1,73 @@
+"""Tests for ordered dictionaries used by MIB indices."""
+
+import random
+
+import pytest
+
+from pysnmp.smi.indices import OidOrderedDict, OrderedDict
+
+
+def test_ordered_dict_keeps_keys_sorted():
+    d = OrderedDict()
+    for key in ("c", "a", "b"):
+        d[key] = key.upper()
+
+    assert d.keys() == ["a", "b", "c"]
+    assert d.values() == ["A", "B", "C"]
+    assert d.next_key("a") == "b"
+
+    del d["b"]
+
+    assert d.items() == [("a", "A"), ("c", "C")]
+    assert d.next_key("a") == "c"
+
+    with pytest.raises(KeyError):
+        d.next_key("c")
+
+
+def test_oid_ordered_dict_interleaved_updates():
+    random.seed(1)
+    d = OidOrderedDict()
+    live = set()
+
+    for _ in range(2000):
+        key = tuple(random.randint(0, 9) for _ in range(random.randint(1, 5)))
+        if key in live and random.random() < 0.5:
+            del d[key]
+            live.remove(key)
+        else:
+            d[key] = key
+            live.add(key)
+
+        expected = sorted(live)
+        assert d.keys() == expected
+        assert d.get_keys_lengths() == sorted({len(k) for k in live}, reverse=True)
+
+        probe = random.choice(expected) if expected else ()
+        following = [k for k in expected if k > probe]
+        if following:
+            assert d.next_key(probe) == following[0]
+        else:
+            with pytest.raises(KeyError):
+                d.next_key(probe)
+
+
+def test_oid_ordered_dict_bulk_update_and_string_keys():
+    d = OidOrderedDict({"1.3.10": 1, "1.3.9": 2})
+    d["1.3.2"] = 3
+
+    assert d.keys() == ["1.3.2", "1.3.9", "1.3.10"]
+
+    del d["1.3.9"]
+
+    assert d.keys() == ["1.3.2", "1.3.10"]
+
+    d.clear()
+    d[(1, 3)] = 0
+
+    assert d.keys() == [(1, 3)]
+    assert d.get_keys_lengths() == [2]
+
+
+def test_oid_ordered_dict_has_no_instance_dict():
+    assert not hasattr(OidOrderedDict(), "__dict__")
@@ -0,0 +1,172 @@
+"""Tests for GETNEXT traversal of the MIB instrumentation tree."""
+
+import pytest
+
+from pysnmp.proto.api import v2c
+from pysnmp.smi import builder, exval, instrum
+
+
+class GetNextMibInstrumController(instrum.AbstractMibInstrumController):
+    # GETBULK served by a GETNEXT call per round
+    def __init__(self, mibInstrum):
+        self.read_next_variables = mibInstrum.read_next_variables
+
+
+@pytest.fixture
+def mib_instrum():
+    mibBuilder = builder.MibBuilder()
+
+    (MibTable, MibTableRow, MibTableColumn, MibScalarInstance) = (
+        mibBuilder.import_symbols(
+            "SNMPv2-SMI",
+            "MibTable",
+            "MibTableRow",
+            "MibTableColumn",
+            "MibScalarInstance",
+        )
+    )
+
+    columns = [
+        MibTableColumn((1, 3, 6, 6, 1, 1, col), v2c.Integer32()) for col in (1, 2, 3)
+    ]
+
+    mibBuilder.export_symbols(
+        "__TEST-MIB",
+        MibTable((1, 3, 6, 6, 1)),
+        MibTableRow((1, 3, 6, 6, 1, 1)),
+        *columns,
+        *[
+            MibScalarInstance(column.name, (row,), v2c.Integer32(row * column.name[-1]))
+            for column in columns
+            for row in range(1, 51)
+        ],
+    )
+
+    return instrum.MibInstrumController(mibBuilder)
+
+
+def walk(mibInstrum, startOids, repetitions, **context):
+    varBinds = [(oid, None) for oid in startOids]
+    result = []
+    for _ in range(repetitions):
+        varBinds = mibInstrum.read_next_variables(*varBinds, **context)
+        result.extend(varBinds)
+    return result
+
+
+def test_read_next_walks_table_in_order(mib_instrum):
+    varBinds = walk(mib_instrum, [(1, 3, 6, 6, 1)], 151)
+
+    assert [oid for oid, _ in varBinds[:150]] == [
+        (1, 3, 6, 6, 1, 1, col, row) for col in (1, 2, 3) for row in range(1, 51)
+    ]
+    assert varBinds[150][1] is exval.endOfMib
+
+
+def test_read_next_cursor_gives_same_result(mib_instrum):
+    startOids = [(1, 3, 6, 6, 1, 1, 1), (1, 3, 6, 6, 1, 1, 2, 40)]
+
+    plain = walk(mib_instrum, startOids, 70)
+
+    cursor = {}
+    resumed = walk(mib_instrum, startOids, 70, cursor=cursor)
+
+    assert resumed == plain
+    # only the positions of the last returned var-binds are retained
+    assert len(cursor) <= len(startOids)
+
+
+def test_leaf_nodes_have_no_children_map(mib_instrum):
+    walk(mib_instrum, [(1, 3, 6, 6, 1)], 151)
+
+    mibSymbols = mib_instrum.get_mib_builder().mibSymbols["__TEST-MIB"].values()
+
+    assert all(
+        "_vars" not in vars(symObj)
+        for symObj in mibSymbols
+        if symObj.__class__.__name__ == "MibScalarInstance"
+    )
+    assert all(
+        len(symObj._vars) == 50
+        for symObj in mibSymbols
+        if symObj.__class__.__name__ == "MibTableColumn"
+    )
+
+
+@pytest.mark.parametrize(
+    "nonRepeaters, maxRepetitions", [(0, 0), (0, 70), (1, 0), (1, 60), (3, 10)]
+)
+def test_read_bulk_same_as_read_next(mib_instrum, nonRepeaters, maxRepetitions):
+    reqVarBinds = [
+        ((1, 3, 6, 6, 1, 1, 3, 5), None),
+        ((1, 3, 6, 6, 1, 1, 1), None),
+        ((1, 3, 6, 6, 1, 1, 2, 40), None),
+    ]
+
+    expected = mib_instrum.read_next_variables(*reqVarBinds[:nonRepeaters])
+
+    if nonRepeaters < len(reqVarBinds):
+        expected.extend(
+            walk(
+                mib_instrum,
+                [oid for oid, _ in reqVarBinds[nonRepeaters:]],
+                maxRepetitions,
+            )
+        )
+
+    assert (
+        mib_instrum.read_bulk_variables(nonRepeaters, maxRepetitions, *reqVarBinds)
+        == expected
+    )
+    assert (
+        GetNextMibInstrumController(mib_instrum).read_bulk_variables(
+            nonRepeaters, maxRepetitions, *reqVarBinds
+        )
+        == expected
+    )
+
+
+def test_read_bulk_stops_on_budget(mib_instrum):
+    budget = [5]
+
+    def budgetFun(varBind):
+        budget[0] -= 1
+        return budget[0] >= 0
+
+    varBinds = mib_instrum.read_bulk_variables(
+        1,
+        10,
+        ((1, 3, 6, 6, 1), None),
+        ((1, 3, 6, 6, 1, 1, 2), None),
+        budgetFun=budgetFun,
+    )
+
+    assert [oid for oid, _ in varBinds] == [
+        (1, 3, 6, 6, 1, 1, 1, 1),
+        (1, 3, 6, 6, 1, 1, 2, 1),
+        (1, 3, 6, 6, 1, 1, 2, 2),
+        (1, 3, 6, 6, 1, 1, 2, 3),
+        (1, 3, 6, 6, 1, 1, 2, 4),
+    ]
+
+
+def test_read_bulk_stops_past_end_of_mib(mib_instrum):
+    varBinds = mib_instrum.read_bulk_variables(
+        0, 10, ((1, 3, 6, 6, 1, 1, 3, 48), None), ((1, 3, 6, 6, 1, 1, 3, 49), None)
+    )
+
+    assert [oid for oid, _ in varBinds] == [
+        (1, 3, 6, 6, 1, 1, 3, 49),
+        (1, 3, 6, 6, 1, 1, 3, 50),
+        (1, 3, 6, 6, 1, 1, 3, 50),
+    ] + [(1, 3, 6, 6, 1, 1, 3, 50)] * 3
+    assert [val is exval.endOfMib for _, val in varBinds] == [False] * 3 + [True] * 3
+    assert (
+        GetNextMibInstrumController(mib_instrum).read_bulk_variables(
+            0,
+            10,
+            ((1, 3, 6, 6, 1, 1, 3, 48), None),
+            ((1, 3, 6, 6, 1, 1, 3, 49), None),
+        )
+        == varBinds
+    )
@@ -0,0 +1,82 @@
+"""Tests for statistics counters and MIB symbols imports."""
+
+from pysnmp.entity import engine
+from pysnmp.proto.api import v2c
+from pysnmp.smi import builder, instrum
+
+
+def test_counter_mirrored_into_mib():
+    snmpEngine = engine.SnmpEngine()
+    mibBuilder = snmpEngine.get_mib_builder()
+
+    (snmpInPkts,) = mibBuilder.import_symbols("__SNMPv2-MIB", "snmpInPkts")
+
+    snmpInPkts.count += 3
+
+    assert snmpInPkts.syntax == 3
+    assert isinstance(snmpInPkts.syntax, v2c.Counter32)
+
+    snmpInPkts.count += 1
+
+    mibInstrum = instrum.MibInstrumController(mibBuilder)
+
+    ((oid, value),) = mibInstrum.read_variables((snmpInPkts.name, None))
+
+    assert oid == (1, 3, 6, 1, 2, 1, 11, 1, 0)
+    assert value == 4
+
+
+def test_counter_wraps_around():
+    mibBuilder = engine.SnmpEngine().get_mib_builder()
+
+    (snmpInPkts,) = mibBuilder.import_symbols("__SNMPv2-MIB", "snmpInPkts")
+
+    snmpInPkts.syntax = v2c.Counter32(0xFFFFFFFF)
+    snmpInPkts.count += 2
+
+    assert snmpInPkts.syntax == 1
+    assert snmpInPkts.count == 1
+
+
+def test_imported_symbols_follow_mib_changes():
+    mibBuilder = engine.SnmpEngine().get_mib_builder()
+
+    (MibCounterInstance,) = mibBuilder.import_symbols(
+        "SNMPv2-SMI", "MibCounterInstance"
+    )
+    (snmpInPkts,) = mibBuilder.import_symbols("__SNMPv2-MIB", "snmpInPkts")
+
+    assert mibBuilder.import_symbols("__SNMPv2-MIB", "snmpInPkts") == (snmpInPkts,)
+
+    newSnmpInPkts = MibCounterInstance(
+        snmpInPkts.typeName, snmpInPkts.instId, v2c.Counter32(0)
+    )
+
+    mibBuilder.unexport_symbols("__SNMPv2-MIB", "snmpInPkts")
+    mibBuilder.export_symbols("__SNMPv2-MIB", snmpInPkts=newSnmpInPkts)
+
+    assert mibBuilder.import_symbols("__SNMPv2-MIB", "snmpInPkts") == (newSnmpInPkts,)
+
+
+def test_imported_symbols_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(builder.MibBuilder, "MAX_IMPORTED_SYMBOLS", 2)
+
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.load_modules("SNMPv2-MIB")
+
+    importedSymbols = mibBuilder._MibBuilder__importedSymbols
+    evictions = importedSymbols.evictions
+
+    for symName in ("sysDescr", "sysObjectID", "sysUpTime"):
+        mibBuilder.import_symbols("SNMPv2-MIB", symName)
+
+    # Least recently used import gets evicted, the rest stay
+    assert len(importedSymbols) == 2
+    assert importedSymbols.evictions == evictions + 1
+
+    hits = importedSymbols.hits
+
+    mibBuilder.import_symbols("SNMPv2-MIB", "sysUpTime")
+
+    assert importedSymbols.hits == hits + 1
+    assert ("SNMPv2-MIB", ("sysDescr",)) not in importedSymbols
@@ -0,0 +1,143 @@
+"""Tests for incremental MIB view indexing."""
+
+import pytest
+
+from pysnmp.proto.api import v2c
+from pysnmp.smi import builder, error, view
+
+MIB_MODULES = [
+    "SNMP-TARGET-MIB",
+    "RFC1213-MIB",
+    "SNMPv2-MIB",
+    "SNMP-VIEW-BASED-ACM-MIB",
+    "SNMP-COMMUNITY-MIB",
+    "SNMP-USER-BASED-SM-MIB",
+    "PYSNMP-MIB",
+]
+
+
+def walk_mib_view(mibView):
+    nodeNames = {}
+
+    modName = mibView.get_first_module_name()
+
+    while True:
+        nodeNames[modName] = names = []
+
+        try:
+            oid, label, _ = mibView.get_first_node_name(modName)
+
+            while True:
+                names.append((oid, label, mibView.get_node_location(oid)))
+                oid, label, _ = mibView.get_next_node_name(oid, modName)
+
+        except error.NoSuchObjectError:
+            pass
+
+        try:
+            modName = mibView.get_next_module_name(modName)
+
+        except error.SmiError:
+            return nodeNames
+
+
+def test_modules_indexed_one_by_one():
+    mibBuilder = builder.MibBuilder()
+    mibView = view.MibViewController(mibBuilder)
+
+    for modName in MIB_MODULES:
+        mibBuilder.load_modules(modName)
+        mibView.index_mib()
+
+    assert walk_mib_view(mibView) == walk_mib_view(view.MibViewController(mibBuilder))
+
+
+def test_instances_do_not_change_definitions():
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.load_modules("SNMPv2-MIB")
+
+    (MibScalarInstance,) = mibBuilder.import_symbols("SNMPv2-SMI", "MibScalarInstance")
+
+    mibBuilder.export_symbols(
+        "__TEST-MIB",
+        MibScalarInstance((1, 3, 6, 1, 2, 1, 1, 1), (0,), v2c.OctetString()),
+    )
+
+    moduleBuildIds = dict(mibBuilder.moduleBuildIds)
+
+    mibBuilder.export_symbols(
+        "__TEST-MIB",
+        MibScalarInstance((1, 3, 6, 1, 2, 1, 1, 5), (0,), v2c.OctetString()),
+    )
+
+    assert mibBuilder.moduleBuildIds == moduleBuildIds
+
+    mibBuilder.unexport_symbols(
+        "__TEST-MIB", list(mibBuilder.mibSymbols["__TEST-MIB"])[0]
+    )
+
+    assert mibBuilder.moduleBuildIds == moduleBuildIds
+
+
+@pytest.fixture
+def mib_view():
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.load_modules("SNMPv2-MIB")
+    mibView = view.MibViewController(mibBuilder)
+    mibView.index_mib()
+    return mibView
+
+
+def test_definitions_added(mib_view):
+    mibBuilder = mib_view.mibBuilder
+
+    (MibScalar, MibIdentifier) = mibBuilder.import_symbols(
+        "SNMPv2-SMI", "MibScalar", "MibIdentifier"
+    )
+
+    mibBuilder.export_symbols(
+        "__TEST-MIB",
+        testScalar=MibScalar((1, 3, 6, 1, 2, 1, 1, 99, 1), v2c.Integer32()),
+    )
+
+    oid, label, suffix = mib_view.get_node_name_by_oid((1, 3, 6, 1, 2, 1, 1, 99, 1, 0))
+
+    assert label[-3:] == ("system", 99, "testScalar")
+    assert suffix == (0,)
+
+    mibBuilder.export_symbols(
+        "__TEST-MIB", testObjects=MibIdentifier((1, 3, 6, 1, 2, 1, 1, 99))
+    )
+
+    oid, label, suffix = mib_view.get_node_name_by_oid((1, 3, 6, 1, 2, 1, 1, 99, 1, 0))
+
+    assert label[-3:] == ("system", "testObjects", "testScalar")
+    assert mib_view.get_node_name(("testObjects", 1))[1] == label
+
+    assert walk_mib_view(mib_view) == walk_mib_view(view.MibViewController(mibBuilder))
+
+
+def test_definitions_removed(mib_view):
+    mibBuilder = mib_view.mibBuilder
+
+    (MibScalar,) = mibBuilder.import_symbols("SNMPv2-SMI", "MibScalar")
+
+    mibBuilder.export_symbols(
+        "__TEST-MIB", testScalar=MibScalar((1, 3, 6, 1, 2, 1, 1, 99), v2c.Integer32())
+    )
+
+    assert mib_view.get_node_location((1, 3, 6, 1, 2, 1, 1, 99, 0)) == (
+        "__TEST-MIB",
+        "testScalar",
+        (0,),
+    )
+
+    mibBuilder.unexport_symbols("__TEST-MIB")
+
+    assert mib_view.get_node_location((1, 3, 6, 1, 2, 1, 1, 99, 0)) == (
+        "SNMPv2-MIB",
+        "system",
+        (99, 0),
+    )
+
+    assert walk_mib_view(mib_view) == walk_mib_view(view.MibViewController(mibBuilder))
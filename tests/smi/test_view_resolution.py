@@ -0,0 +1,171 @@
+"""Tests for OID resolution at MIB view controller."""
+
+import pytest
+
+from pysnmp.proto.api import v2c
+from pysnmp.smi import builder, error, view
+from pysnmp.smi.rfc1902 import ObjectIdentity, ObjectType
+
+
+@pytest.fixture
+def mib_view():
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.load_modules("SNMPv2-MIB", "SNMP-TARGET-MIB")
+    return view.MibViewController(mibBuilder)
+
+
+@pytest.mark.parametrize(
+    "oid,label,indices",
+    [
+        (
+            (1, 3, 6, 1, 6, 3, 12, 1, 2, 1, 4) + tuple(b"target"),
+            "SNMP-TARGET-MIB::snmpTargetAddrTimeout",
+            ("target",),
+        ),
+        ((1, 3, 6, 1, 2, 1, 1, 9, 1, 3, 7), "SNMPv2-MIB::sysORDescr", ("7",)),
+        ((1, 3, 6, 1, 2, 1, 1, 3, 0), "SNMPv2-MIB::sysUpTime", ("0",)),
+    ],
+)
+def test_resolution_is_stable(mib_view, oid, label, indices):
+    for _ in range(3):
+        objectIdentity = ObjectIdentity(oid).resolve_with_mib(mib_view)
+
+        assert "::".join(objectIdentity.get_mib_symbol()[:2]) == label
+        assert (
+            tuple(x.prettyPrint() for x in objectIdentity.get_mib_symbol()[2])
+            == indices
+        )
+        assert objectIdentity.get_oid() == oid
+
+
+def test_get_managed_object(mib_view):
+    uncached = mib_view.get_managed_object((1, 3, 6, 1, 2, 1, 1, 9, 1, 3, 7))
+    cached = mib_view.get_managed_object((1, 3, 6, 1, 2, 1, 1, 9, 1, 3, 7))
+
+    assert uncached == cached
+
+    oid, label, suffix, modName, symName, mibNode, rowNode = cached
+
+    assert oid == (1, 3, 6, 1, 2, 1, 1, 9, 1, 3)
+    assert label[-1] == "sysORDescr"
+    assert suffix == (7,)
+    assert (modName, symName) == ("SNMPv2-MIB", "sysORDescr")
+    assert mibNode.name == oid
+    assert rowNode.name == oid[:-1]
+
+
+def test_non_leaf_nodes_resolve_to_closest_node(mib_view):
+    mib_view.get_managed_object((1, 3, 6, 1, 2, 1, 1, 9, 1, 3, 7))
+
+    oid, label, suffix = mib_view.get_managed_object((1, 3, 6, 1, 2, 1, 1, 9, 1))[:3]
+
+    assert label[-1] == "sysOREntry"
+    assert suffix == ()
+
+
+def test_resolution_follows_mib_changes(mib_view):
+    (MibScalar,) = mib_view.mibBuilder.import_symbols("SNMPv2-SMI", "MibScalar")
+
+    mib_view.mibBuilder.export_symbols(
+        "__TEST-MIB", testScalar=MibScalar((1, 3, 6, 6, 1), v2c.Integer32())
+    )
+
+    objectType = ObjectType(ObjectIdentity((1, 3, 6, 6, 1, 0)), 1)
+
+    assert objectType.resolve_with_mib(mib_view)[0].get_label()[-1] == "testScalar"
+
+    mib_view.mibBuilder.unexport_symbols("__TEST-MIB")
+    mib_view.mibBuilder.export_symbols(
+        "__TEST-MIB", otherScalar=MibScalar((1, 3, 6, 6, 1), v2c.OctetString())
+    )
+
+    objectType = ObjectType(ObjectIdentity((1, 3, 6, 6, 1, 0)), "1")
+
+    assert objectType.resolve_with_mib(mib_view)[0].get_label()[-1] == "otherScalar"
+    assert isinstance(objectType[1], v2c.OctetString)
+
+
+def test_resolution_follows_redefined_syntax(mib_view):
+    (MibScalar,) = mib_view.mibBuilder.import_symbols("SNMPv2-SMI", "MibScalar")
+
+    mib_view.mibBuilder.export_symbols(
+        "MY-MIB", myObj=MibScalar((1, 3, 6, 6, 2), v2c.Integer32())
+    )
+
+    objectType = ObjectType(ObjectIdentity((1, 3, 6, 6, 2, 0)), 1)
+
+    assert isinstance(objectType.resolve_with_mib(mib_view)[1], v2c.Integer32)
+
+    # Same name and OID, different SYNTAX
+    mib_view.mibBuilder.unexport_symbols("MY-MIB", "myObj")
+    mib_view.mibBuilder.export_symbols(
+        "MY-MIB", myObj=MibScalar((1, 3, 6, 6, 2), v2c.OctetString())
+    )
+
+    objectType = ObjectType(ObjectIdentity((1, 3, 6, 6, 2, 0)), "1")
+
+    assert isinstance(objectType.resolve_with_mib(mib_view)[1], v2c.OctetString)
+    assert isinstance(
+        mib_view.get_managed_object((1, 3, 6, 6, 2, 0))[5].syntax, v2c.OctetString
+    )
+
+
+def test_cache_size_is_bounded(mib_view, monkeypatch):
+    monkeypatch.setattr(view.MibViewController, "MAX_RESOLVED_OBJECTS", 2)
+
+    mib_view = view.MibViewController(mib_view.mibBuilder)
+
+    for column in (2, 3, 4):
+        mib_view.get_managed_object((1, 3, 6, 1, 2, 1, 1, 9, 1, column, 1))
+
+    resolvedObjects = mib_view._MibViewController__resolvedObjects
+
+    # Least recently used resolution gets evicted, the rest stay
+    assert len(resolvedObjects) == 2
+    assert resolvedObjects.evictions == 1
+    assert (1, 3, 6, 1, 2, 1, 1, 9, 1, 2) not in resolvedObjects
+    assert (1, 3, 6, 1, 2, 1, 1, 9, 1, 4) in resolvedObjects
+
+    assert mib_view.get_managed_object((1, 3, 6, 1, 2, 1, 1, 9, 1, 2, 1))[4] == (
+        "sysORID"
+    )
+
+
+@pytest.mark.parametrize(
+    "nodeName,label,suffix",
+    [
+        ((1, 3, 6, 1, 2, 1, 1, 1, 0), "sysDescr", (0,)),
+        ((1, 3, 6, 1, 2, 1, 1, 9, 1, 3, 4, 5), "sysORDescr", (4, 5)),
+        ((1, 3, 6, 1, 2, 1, 1, 9, 1), "sysOREntry", ()),
+        ((1, 3, 6, 1, 2, 1, 1, 99, 1), "system", (99, 1)),
+        (("iso", "org", 6, 1, 2, 1, 1, 1, 0), "sysDescr", (0,)),
+    ],
+)
+def test_get_node_name_by_oid(mib_view, nodeName, label, suffix):
+    oid, resolvedLabel, resolvedSuffix = mib_view.get_node_name_by_oid(nodeName)
+
+    assert resolvedLabel[-1] == label
+    assert tuple(resolvedSuffix) == suffix
+
+    if isinstance(nodeName[0], int):
+        assert mib_view.get_node_name_by_oid(v2c.ObjectIdentifier(nodeName)) == (
+            oid,
+            resolvedLabel,
+            resolvedSuffix,
+        )
+
+
+def test_get_node_name_by_oid_unknown(mib_view):
+    with pytest.raises(error.NoSuchObjectError):
+        mib_view.get_node_name_by_oid((9, 9, 9))
+
+
+def test_get_node_names_by_oid(mib_view):
+    nodeNames = [
+        (1, 3, 6, 1, 2, 1, 1, 1, 0),
+        (1, 3, 6, 1, 6, 3, 12, 1, 2, 1, 4) + tuple(b"target"),
+    ]
+
+    assert mib_view.get_node_names_by_oid(nodeNames) == [
+        mib_view.get_node_name_by_oid(nodeName) for nodeName in nodeNames
+    ]
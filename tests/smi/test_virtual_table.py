@@ -0,0 +1,113 @@
+"""Tests for MIB tables served from columnar data sources."""
+
+import pytest
+
+from pysnmp.proto.api import v2c
+from pysnmp.smi import builder, error, exval, instrum
+
+ROWS = [(row, 10 + row) for row in range(1, 51)]
+
+COLUMNS = {
+    1: [row * 1 for row, _ in ROWS],
+    2: [row % 3 and row * 2 or None for row, _ in ROWS],
+    3: [row * 3 for row, _ in ROWS],
+}
+
+
+def build_mib_instrum(dataSource=None):
+    mibBuilder = builder.MibBuilder()
+
+    (MibTable, MibTableRow, MibTableColumn, MibScalarInstance) = (
+        mibBuilder.import_symbols(
+            "SNMPv2-SMI",
+            "MibTable",
+            "MibTableRow",
+            "MibTableColumn",
+            "MibScalarInstance",
+        )
+    )
+
+    row = MibTableRow((1, 3, 6, 6, 1, 1))
+    columns = [
+        MibTableColumn((1, 3, 6, 6, 1, 1, col), v2c.Integer32()) for col in COLUMNS
+    ]
+
+    if dataSource is None:
+        instances = [
+            MibScalarInstance(column.name, instId, v2c.Integer32(value))
+            for column in columns
+            for instId, value in zip(ROWS, COLUMNS[column.name[-1]])
+            if value is not None
+        ]
+    else:
+        row.setDataSource(dataSource)
+        instances = []
+
+    mibBuilder.export_symbols(
+        "__TEST-MIB", MibTable((1, 3, 6, 6, 1)), row, *columns, *instances
+    )
+
+    return instrum.MibInstrumController(mibBuilder)
+
+
+def get_rows(instId, count):
+    idx = 0
+    while idx < len(ROWS) and ROWS[idx] < instId:
+        idx += 1
+    return [
+        (ROWS[idx], {colId: values[idx] for colId, values in COLUMNS.items()})
+        for idx in range(idx, min(idx + count, len(ROWS)))
+    ]
+
+
+@pytest.fixture(
+    params=[
+        lambda MibTableDataSource: MibTableDataSource(ROWS, COLUMNS),
+        lambda MibTableDataSource: MibTableDataSource(cbFun=get_rows),
+    ],
+    ids=["arrays", "callback"],
+)
+def virtual_mib_instrum(request):
+    (MibTableDataSource,) = builder.MibBuilder().import_symbols(
+        "SNMPv2-SMI", "MibTableDataSource"
+    )
+    return build_mib_instrum(request.param(MibTableDataSource))
+
+
+def walk(mibInstrum, startOids, repetitions, **context):
+    varBinds = [(oid, None) for oid in startOids]
+    result = []
+    for _ in range(repetitions):
+        varBinds = mibInstrum.read_next_variables(*varBinds, **context)
+        result.extend(varBinds)
+    return result
+
+
+def test_read_next_same_as_instances(virtual_mib_instrum):
+    startOids = [(1, 3, 6, 6, 1), (1, 3, 6, 6, 1, 1, 2, 40), (1, 3, 6, 6, 1, 1, 3, 7)]
+
+    expected = walk(build_mib_instrum(), startOids, 150)
+
+    assert walk(virtual_mib_instrum, startOids, 150) == expected
+    assert walk(virtual_mib_instrum, startOids, 150, cursor={}) == expected
+    assert expected[-1][1] is exval.endOfMib
+
+
+def test_read(virtual_mib_instrum):
+    varBinds = virtual_mib_instrum.read_variables(
+        ((1, 3, 6, 6, 1, 1, 1, 7, 17), None),
+        ((1, 3, 6, 6, 1, 1, 2, 3, 13), None),
+        ((1, 3, 6, 6, 1, 1, 3, 7), None),
+    )
+
+    assert varBinds[0] == ((1, 3, 6, 6, 1, 1, 1, 7, 17), 7)
+    assert isinstance(varBinds[0][1], v2c.Integer32)
+    assert [val for _, val in varBinds[1:]] == [exval.noSuchInstance] * 2
+
+
+def test_not_writable(virtual_mib_instrum):
+    with pytest.raises(error.NotWritableError):
+        virtual_mib_instrum.write_variables((
+            (1, 3, 6, 6, 1, 1, 1, 7, 17),
+            v2c.Integer32(1),
+        ))
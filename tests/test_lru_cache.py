@@ -0,0 +1,80 @@
+"""Tests for the limited-size cache."""
+
+import pytest
+
+from pysnmp import cache
+
+
+def test_least_recently_used_evicted():
+    c = cache.Cache(maxSize=3)
+
+    for k in "abc":
+        c[k] = k.upper()
+
+    assert c["a"] == "A"
+
+    c["d"] = "D"
+
+    assert "b" not in c
+    assert "a" in c
+    assert len(c) == 3
+    assert c.evictions == 1
+
+
+def test_counters():
+    c = cache.Cache(maxSize=2)
+    c["a"] = 1
+
+    assert c.get("a") == 1
+    assert c.get("b") is None
+
+    with pytest.raises(KeyError):
+        c["b"]
+
+    assert (c.hits, c.misses, c.evictions) == (1, 2, 0)
+
+
+def test_membership_test_not_counted():
+    c = cache.Cache(maxSize=2)
+    c["a"] = 1
+
+    for k in "ab":
+        if k in c:
+            assert c[k] == 1
+
+    assert c.get("b") is None
+
+    assert (c.hits, c.misses) == (1, 1)
+
+
+def test_entries_expire(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache, "monotonic", lambda: now[0])
+
+    c = cache.Cache(ttl=10)
+    c["a"] = 1
+
+    now[0] += 5
+
+    assert c["a"] == 1
+
+    c["b"] = 2
+
+    now[0] += 6
+
+    assert "a" not in c
+    assert c["b"] == 2
+
+    now[0] += 5
+
+    with pytest.raises(KeyError):
+        c["b"]
+
+    assert len(c) == 0
+
+
+def test_unhashable_key():
+    c = cache.Cache()
+
+    with pytest.raises(TypeError):
+        c[[1]]